@@ -14,9 +14,9 @@ if command -v uv &> /dev/null; then
 else
     echo "Using pip..."
     # Install test dependencies directly (avoiding editable mode issues with old pip)
-    python3 -m pip install --user pytest pytest-asyncio pytest-cov pytest-mock pytest-httpx freezegun || {
+    python3 -m pip install --user pytest pytest-asyncio pytest-cov pytest-mock pytest-httpx pytest-xdist freezegun || {
         echo "⚠️  Failed to install with --user, trying without..."
-        python3 -m pip install pytest pytest-asyncio pytest-cov pytest-mock pytest-httpx freezegun
+        python3 -m pip install pytest pytest-asyncio pytest-cov pytest-mock pytest-httpx pytest-xdist freezegun
     }
     # Install project dependencies needed for tests
     python3 -m pip install --user httpx python-dotenv || {
@@ -5,18 +5,43 @@ Manages background analysis jobs with status tracking and result storage.
 """
 
 import asyncio
-import json
+import contextlib
+import functools
+import heapq
+import logging
 import os
+import tempfile
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Coroutine
+from typing import Any, Callable, Coroutine, Protocol
+
+from ..utils.serialization import dumps_bytes, loads
+
+logger = logging.getLogger(__name__)
 
 # Default jobs directory
 JOBS_DIR = Path(__file__).parent.parent.parent.parent / "jobs"
 
+# Minimum seconds between status file writes for a running job.
+# Terminal states (complete/error) are always written immediately.
+STATUS_FLUSH_INTERVAL = 1.0
+TERMINAL_STATUSES = frozenset({"complete", "error"})
+
+# Process umask, read once at import, so atomically written files get the
+# same permissions a plain open() would give them
+_UMASK = os.umask(0)
+os.umask(_UMASK)
 
+
+@functools.lru_cache(maxsize=1)
 def get_jobs_dir() -> Path:
-    """Get the jobs directory, creating if needed."""
+    """Get the jobs directory, creating if needed.
+
+    The directory is resolved and created once and then cached; call
+    ``get_jobs_dir.cache_clear()`` to pick up a changed GONG_MCP_JOBS_DIR.
+    """
     jobs_dir = Path(os.getenv("GONG_MCP_JOBS_DIR", str(JOBS_DIR)))
     jobs_dir.mkdir(parents=True, exist_ok=True)
     return jobs_dir
@@ -57,11 +82,12 @@ def create_job(
     Returns:
         Initial job status dict
     """
+    now = datetime.now().isoformat()
     status = {
         "job_id": job_id,
         "status": "pending",
-        "created_at": datetime.now().isoformat(),
-        "updated_at": datetime.now().isoformat(),
+        "created_at": now,
+        "updated_at": now,
         "call_count": call_count,
         "estimated_batches": estimated_batches,
         "estimated_minutes": estimated_minutes,
@@ -77,21 +103,281 @@ def create_job(
     return status
 
 
-def save_job_status(job_id: str, status: dict) -> None:
-    """Save job status to file."""
-    status["updated_at"] = datetime.now().isoformat()
-    job_path = get_job_path(job_id)
-    with open(job_path, "w") as f:
-        json.dump(status, f, indent=2)
+def _write_json_atomic(path: Path, data: dict) -> None:
+    """
+    Write JSON to a temp file in the same directory, then rename over path.
+
+    Output is compact unless GONG_MCP_DEBUG is set, in which case it is
+    pretty-printed for easier inspection.
+    """
+    indent = bool(os.getenv("GONG_MCP_DEBUG"))
+    f = tempfile.NamedTemporaryFile(
+        "wb", dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp", delete=False
+    )
+    try:
+        with f:
+            f.write(dumps_bytes(data, indent=indent))
+        # Temp files are created 0600; give the job file the usual mode
+        os.chmod(f.name, 0o666 & ~_UMASK)
+        os.replace(f.name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(f.name)
+        raise
+
+
+class JobStore(Protocol):
+    """Storage backend for job status and results."""
+
+    def get(self, job_id: str) -> dict | None:
+        """Return a job's status, or None if the job does not exist."""
+
+    def put(self, job_id: str, status: dict, force: bool = False) -> None:
+        """Save a job's status, stamping updated_at."""
+
+    def update(self, job_id: str, changes: dict, force: bool = False) -> dict | None:
+        """Merge changes into an existing job's status and save it."""
+
+    def get_results(self, job_id: str) -> dict | None:
+        """Return a job's results, or None if they have not been saved."""
+
+    def put_results(self, job_id: str, results: dict) -> None:
+        """Save a job's results."""
+
+    def list_recent(self, limit: int) -> list[dict]:
+        """Return up to limit job statuses, most recently updated first."""
+
+    def flush(self) -> None:
+        """Persist any status changes still held only in memory."""
+
+
+class FileJobStore:
+    """
+    Job store backed by JSON files in the jobs directory.
+
+    The async job helpers call into the store from worker threads, so its
+    in-memory state is guarded by a lock, and statuses are copied on the
+    way in and out so callers never share the cached dicts.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Latest status per job, keyed by status file path, and when it was
+        # last written
+        self._status_cache: dict[Path, dict] = {}
+        self._last_flush: dict[Path, float] = {}
+        # File mtime (ns) the cached status corresponds to, and paths whose
+        # cached status has not been flushed yet (the cache is authoritative
+        # for those)
+        self._cached_mtime: dict[Path, int] = {}
+        self._dirty: set[Path] = set()
+        # Pending timer that writes coalesced statuses once the interval ends
+        self._flush_timer: threading.Timer | None = None
+
+    def get(self, job_id: str) -> dict | None:
+        """
+        Load job status, preferring the in-memory copy over the file.
+
+        The cached copy is returned while it has unflushed changes or while the
+        file's mtime still matches the last read or write; otherwise the file
+        is re-read, so changes made by another process are picked up.
+        """
+        with self._lock:
+            status = self._load(get_job_path(job_id))
+        return dict(status) if status is not None else None
+
+    def put(self, job_id: str, status: dict, force: bool = False) -> None:
+        """
+        Save job status, coalescing frequent writes.
+
+        The status is always cached in memory. It is written to disk on the
+        first save, when STATUS_FLUSH_INTERVAL has passed since the last write,
+        when the job reaches a terminal state, or when force is set.
+        """
+        status["updated_at"] = datetime.now().isoformat()
+        with self._lock:
+            self._store(get_job_path(job_id), dict(status), force)
+
+    def update(self, job_id: str, changes: dict, force: bool = False) -> dict | None:
+        """Merge changes into an existing job's status and save it."""
+        job_path = get_job_path(job_id)
+        # The lock is held across the read-modify-write so concurrent
+        # updates cannot drop each other's changes
+        with self._lock:
+            status = self._load(job_path)
+            if not status:
+                return None
+            status = {**status, **changes, "updated_at": datetime.now().isoformat()}
+            self._store(job_path, status, force)
+        return dict(status)
+
+    def _load(self, job_path: Path) -> dict | None:
+        """Return the cached status for a path, re-reading the file if stale."""
+        cached = self._status_cache.get(job_path)
+        if cached is not None and job_path in self._dirty:
+            return cached
+
+        try:
+            mtime = job_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._status_cache.pop(job_path, None)
+            self._cached_mtime.pop(job_path, None)
+            return None
+
+        if cached is not None and self._cached_mtime.get(job_path) == mtime:
+            return cached
+
+        with open(job_path, "rb") as f:
+            status = loads(f.read())
+        self._status_cache[job_path] = status
+        self._cached_mtime[job_path] = mtime
+        return status
+
+    def _store(self, job_path: Path, status: dict, force: bool) -> None:
+        """Cache a status the store owns and write it unless coalesced."""
+        self._status_cache[job_path] = status
+
+        now = time.monotonic()
+        last_flush = self._last_flush.get(job_path)
+        if (
+            force
+            or last_flush is None
+            or now - last_flush >= STATUS_FLUSH_INTERVAL
+            or status.get("status") in TERMINAL_STATUSES
+        ):
+            _write_json_atomic(job_path, status)
+            self._last_flush[job_path] = now
+            self._cached_mtime[job_path] = job_path.stat().st_mtime_ns
+            self._dirty.discard(job_path)
+        else:
+            self._dirty.add(job_path)
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Start a timer that flushes coalesced statuses, if none is pending."""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(STATUS_FLUSH_INTERVAL, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write every status that has changed since its last write."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            for job_path in list(self._dirty):
+                self._store(job_path, self._status_cache[job_path], force=True)
+
+    def get_results(self, job_id: str) -> dict | None:
+        """Read a job's results file, or return None if it does not exist."""
+        results_path = get_job_results_path(job_id)
+        if not results_path.exists():
+            return None
+        with open(results_path, "rb") as f:
+            return loads(f.read())
+
+    def put_results(self, job_id: str, results: dict) -> None:
+        """Write a job's results file."""
+        _write_json_atomic(get_job_results_path(job_id), results)
+
+    def list_recent(self, limit: int) -> list[dict]:
+        """
+        Read up to limit status files, most recently modified first.
+
+        Statuses with changes not yet flushed are taken from memory and
+        ranked as just modified, so listings match what get returns.
+        """
+        jobs_dir = get_jobs_dir()
+        with self._lock:
+            unflushed = {str(path): dict(self._status_cache[path]) for path in self._dirty}
+        now = time.time()
+
+        # One directory pass; DirEntry.stat() reuses metadata from the scan where possible
+        with os.scandir(jobs_dir) as it:
+            entries = [
+                (now if entry.path in unflushed else entry.stat().st_mtime, entry.path)
+                for entry in it
+                if entry.name.startswith("job_")
+                and entry.name.endswith(".json")
+                and not entry.name.endswith("_results.json")
+            ]
+
+        jobs = []
+        for _, path in heapq.nlargest(limit, entries):
+            if path in unflushed:
+                jobs.append(unflushed[path])
+                continue
+            with open(path, "rb") as f:
+                jobs.append(loads(f.read()))
+
+        return jobs
+
+
+class InMemoryJobStore:
+    """Job store that keeps status and results in process memory."""
+
+    def __init__(self):
+        self._statuses: dict[str, dict] = {}
+        self._results: dict[str, dict] = {}
+
+    def get(self, job_id: str) -> dict | None:
+        """Return a job's status, or None if the job does not exist."""
+        return self._statuses.get(job_id)
+
+    def put(self, job_id: str, status: dict, force: bool = False) -> None:
+        """Save a job's status, stamping updated_at."""
+        status["updated_at"] = datetime.now().isoformat()
+        self._statuses.pop(job_id, None)
+        self._statuses[job_id] = status
+
+    def update(self, job_id: str, changes: dict, force: bool = False) -> dict | None:
+        """Merge changes into an existing job's status and save it."""
+        status = self.get(job_id)
+        if not status:
+            return None
+        status.update(changes)
+        self.put(job_id, status, force=force)
+        return status
+
+    def get_results(self, job_id: str) -> dict | None:
+        """Return a job's results, or None if they have not been saved."""
+        return self._results.get(job_id)
+
+    def put_results(self, job_id: str, results: dict) -> None:
+        """Save a job's results."""
+        self._results[job_id] = results
+
+    def list_recent(self, limit: int) -> list[dict]:
+        """Return up to limit job statuses, most recently updated first."""
+        return list(reversed(self._statuses.values()))[:limit]
+
+    def flush(self) -> None:
+        """Nothing to persist; statuses live only in memory."""
+
+
+# Store used by the module-level job functions
+_default_store: JobStore = FileJobStore()
+
+
+def save_job_status(job_id: str, status: dict, force: bool = False) -> None:
+    """
+    Save job status to the job store.
+
+    With the default file store, writes for running jobs are coalesced
+    (see FileJobStore.put).
+
+    Args:
+        job_id: Job identifier
+        status: Job status dict
+        force: Write to disk regardless of the flush interval
+    """
+    _default_store.put(job_id, status, force=force)
 
 
 def load_job_status(job_id: str) -> dict | None:
-    """Load job status from file."""
-    job_path = get_job_path(job_id)
-    if not job_path.exists():
-        return None
-    with open(job_path) as f:
-        return json.load(f)
+    """Load job status from the job store, or None if the job does not exist."""
+    return _default_store.get(job_id)
 
 
 def update_job_progress(
@@ -111,13 +397,9 @@ def update_job_progress(
         message: Status message
         cost_so_far: Cumulative cost
     """
-    status = load_job_status(job_id)
-    if not status:
-        return
-
     progress = int((current_batch / total_batches) * 100) if total_batches > 0 else 0
 
-    status.update({
+    _default_store.update(job_id, {
         "status": "running",
         "current_batch": current_batch,
         "total_batches": total_batches,
@@ -126,8 +408,6 @@ def update_job_progress(
         "message": message or f"Processing batch {current_batch}/{total_batches}",
     })
 
-    save_job_status(job_id, status)
-
 
 def complete_job(job_id: str, results: dict, total_cost: float = 0.0) -> None:
     """
@@ -138,24 +418,18 @@ def complete_job(job_id: str, results: dict, total_cost: float = 0.0) -> None:
         results: Analysis results
         total_cost: Total cost of analysis
     """
-    status = load_job_status(job_id)
-    if not status:
-        return
-
-    status.update({
+    status = _default_store.update(job_id, {
         "status": "complete",
         "progress_percent": 100,
         "message": "Analysis complete!",
         "total_cost": total_cost,
         "completed_at": datetime.now().isoformat(),
-    })
-
-    save_job_status(job_id, status)
+    }, force=True)
+    if not status:
+        return
 
     # Save results separately
-    results_path = get_job_results_path(job_id)
-    with open(results_path, "w") as f:
-        json.dump(results, f, indent=2)
+    _default_store.put_results(job_id, results)
 
 
 def fail_job(job_id: str, error: str) -> None:
@@ -166,18 +440,49 @@ def fail_job(job_id: str, error: str) -> None:
         job_id: Job identifier
         error: Error message
     """
-    status = load_job_status(job_id)
-    if not status:
-        return
-
-    status.update({
+    _default_store.update(job_id, {
         "status": "error",
         "message": f"Analysis failed: {error}",
         "error": error,
         "failed_at": datetime.now().isoformat(),
-    })
+    }, force=True)
+
+
+# Async wrappers: run the blocking file I/O above in a worker thread so
+# callers inside the event loop (e.g. run_analysis) don't stall it.
 
-    save_job_status(job_id, status)
+
+async def a_save_job_status(job_id: str, status: dict, force: bool = False) -> None:
+    """Async variant of save_job_status."""
+    await asyncio.to_thread(save_job_status, job_id, status, force)
+
+
+async def a_load_job_status(job_id: str) -> dict | None:
+    """Async variant of load_job_status."""
+    return await asyncio.to_thread(load_job_status, job_id)
+
+
+async def a_update_job_progress(
+    job_id: str,
+    current_batch: int,
+    total_batches: int,
+    message: str = "",
+    cost_so_far: float = 0.0,
+) -> None:
+    """Async variant of update_job_progress."""
+    await asyncio.to_thread(
+        update_job_progress, job_id, current_batch, total_batches, message, cost_so_far
+    )
+
+
+async def a_complete_job(job_id: str, results: dict, total_cost: float = 0.0) -> None:
+    """Async variant of complete_job."""
+    await asyncio.to_thread(complete_job, job_id, results, total_cost)
+
+
+async def a_fail_job(job_id: str, error: str) -> None:
+    """Async variant of fail_job."""
+    await asyncio.to_thread(fail_job, job_id, error)
 
 
 def get_job_results(job_id: str) -> dict | None:
@@ -190,11 +495,7 @@ def get_job_results(job_id: str) -> dict | None:
     Returns:
         Results dict or None if not found/not complete
     """
-    results_path = get_job_results_path(job_id)
-    if not results_path.exists():
-        return None
-    with open(results_path) as f:
-        return json.load(f)
+    return _default_store.get_results(job_id)
 
 
 def list_jobs(limit: int = 20) -> list[dict]:
@@ -207,22 +508,12 @@ def list_jobs(limit: int = 20) -> list[dict]:
     Returns:
         List of job status dicts, most recent first
     """
-    jobs_dir = get_jobs_dir()
-    job_files = sorted(
-        jobs_dir.glob("job_*.json"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
-
-    # Filter out results files
-    job_files = [f for f in job_files if not f.name.endswith("_results.json")]
+    return _default_store.list_recent(limit)
 
-    jobs = []
-    for job_file in job_files[:limit]:
-        with open(job_file) as f:
-            jobs.append(json.load(f))
 
-    return jobs
+def flush_job_statuses() -> None:
+    """Write any coalesced job status changes to the job store."""
+    _default_store.flush()
 
 
 # Background task registry
@@ -240,18 +531,44 @@ def run_job_in_background(
         job_id: Job identifier
         coro: Coroutine to run
     """
-    async def wrapper():
-        try:
-            result = await coro
-            return result
-        except Exception as e:
-            fail_job(job_id, str(e))
-            raise
-        finally:
-            _background_tasks.pop(job_id, None)
-
-    task = asyncio.create_task(wrapper())
+    task = asyncio.create_task(coro, name=job_id)
     _background_tasks[job_id] = task
+    task.add_done_callback(_on_job_done)
+
+
+def _unregister_task(task: asyncio.Task) -> None:
+    """Drop a finished task from the registry if it is still the job's task."""
+    job_id = task.get_name()
+    if _background_tasks.get(job_id) is task:
+        del _background_tasks[job_id]
+
+
+def _on_job_done(task: asyncio.Task) -> None:
+    """Drop a finished job from the registry and record any failure."""
+    _unregister_task(task)
+
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is None:
+        return
+
+    job_id = task.get_name()
+    logger.error("Background job %s failed", job_id, exc_info=exc)
+
+    # Done callbacks run on the event loop, so the status write is scheduled
+    # as its own task; the job stays registered until it lands.
+    record = asyncio.create_task(_record_job_failure(job_id, str(exc)), name=job_id)
+    _background_tasks[job_id] = record
+    record.add_done_callback(_unregister_task)
+
+
+async def _record_job_failure(job_id: str, error: str) -> None:
+    """Persist a crashed job's failure, logging if the write itself fails."""
+    try:
+        await a_fail_job(job_id, error)
+    except Exception:
+        logger.exception("Could not record failure of job %s", job_id)
 
 
 def is_job_running(job_id: str) -> bool:
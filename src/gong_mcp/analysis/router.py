@@ -5,9 +5,12 @@ Decides whether to return transcripts directly (for inline Claude analysis)
 or start an async batch job (for large datasets).
 """
 
-import json
+import functools
 import os
 
+from ..utils.serialization import dumps_bytes
+from ..utils.sizing import annotate_sizes, estimate_size, total_size
+
 # Token thresholds - configurable via environment
 CLAUDE_CONTEXT_LIMIT = 180_000
 PROMPT_OVERHEAD = 10_000
@@ -18,6 +21,7 @@ RESPONSE_BUFFER = 20_000
 DEFAULT_DIRECT_LLM_TOKEN_LIMIT_K = 40  # 40K tokens - triggers async for larger datasets
 
 
+@functools.lru_cache(maxsize=1)
 def get_direct_threshold() -> int | float:
     """Get the token threshold for direct mode.
 
@@ -26,29 +30,40 @@ def get_direct_threshold() -> int | float:
 
     Values <= 0 mean always use direct mode (never use Anthropic API).
 
+    The environment is read once and cached; call
+    ``get_direct_threshold.cache_clear()`` to pick up changes.
+
     Returns:
         Token threshold, or float('inf') if always direct mode.
     """
-    # #region agent log
-    import json as _json; _log_path = "/Users/dannyzach/Documents/gong-mcp-server/.cursor/debug.log"
-    _raw_env = os.getenv("DIRECT_LLM_TOKEN_LIMIT") or os.getenv("GONG_TOKEN_LIMIT")
-    _all_env_keys = [k for k in os.environ.keys() if "DIRECT" in k or "LLM" in k or "GONG" in k or "ANTHROPIC" in k or "TOKEN" in k]
-    with open(_log_path, "a") as _f: _f.write(_json.dumps({"hypothesisId": "F", "location": "router.py:get_direct_threshold:entry", "message": "Raw env value", "data": {"raw_env": _raw_env, "related_env_keys": _all_env_keys, "default": DEFAULT_DIRECT_LLM_TOKEN_LIMIT_K}, "timestamp": __import__("time").time(), "sessionId": "debug-session"}) + "\n")
-    # #endregion
     try:
         # Check both env var names (GONG_TOKEN_LIMIT as fallback for Cursor compatibility)
-        limit_k = int(os.getenv("DIRECT_LLM_TOKEN_LIMIT") or os.getenv("GONG_TOKEN_LIMIT") or DEFAULT_DIRECT_LLM_TOKEN_LIMIT_K)
-        # #region agent log
-        with open(_log_path, "a") as _f: _f.write(_json.dumps({"hypothesisId": "C", "location": "router.py:get_direct_threshold:parsed", "message": "Parsed limit_k", "data": {"limit_k": limit_k, "threshold": limit_k * 1000 if limit_k > 0 else "inf"}, "timestamp": __import__("time").time(), "sessionId": "debug-session"}) + "\n")
-        # #endregion
-        if limit_k <= 0:
-            return float("inf")  # Always direct mode
-        return limit_k * 1000
-    except ValueError as e:
-        # #region agent log
-        with open(_log_path, "a") as _f: _f.write(_json.dumps({"hypothesisId": "C", "location": "router.py:get_direct_threshold:error", "message": "ValueError parsing", "data": {"error": str(e)}, "timestamp": __import__("time").time(), "sessionId": "debug-session"}) + "\n")
-        # #endregion
+        limit_k = int(
+            os.getenv("DIRECT_LLM_TOKEN_LIMIT")
+            or os.getenv("GONG_TOKEN_LIMIT")
+            or DEFAULT_DIRECT_LLM_TOKEN_LIMIT_K
+        )
+    except ValueError:
         return DEFAULT_DIRECT_LLM_TOKEN_LIMIT_K * 1000
+    if limit_k <= 0:
+        return float("inf")  # Always direct mode
+    return limit_k * 1000
+
+
+def estimate_tokens_from_bytes(n_bytes: int) -> int:
+    """
+    Estimate token count from a serialized size.
+
+    Uses ~4 characters per token approximation, so callers that already
+    know a size (e.g. from utils.sizing) need not build or measure a string.
+
+    Args:
+        n_bytes: Serialized length in bytes or characters
+
+    Returns:
+        Estimated token count
+    """
+    return n_bytes // 4
 
 
 def estimate_tokens(text: str) -> int:
@@ -64,21 +79,24 @@ def estimate_tokens(text: str) -> int:
     Returns:
         Estimated token count
     """
-    return len(text) // 4
+    return estimate_tokens_from_bytes(len(text))
 
 
-def estimate_transcripts_tokens(transcripts: list[dict]) -> int:
+def estimate_transcripts_tokens(transcripts: list[dict], exact: bool = False) -> int:
     """
     Estimate total tokens for a list of transcripts.
 
     Args:
         transcripts: List of transcript dicts
+        exact: Measure the real JSON encoding instead of walking the objects
+            (slower; kept for parity checks)
 
     Returns:
         Estimated total token count
     """
-    total_text = json.dumps(transcripts, ensure_ascii=False)
-    return estimate_tokens(total_text)
+    if exact:
+        return estimate_tokens_from_bytes(len(dumps_bytes(transcripts)))
+    return estimate_tokens_from_bytes(estimate_size(transcripts))
 
 
 def should_use_direct_mode(transcripts: list[dict]) -> bool:
@@ -127,12 +145,21 @@ def estimate_processing_time(batch_count: int, seconds_per_batch: int = 65) -> i
     return max(1, total_seconds // 60)
 
 
-def get_routing_decision(transcripts: list[dict]) -> dict:
+def get_routing_decision(
+    transcripts: list[dict],
+    sized_transcripts: list[tuple[dict, int]] | None = None,
+) -> dict:
     """
     Get a complete routing decision with metadata.
 
+    Each transcript is sized once; the annotated list is returned so the
+    async path can batch it without re-measuring.
+
     Args:
         transcripts: List of transcript dicts
+        sized_transcripts: Optional (transcript, size) pairs for the same
+            transcripts, e.g. from build_transcript_json_with_size; when
+            given, transcripts are not walked again
 
     Returns:
         Dict with routing decision and metadata:
@@ -143,11 +170,14 @@ def get_routing_decision(transcripts: list[dict]) -> dict:
             "threshold": int,
             "estimated_batches": int (only for async),
             "estimated_minutes": int (only for async),
-            "reason": str
+            "reason": str,
+            "sized_transcripts": list[tuple[dict, int]]
         }
     """
     call_count = len(transcripts)
-    total_tokens = estimate_transcripts_tokens(transcripts)
+    if sized_transcripts is None:
+        sized_transcripts = annotate_sizes(transcripts)
+    total_tokens = estimate_tokens_from_bytes(total_size(sized_transcripts))
     threshold = get_direct_threshold()
 
     if total_tokens < threshold:
@@ -165,6 +195,7 @@ def get_routing_decision(transcripts: list[dict]) -> dict:
             "total_tokens": total_tokens,
             "threshold": threshold_display,
             "reason": reason,
+            "sized_transcripts": sized_transcripts,
         }
 
     batch_count = estimate_batch_count(total_tokens)
@@ -178,4 +209,5 @@ def get_routing_decision(transcripts: list[dict]) -> dict:
         "estimated_batches": batch_count,
         "estimated_minutes": estimated_minutes,
         "reason": f"Tokens ({total_tokens:,}) exceed threshold ({threshold:,})",
+        "sized_transcripts": sized_transcripts,
     }
@@ -5,14 +5,17 @@ Batch processing logic for analyzing transcripts with Claude API.
 Ported from GongWebApp analysis_runner.py with adaptations for MCP.
 """
 
-import json
+import asyncio
 import os
 import time
 from typing import Any
 
 import httpx
 
-from .jobs import complete_job, fail_job, update_job_progress
+from ..utils.serialization import dumps_bytes, loads
+from ..utils.sizing import annotate_sizes
+from .jobs import a_complete_job, a_fail_job, a_update_job_progress
+from .router import estimate_tokens_from_bytes
 
 # Configuration
 CLAUDE_API_URL = "https://api.anthropic.com/v1/messages"
@@ -21,15 +24,122 @@ MAX_TOKENS = 16000
 BATCH_SIZE = 20
 RATE_LIMIT_DELAY = 65  # Seconds between batches (Tier 1 rate limit)
 MAX_TOKENS_PER_BATCH = 24000
+DEFAULT_RATE_LIMIT_RPM = 60 / RATE_LIMIT_DELAY
+# At the default rate a batch uses most of the Tier 1 input-tokens-per-minute
+# budget, so batches only overlap once RATE_LIMIT_RPM is raised or disabled
+DEFAULT_MAX_CONCURRENT_BATCHES = 1
+RAISED_RATE_MAX_CONCURRENT_BATCHES = 3
+
+# Shared Anthropic client, created lazily so every batch reuses its
+# connection pool instead of opening a new TLS connection.
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the shared Anthropic API client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(180.0, connect=10.0),
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+            headers={
+                "Content-Type": "application/json",
+                "anthropic-version": "2023-06-01",
+            },
+        )
+    return _client
+
+
+def build_request_body(batch: list[dict], prompt: str) -> bytes:
+    """
+    Build the encoded Claude API request body for a batch.
+
+    Args:
+        batch: List of transcript dicts
+        prompt: Analysis prompt
+
+    Returns:
+        UTF-8 encoded JSON request body
+    """
+    # Compact encoding: pretty-printing only inflates the request body
+    batch_json = dumps_bytes(batch).decode("utf-8")
+    full_prompt = f"{prompt}\n\nTranscripts to analyze:\n{batch_json}"
+    return dumps_bytes({
+        "model": CLAUDE_MODEL,
+        "max_tokens": MAX_TOKENS,
+        "messages": [{"role": "user", "content": full_prompt}],
+    })
+
+
+async def close_client() -> None:
+    """Close the shared Anthropic API client if it was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_rate_limit_rpm() -> float:
+    """
+    Get the maximum number of batch requests started per minute.
+
+    Reads RATE_LIMIT_RPM from environment; defaults to one batch every
+    RATE_LIMIT_DELAY seconds. Values <= 0 disable rate limiting.
+    """
+    try:
+        return float(os.getenv("RATE_LIMIT_RPM", DEFAULT_RATE_LIMIT_RPM))
+    except ValueError:
+        return DEFAULT_RATE_LIMIT_RPM
+
+
+def get_max_concurrent_batches() -> int:
+    """
+    Get the maximum number of batches in flight at once.
+
+    Reads ANALYSIS_MAX_CONCURRENCY from environment (minimum 1). When it is
+    unset, batches run one at a time at the default rate limit and up to
+    RAISED_RATE_MAX_CONCURRENT_BATCHES at once when RATE_LIMIT_RPM is
+    raised or disabled.
+    """
+    rpm = get_rate_limit_rpm()
+    default = (
+        RAISED_RATE_MAX_CONCURRENT_BATCHES
+        if rpm <= 0 or rpm > DEFAULT_RATE_LIMIT_RPM
+        else DEFAULT_MAX_CONCURRENT_BATCHES
+    )
+    try:
+        value = int(os.getenv("ANALYSIS_MAX_CONCURRENCY", default))
+    except ValueError:
+        return default
+    return max(1, value)
+
+
+class RateLimiter:
+    """Spaces out request starts so no more than `rpm` begin per minute."""
+
+    def __init__(self, rpm: float):
+        self.interval = 60.0 / rpm if rpm > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until the next request slot is available."""
+        async with self._lock:
+            now = time.monotonic()
+            if self._next_start > now:
+                await asyncio.sleep(self._next_start - now)
+                now = self._next_start
+            self._next_start = now + self.interval
 
 
 def estimate_tokens(text: str) -> int:
     """Estimate token count (~4 chars per token)."""
-    return len(text) // 4
+    return estimate_tokens_from_bytes(len(text))
 
 
 def create_batches(
-    transcripts: list[dict],
+    sized_transcripts: list[tuple[dict, int]],
     batch_size: int = BATCH_SIZE,
     max_tokens_per_batch: int = MAX_TOKENS_PER_BATCH,
 ) -> list[list[dict]]:
@@ -37,7 +147,8 @@ def create_batches(
     Split transcripts into batches respecting token limits.
 
     Args:
-        transcripts: List of transcript dicts
+        sized_transcripts: (transcript, estimated JSON size) pairs, as
+            produced by utils.sizing.annotate_sizes
         batch_size: Max calls per batch
         max_tokens_per_batch: Max tokens per batch
 
@@ -52,9 +163,8 @@ def create_batches(
     prompt_overhead = 3500  # Approximate prompt size
     safe_limit = int(max_tokens_per_batch * 0.9) - prompt_overhead
 
-    for transcript in transcripts:
-        transcript_json = json.dumps(transcript, ensure_ascii=False)
-        transcript_tokens = estimate_tokens(transcript_json)
+    for transcript, size in sized_transcripts:
+        transcript_tokens = estimate_tokens_from_bytes(size)
 
         # Check if we need to start a new batch
         would_exceed_size = len(current_batch) >= batch_size
@@ -75,12 +185,35 @@ def create_batches(
     return batches
 
 
+def create_batches_raw(
+    transcripts: list[dict],
+    batch_size: int = BATCH_SIZE,
+    max_tokens_per_batch: int = MAX_TOKENS_PER_BATCH,
+) -> list[list[dict]]:
+    """
+    Split un-annotated transcripts into batches.
+
+    Sizes each transcript with the object-walking estimator rather than
+    serializing it, then defers to create_batches.
+
+    Args:
+        transcripts: List of transcript dicts
+        batch_size: Max calls per batch
+        max_tokens_per_batch: Max tokens per batch
+
+    Returns:
+        List of batches (each batch is a list of transcripts)
+    """
+    return create_batches(annotate_sizes(transcripts), batch_size, max_tokens_per_batch)
+
+
 async def call_claude_api(
     batch: list[dict],
     prompt: str,
     batch_num: int,
     total_batches: int,
     max_retries: int = 3,
+    body: bytes | None = None,
 ) -> tuple[str, dict]:
     """
     Send a batch to Claude API for analysis.
@@ -91,6 +224,8 @@ async def call_claude_api(
         batch_num: Current batch number
         total_batches: Total number of batches
         max_retries: Max retry attempts
+        body: Request body already built with build_request_body; skips
+            encoding here
 
     Returns:
         Tuple of (response_text, stats)
@@ -99,91 +234,77 @@ async def call_claude_api(
     if not api_key:
         raise ValueError("ANTHROPIC_API_KEY not configured")
 
-    # Prepare content
-    batch_json = json.dumps(batch, indent=2, ensure_ascii=False)
-    full_prompt = f"{prompt}\n\nTranscripts to analyze:\n{batch_json}"
-    estimated_tokens = estimate_tokens(full_prompt)
-
-    # Prepare request
-    payload = {
-        "model": CLAUDE_MODEL,
-        "max_tokens": MAX_TOKENS,
-        "messages": [{"role": "user", "content": full_prompt}],
-    }
+    # Request body is encoded once up front and reused across retries
+    if body is None:
+        body = build_request_body(batch, prompt)
+    estimated_tokens = estimate_tokens_from_bytes(len(body))
 
     last_error = None
 
-    async with httpx.AsyncClient(timeout=180.0) as client:
-        for attempt in range(1, max_retries + 1):
-            try:
-                response = await client.post(
-                    CLAUDE_API_URL,
-                    headers={
-                        "Content-Type": "application/json",
-                        "x-api-key": api_key,
-                        "anthropic-version": "2023-06-01",
-                    },
-                    json=payload,
-                )
+    client = _get_client()
+
+    for attempt in range(1, max_retries + 1):
+        try:
+            response = await client.post(
+                CLAUDE_API_URL,
+                headers={"x-api-key": api_key},
+                content=body,
+            )
 
-                # Handle rate limits
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get("retry-after", 60))
-                    await asyncio.sleep(retry_after)
-                    continue
-
-                # Handle overloaded
-                if response.status_code == 529:
-                    wait_time = min(30 * attempt, 120)
-                    await asyncio.sleep(wait_time)
-                    continue
-
-                response.raise_for_status()
-
-                data = response.json()
-                response_text = data["content"][0]["text"]
-
-                # Calculate stats
-                usage = data.get("usage", {})
-                input_tokens = usage.get("input_tokens", estimated_tokens)
-                output_tokens = usage.get("output_tokens", 0)
-
-                # Claude Sonnet pricing
-                input_cost = (input_tokens / 1_000_000) * 3.0
-                output_cost = (output_tokens / 1_000_000) * 15.0
-
-                stats = {
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                    "cost": input_cost + output_cost,
-                    "batch_num": batch_num,
-                    "calls_count": len(batch),
-                }
-
-                return response_text, stats
-
-            except httpx.TimeoutException:
-                last_error = "Request timeout"
-                if attempt < max_retries:
-                    await asyncio.sleep(15 * attempt)
+            # Handle rate limits
+            if response.status_code == 429:
+                retry_after = int(response.headers.get("retry-after", 60))
+                await asyncio.sleep(retry_after)
                 continue
 
-            except Exception as e:
-                last_error = str(e)
-                if attempt < max_retries:
-                    await asyncio.sleep(10 * attempt)
+            # Handle overloaded
+            if response.status_code == 529:
+                wait_time = min(30 * attempt, 120)
+                await asyncio.sleep(wait_time)
                 continue
 
-    raise RuntimeError(f"Failed after {max_retries} attempts: {last_error}")
+            response.raise_for_status()
 
+            data = loads(response.content)
+            response_text = data["content"][0]["text"]
 
-# Need to import asyncio for sleep
-import asyncio
+            # Calculate stats
+            usage = data.get("usage", {})
+            input_tokens = usage.get("input_tokens", estimated_tokens)
+            output_tokens = usage.get("output_tokens", 0)
+
+            # Claude Sonnet pricing
+            input_cost = (input_tokens / 1_000_000) * 3.0
+            output_cost = (output_tokens / 1_000_000) * 15.0
+
+            stats = {
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cost": input_cost + output_cost,
+                "batch_num": batch_num,
+                "calls_count": len(batch),
+            }
+
+            return response_text, stats
+
+        except httpx.TimeoutException:
+            last_error = "Request timeout"
+            if attempt < max_retries:
+                await asyncio.sleep(15 * attempt)
+            continue
+
+        except Exception as e:
+            last_error = str(e)
+            if attempt < max_retries:
+                await asyncio.sleep(10 * attempt)
+            continue
+
+    raise RuntimeError(f"Failed after {max_retries} attempts: {last_error}")
 
 
 async def run_analysis(
     job_id: str,
-    transcripts: list[dict],
+    sized_transcripts: list[tuple[dict, int]],
     prompt: str,
 ) -> dict:
     """
@@ -191,7 +312,8 @@ async def run_analysis(
 
     Args:
         job_id: Job identifier for progress updates
-        transcripts: List of transcript dicts
+        sized_transcripts: (transcript, estimated JSON size) pairs from
+            the routing decision
         prompt: Analysis prompt
 
     Returns:
@@ -199,65 +321,82 @@ async def run_analysis(
     """
     try:
         # Create batches
-        batches = create_batches(transcripts)
+        batches = create_batches(sized_transcripts)
         total_batches = len(batches)
 
-        update_job_progress(
+        await a_update_job_progress(
             job_id,
             current_batch=0,
             total_batches=total_batches,
             message=f"Created {total_batches} batches, starting analysis...",
         )
 
-        # Process batches
-        all_results = []
+        # Process batches concurrently; the semaphore bounds requests in
+        # flight and the rate limiter spaces out their start times.
+        limiter = RateLimiter(get_rate_limit_rpm())
+        semaphore = asyncio.Semaphore(get_max_concurrent_batches())
+        progress_lock = asyncio.Lock()
+        completed = 0
         total_cost = 0.0
 
-        for i, batch in enumerate(batches, 1):
-            update_job_progress(
-                job_id,
-                current_batch=i,
-                total_batches=total_batches,
-                message=f"Processing batch {i}/{total_batches}",
-                cost_so_far=total_cost,
-            )
-
-            result_text, stats = await call_claude_api(
-                batch, prompt, i, total_batches
-            )
-
-            all_results.append({
-                "batch_num": i,
-                "calls_count": stats["calls_count"],
-                "analysis": result_text,
-            })
-
-            total_cost += stats["cost"]
+        async def process_batch(batch_num: int, batch: list[dict]) -> dict:
+            nonlocal completed, total_cost
+
+            async with semaphore:
+                # Build the request body before waiting for a rate-limit
+                # slot, so the encode overlaps the wait instead of adding to it
+                body = build_request_body(batch, prompt)
+                await limiter.acquire()
+                result_text, stats = await call_claude_api(
+                    batch,
+                    prompt,
+                    batch_num,
+                    total_batches,
+                    body=body,
+                )
 
-            # Rate limit delay (except for last batch)
-            if i < total_batches:
-                update_job_progress(
+            async with progress_lock:
+                completed += 1
+                total_cost += stats["cost"]
+                await a_update_job_progress(
                     job_id,
-                    current_batch=i,
+                    current_batch=completed,
                     total_batches=total_batches,
-                    message=f"Waiting {RATE_LIMIT_DELAY}s for rate limit...",
+                    message=f"Completed batch {batch_num} ({completed}/{total_batches} done)",
                     cost_so_far=total_cost,
                 )
-                await asyncio.sleep(RATE_LIMIT_DELAY)
+
+            return {
+                "batch_num": batch_num,
+                "calls_count": stats["calls_count"],
+                "analysis": result_text,
+            }
+
+        tasks = [
+            asyncio.create_task(process_batch(i, batch))
+            for i, batch in enumerate(batches, 1)
+        ]
+        try:
+            # gather preserves batch order in the results
+            all_results = await asyncio.gather(*tasks)
+        except Exception:
+            for task in tasks:
+                task.cancel()
+            raise
 
         # Build final results
         results = {
             "job_id": job_id,
-            "total_calls": len(transcripts),
+            "total_calls": len(sized_transcripts),
             "total_batches": total_batches,
             "total_cost": total_cost,
             "prompt_used": prompt,
             "batch_results": all_results,
         }
 
-        complete_job(job_id, results, total_cost)
+        await a_complete_job(job_id, results, total_cost)
         return results
 
     except Exception as e:
-        fail_job(job_id, str(e))
+        await a_fail_job(job_id, str(e))
         raise
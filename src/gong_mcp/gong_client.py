@@ -5,11 +5,96 @@ Async client for Gong API v2 with email/participant filtering support.
 Adapted from GongWebApp with cross-MCP synthesis enhancements.
 """
 
+import asyncio
+import contextlib
+import functools
+import heapq
+import itertools
 import os
-from typing import Optional
+import random
+from operator import itemgetter
+from typing import AsyncIterator, Optional
 
 import httpx
 
+try:
+    import ijson
+except ImportError:  # pragma: no cover - exercised only without ijson
+    ijson = None
+
+from .utils.cache import TTLCache
+from .utils.formatters import format_participants
+from .utils.serialization import loads
+
+# Gong API endpoints, built once at import
+GONG_API_BASE_URL = "https://api.gong.io/v2"
+CALLS_EXTENSIVE_URL = f"{GONG_API_BASE_URL}/calls/extensive"
+CALLS_TRANSCRIPT_URL = f"{GONG_API_BASE_URL}/calls/transcript"
+
+# Transcript requests are split into chunks of call IDs fetched concurrently
+TRANSCRIPT_CHUNK_SIZE = 25
+TRANSCRIPT_FETCH_CONCURRENCY = 8
+
+# Transient failures (429 and 5xx) are retried with exponential backoff,
+# honoring Retry-After when Gong sends it
+MAX_RETRIES = 5
+MAX_RETRY_DELAY = 30.0
+
+# Response caches: call listings can change, finished transcripts do not.
+# Both are bounded by estimated JSON size as well as entry count, and their
+# values are shared between callers, so results must not be mutated.
+CALLS_CACHE_TTL = 300
+TRANSCRIPT_CACHE_TTL = 3600
+CALLS_CACHE_MAX_BYTES = 32 * 1024 * 1024
+TRANSCRIPT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_calls_cache = TTLCache(maxsize=256, max_bytes=CALLS_CACHE_MAX_BYTES)
+_transcript_cache = TTLCache(maxsize=512, max_bytes=TRANSCRIPT_CACHE_MAX_BYTES)
+
+# Shared HTTP client so every GongClient reuses one connection pool.
+# Credentials are passed per request, not baked into the client.
+_shared_client: httpx.AsyncClient | None = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get the shared Gong HTTP client, creating it on first use."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        # HTTP/2 lets concurrent transcript requests share one connection
+        _shared_client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32,
+                keepalive_expiry=60,
+            ),
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared Gong HTTP client if it was created."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+@functools.lru_cache(maxsize=1)
+def get_gong_credentials() -> tuple[str, str]:
+    """
+    Get the Gong API credentials from the environment.
+
+    The environment is read once and cached; call
+    ``get_gong_credentials.cache_clear()`` to pick up changes.
+
+    Returns:
+        Tuple of (access_key, access_key_secret); either may be empty.
+    """
+    access_key = (os.getenv("GONG_ACCESS_KEY") or "").strip()
+    secret = (os.getenv("GONG_ACCESS_KEY_SECRET") or "").strip()
+    return access_key, secret
+
 
 def check_gong_config() -> dict | None:
     """
@@ -21,8 +106,7 @@ def check_gong_config() -> dict | None:
     Returns:
         Dict with "error" key and message if config is invalid, else None.
     """
-    access_key = (os.getenv("GONG_ACCESS_KEY") or "").strip()
-    secret = (os.getenv("GONG_ACCESS_KEY_SECRET") or "").strip()
+    access_key, secret = get_gong_credentials()
     if not access_key or not secret:
         missing = []
         if not access_key:
@@ -38,29 +122,64 @@ def check_gong_config() -> dict | None:
     return None
 
 
+def _retry_delay(response: httpx.Response, attempt: int, max_retries: int) -> float | None:
+    """
+    Get how long to wait before retrying a Gong API response.
+
+    Args:
+        response: Response from the attempt
+        attempt: Zero-based attempt number
+        max_retries: Retries allowed after the first attempt
+
+    Returns:
+        Seconds to sleep, or None if the response should not be retried
+    """
+    status = response.status_code
+    if attempt >= max_retries or not (status == 429 or status >= 500):
+        return None
+    delay = 2**attempt + random.random() * 0.2
+    if status == 429:
+        try:
+            delay = float(response.headers.get("Retry-After", delay))
+        except ValueError:
+            pass
+    return min(max(delay, 0.0), MAX_RETRY_DELAY)
+
+
+def _call_started(call: dict) -> str:
+    """Get a call's start timestamp for sorting ("" if missing)."""
+    return call.get("metaData", {}).get("started", "")
+
+
 class GongClient:
-    """Async client for Gong API v2."""
+    """
+    Async client for Gong API v2.
+
+    Requests go through the process-wide shared HTTP client unless an
+    http_client is injected; either way the connection pool is owned
+    elsewhere and left open on exit.
+    """
 
     def __init__(
         self,
         access_key: str | None = None,
         access_key_secret: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ):
-        self.access_key = access_key or os.getenv("GONG_ACCESS_KEY", "")
-        self.access_key_secret = access_key_secret or os.getenv("GONG_ACCESS_KEY_SECRET", "")
-        self.base_url = "https://api.gong.io/v2"
+        env_key, env_secret = get_gong_credentials()
+        self.access_key = access_key or env_key
+        self.access_key_secret = access_key_secret or env_secret
+        self.base_url = GONG_API_BASE_URL
+        self._http_client = http_client
         self._client: httpx.AsyncClient | None = None
 
     async def __aenter__(self):
-        self._client = httpx.AsyncClient(
-            auth=(self.access_key, self.access_key_secret),
-            timeout=60.0,
-        )
+        self._client = self._http_client or get_shared_client()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._client:
-            await self._client.aclose()
+        # The HTTP client stays open for reuse; it is closed by its owner
+        self._client = None
 
     @property
     def client(self) -> httpx.AsyncClient:
@@ -68,6 +187,68 @@ class GongClient:
             raise RuntimeError("Client not initialized. Use 'async with GongClient()' context.")
         return self._client
 
+    async def _post(
+        self, url: str, data: dict, max_retries: int = MAX_RETRIES
+    ) -> httpx.Response:
+        """
+        POST JSON to the Gong API with this client's credentials.
+
+        Rate-limited (429) and server error (5xx) responses are retried up
+        to max_retries times before the error is raised.
+
+        Args:
+            url: Gong API URL
+            data: JSON request body
+            max_retries: Retries allowed after the first attempt
+
+        Returns:
+            Successful HTTP response
+        """
+        for attempt in range(max_retries + 1):
+            response = await self.client.post(
+                url,
+                json=data,
+                auth=(self.access_key, self.access_key_secret),
+            )
+            delay = _retry_delay(response, attempt, max_retries)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+        response.raise_for_status()
+        return response
+
+    @contextlib.asynccontextmanager
+    async def _stream_post(
+        self, url: str, data: dict, max_retries: int = MAX_RETRIES
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Stream a JSON POST to the Gong API, retrying like _post.
+
+        Retries happen before the body is read, so callers only ever see
+        the successful response.
+
+        Args:
+            url: Gong API URL
+            data: JSON request body
+            max_retries: Retries allowed after the first attempt
+
+        Yields:
+            Successful streaming HTTP response
+        """
+        for attempt in range(max_retries + 1):
+            async with self.client.stream(
+                "POST",
+                url,
+                json=data,
+                auth=(self.access_key, self.access_key_secret),
+            ) as response:
+                delay = _retry_delay(response, attempt, max_retries)
+                if delay is None:
+                    response.raise_for_status()
+                    yield response
+                    return
+            await asyncio.sleep(delay)
+
     async def search_calls(
         self,
         from_date: str,
@@ -85,7 +266,7 @@ class GongClient:
         Returns:
             API response with calls and pagination info
         """
-        url = f"{self.base_url}/calls/extensive"
+        url = CALLS_EXTENSIVE_URL
 
         data = {
             "filter": {
@@ -103,9 +284,56 @@ class GongClient:
         if cursor:
             data["cursor"] = cursor
 
-        response = await self.client.post(url, json=data)
-        response.raise_for_status()
-        return response.json()
+        async def fetch() -> dict:
+            response = await self._post(url, data)
+            return loads(response.content)
+
+        key = f"calls:{self.access_key}:{from_date}:{to_date}:{cursor or ''}"
+        return await _calls_cache.get_or_fetch(key, fetch, CALLS_CACHE_TTL)
+
+    async def get_calls_by_ids(self, call_ids: list[str], max_pages: int = 20) -> list[dict]:
+        """
+        Fetch specific calls, with parties, by ID.
+
+        Uses the callIds filter of the extensive calls endpoint instead of
+        listing a date range, so only the requested calls are transferred.
+
+        Args:
+            call_ids: List of Gong call IDs
+            max_pages: Safety limit for pagination
+
+        Returns:
+            List of calls found (IDs Gong does not know are left out)
+        """
+        url = CALLS_EXTENSIVE_URL
+
+        data = {
+            "filter": {"callIds": list(dict.fromkeys(call_ids))},
+            "contentSelector": {
+                "exposedFields": {
+                    "parties": True,
+                }
+            },
+        }
+
+        calls: list[dict] = []
+        for _ in range(max_pages):
+            try:
+                response = await self._post(url, data)
+            except httpx.HTTPStatusError as e:
+                # Gong answers 404 when no call matches the filter
+                if e.response.status_code == 404:
+                    break
+                raise
+            result = loads(response.content)
+            calls.extend(result.get("calls", []))
+
+            cursor = result.get("records", {}).get("cursor")
+            if not cursor:
+                break
+            data["cursor"] = cursor
+
+        return calls
 
     async def get_all_calls(
         self,
@@ -124,32 +352,47 @@ class GongClient:
         Returns:
             List of all calls in the date range
         """
-        all_calls = []
-        cursor = None
+        # Each page as (started, call) pairs sorted most recent first; keys
+        # are extracted and pages sorted while the next page is in flight
+        pages: list[list[tuple[str, dict]]] = []
+        if max_pages < 1:
+            return []
 
-        for _ in range(max_pages):
-            response = await self.search_calls(from_date, to_date, cursor)
+        next_page = asyncio.create_task(self.search_calls(from_date, to_date))
+
+        for page in range(1, max_pages + 1):
+            response = await next_page
+            next_page = None
             calls = response.get("calls", [])
 
             if not calls:
                 break
 
-            all_calls.extend(calls)
-
             records = response.get("records", {})
             cursor = records.get("cursor")
             current_page_size = records.get("currentPageSize", len(calls))
+            has_more = bool(cursor) and current_page_size != 0 and page < max_pages
 
-            if not cursor or current_page_size == 0:
-                break
+            # Request the next page before processing this one so the
+            # network round trip overlaps with local work
+            if has_more:
+                next_page = asyncio.create_task(
+                    self.search_calls(from_date, to_date, cursor)
+                )
 
-        # Sort by date descending (most recent first)
-        all_calls.sort(
-            key=lambda x: x.get("metaData", {}).get("started", ""),
-            reverse=True,
-        )
+            keyed_page = [(_call_started(call), call) for call in calls]
+            keyed_page.sort(key=itemgetter(0), reverse=True)
+            pages.append(keyed_page)
+
+            if not has_more:
+                break
 
-        return all_calls
+        # Merge the sorted pages by date descending (most recent first);
+        # merge is stable, so ties keep API order as a full sort would
+        return [
+            call
+            for _, call in heapq.merge(*pages, key=itemgetter(0), reverse=True)
+        ]
 
     async def get_call_transcript(self, call_id: str) -> dict:
         """
@@ -161,20 +404,64 @@ class GongClient:
         Returns:
             Transcript data or error dict
         """
-        url = f"{self.base_url}/calls/transcript"
+        url = CALLS_TRANSCRIPT_URL
 
         data = {"filter": {"callIds": [call_id]}}
 
-        response = await self.client.post(url, json=data)
-        response.raise_for_status()
-        result = response.json()
+        async def fetch() -> dict:
+            response = await self._post(url, data)
+            result = loads(response.content)
+
+            if "callTranscripts" in result:
+                transcripts = result["callTranscripts"]
+                if transcripts and len(transcripts) > 0:
+                    return transcripts[0]
+                return {"error": "No transcript found"}
+            return {"error": "Unexpected response format"}
+
+        # Only real transcripts are cached; a missing one may appear later
+        return await _transcript_cache.get_or_fetch(
+            f"tx:{self.access_key}:{call_id}",
+            fetch,
+            TRANSCRIPT_CACHE_TTL,
+            should_cache=lambda transcript: "error" not in transcript,
+        )
 
-        if "callTranscripts" in result:
-            transcripts = result["callTranscripts"]
-            if transcripts and len(transcripts) > 0:
-                return transcripts[0]
-            return {"error": "No transcript found"}
-        return {"error": "Unexpected response format"}
+    async def iter_multiple_transcripts(self, call_ids: list[str]) -> AsyncIterator[dict]:
+        """
+        Yield transcripts for multiple calls as they are parsed.
+
+        When ijson is installed the response is streamed and parsed
+        incrementally, so the raw body and the full decoded tree are never
+        held at once. Otherwise the body is read and decoded in one go.
+
+        Args:
+            call_ids: List of Gong call IDs
+
+        Yields:
+            Transcript data, one call at a time
+        """
+        url = CALLS_TRANSCRIPT_URL
+
+        data = {"filter": {"callIds": call_ids}}
+
+        if ijson is None:
+            response = await self._post(url, data)
+            for transcript in loads(response.content).get("callTranscripts", []):
+                yield transcript
+            return
+
+        async with self._stream_post(url, data) as response:
+            parsed = ijson.sendable_list()
+            parser = ijson.items_coro(parsed, "callTranscripts.item", use_float=True)
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                for transcript in parsed:
+                    yield transcript
+                del parsed[:]
+            parser.close()
+            for transcript in parsed:
+                yield transcript
 
     async def get_multiple_transcripts(self, call_ids: list[str]) -> list[dict]:
         """
@@ -186,15 +473,37 @@ class GongClient:
         Returns:
             List of transcript data
         """
-        url = f"{self.base_url}/calls/transcript"
+        return [transcript async for transcript in self.iter_multiple_transcripts(call_ids)]
 
-        data = {"filter": {"callIds": call_ids}}
+    async def get_multiple_transcripts_chunked(
+        self,
+        call_ids: list[str],
+        chunk_size: int = TRANSCRIPT_CHUNK_SIZE,
+        concurrency: int = TRANSCRIPT_FETCH_CONCURRENCY,
+    ) -> list[dict]:
+        """
+        Get transcripts for many calls using concurrent chunked requests.
 
-        response = await self.client.post(url, json=data)
-        response.raise_for_status()
-        result = response.json()
+        Args:
+            call_ids: List of Gong call IDs
+            chunk_size: Max call IDs per request
+            concurrency: Max requests in flight at once
+
+        Returns:
+            List of transcript data, in chunk order
+        """
+        if not call_ids:
+            return []
+
+        chunks = [call_ids[i:i + chunk_size] for i in range(0, len(call_ids), chunk_size)]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(chunk: list[str]) -> list[dict]:
+            async with semaphore:
+                return await self.get_multiple_transcripts(chunk)
 
-        return result.get("callTranscripts", [])
+        results = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+        return list(itertools.chain.from_iterable(results))
 
     async def search_calls_by_emails(
         self,
@@ -229,27 +538,22 @@ class GongClient:
 
         filtered = []
         for call in all_calls:
-            parties = call.get("parties", [])
-            for party in parties:
-                email = party.get("emailAddress", "").lower()
+            for party in call.get("parties", []):
+                email = party.get("emailAddress") or ""
                 if not email:
                     continue
+                email = email.lower()
 
-                # Match by exact email
-                if email in email_set:
+                # Match by exact email, then by domain
+                _, sep, email_domain = email.rpartition("@")
+                if email in email_set or (sep and email_domain in domain_set):
                     filtered.append(call)
                     break
 
-                # Match by domain
-                if "@" in email:
-                    email_domain = email.split("@")[1]
-                    if email_domain in domain_set:
-                        filtered.append(call)
-                        break
-
         return filtered
 
-    def extract_participants(self, call: dict) -> dict:
+    @staticmethod
+    def extract_participants(call: dict) -> dict:
         """
         Extract and categorize participants from a call.
 
@@ -259,26 +563,4 @@ class GongClient:
         Returns:
             Dict with 'internal' and 'external' participant lists
         """
-        parties = call.get("parties", [])
-        internal = []
-        external = []
-
-        for party in parties:
-            name = party.get("name", party.get("emailAddress", "Unknown"))
-            email = party.get("emailAddress", "")
-            affiliation = party.get("affiliation", "").lower()
-
-            # Skip noise
-            if name in ["Merged Audio", "Fireflies.Ai Notetaker", "Fireflies.ai Notetaker"]:
-                continue
-            if "Fireflies" in name and "Notetaker" in name:
-                continue
-
-            participant = {"name": name, "email": email}
-
-            if affiliation == "internal":
-                internal.append(participant)
-            else:
-                external.append(participant)
-
-        return {"internal": internal, "external": external}
+        return format_participants(call.get("parties", []))
@@ -6,27 +6,32 @@ Exposes Gong call data to Claude with smart analysis routing.
 """
 
 import asyncio
+import importlib
+import logging
 import os
+import sys
+from typing import Any, Awaitable, Callable
 
 from dotenv import load_dotenv
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
-from mcp.types import Tool, TextContent
+from mcp.types import TextContent, Tool
 
-from .tools.calls import list_calls, get_transcript, search_calls
-from .tools.participants import get_call_participants
-from .tools.analysis import analyze_calls, get_job_status, get_job_results
+from .gong_client import close_shared_client as close_gong_client
+from .utils.serialization import dumps
 
 # Load environment variables
 load_dotenv()
 
-# #region agent log
-import json as _json; _log_path = "/Users/dannyzach/Documents/gong-mcp-server/.cursor/debug.log"
-_env_snapshot = {k: (v[:20] + "..." if len(v) > 20 else v) for k, v in os.environ.items() if any(x in k for x in ["DIRECT", "LLM", "GONG", "ANTHROPIC", "TOKEN"])}
-_direct_value = os.environ.get("DIRECT_LLM_TOKEN_LIMIT", "<<NOT SET>>")
-_gong_token = os.environ.get("GONG_TOKEN_LIMIT", "<<NOT SET>>")
-with open(_log_path, "a") as _f: _f.write(_json.dumps({"hypothesisId": "F", "location": "server.py:startup", "message": "Server startup env snapshot", "data": {"relevant_env": _env_snapshot, "DIRECT_LLM_TOKEN_LIMIT": _direct_value, "GONG_TOKEN_LIMIT": _gong_token, "pid": os.getpid()}, "timestamp": __import__("time").time(), "sessionId": "debug-session"}) + "\n")
-# #endregion
+logger = logging.getLogger(__name__)
+
+if logger.isEnabledFor(logging.DEBUG):
+    logger.debug(
+        "Server startup: DIRECT_LLM_TOKEN_LIMIT=%s GONG_TOKEN_LIMIT=%s pid=%s",
+        os.environ.get("DIRECT_LLM_TOKEN_LIMIT", "<not set>"),
+        os.environ.get("GONG_TOKEN_LIMIT", "<not set>"),
+        os.getpid(),
+    )
 
 # Create MCP server
 server = Server("gong-mcp")
@@ -208,6 +213,74 @@ TOOLS = [
 ]
 
 
+# Tool name -> (module, required arguments, optional arguments with defaults).
+# Each handler is the module function named after the tool; modules are
+# imported on first use so startup does not load the analysis stack.
+TOOL_DISPATCH = {
+    "list_calls": (
+        ".tools.calls",
+        (),
+        {"from_date": None, "to_date": None, "limit": 50},
+    ),
+    "get_transcript": (
+        ".tools.calls",
+        ("call_id",),
+        {"format": "text"},
+    ),
+    "search_calls": (
+        ".tools.calls",
+        (),
+        {
+            "query": None,
+            "emails": None,
+            "domains": None,
+            "from_date": None,
+            "to_date": None,
+            "limit": 50,
+        },
+    ),
+    "get_call_participants": (
+        ".tools.participants",
+        ("call_ids",),
+        {},
+    ),
+    "analyze_calls": (
+        ".tools.analysis",
+        (),
+        {
+            "from_date": None,
+            "to_date": None,
+            "prompt": "Analyze these call transcripts and extract key insights.",
+            "call_ids": None,
+            "emails": None,
+            "domains": None,
+        },
+    ),
+    "get_job_status": (
+        ".tools.analysis",
+        ("job_id",),
+        {},
+    ),
+    "get_job_results": (
+        ".tools.analysis",
+        ("job_id",),
+        {},
+    ),
+}
+
+
+_handlers: dict[str, Callable[..., Awaitable[dict[str, Any]]]] = {}
+
+
+def _get_handler(name: str) -> Callable[..., Awaitable[dict[str, Any]]]:
+    """Import and memoize the handler for a tool."""
+    handler = _handlers.get(name)
+    if handler is None:
+        module = importlib.import_module(TOOL_DISPATCH[name][0], __package__)
+        handler = _handlers[name] = getattr(module, name)
+    return handler
+
+
 @server.list_tools()
 async def handle_list_tools():
     """Return the list of available tools."""
@@ -217,79 +290,71 @@ async def handle_list_tools():
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict):
     """Handle tool calls."""
-    import json
-
     try:
-        if name == "list_calls":
-            result = await list_calls(
-                from_date=arguments.get("from_date"),
-                to_date=arguments.get("to_date"),
-                limit=arguments.get("limit", 50),
-            )
-
-        elif name == "get_transcript":
-            result = await get_transcript(
-                call_id=arguments["call_id"],
-                format=arguments.get("format", "text"),
-            )
-
-        elif name == "search_calls":
-            result = await search_calls(
-                query=arguments.get("query"),
-                emails=arguments.get("emails"),
-                domains=arguments.get("domains"),
-                from_date=arguments.get("from_date"),
-                to_date=arguments.get("to_date"),
-                limit=arguments.get("limit", 50),
-            )
+        entry = TOOL_DISPATCH.get(name)
+        if entry is None:
+            result = {"error": f"Unknown tool: {name}"}
+        else:
+            _, required, optional = entry
+            kwargs = {key: arguments[key] for key in required}
+            kwargs.update({key: arguments.get(key, default) for key, default in optional.items()})
+            result = await _get_handler(name)(**kwargs)
 
-        elif name == "get_call_participants":
-            result = await get_call_participants(
-                call_ids=arguments["call_ids"],
-            )
+    except Exception as e:
+        result = {"error": str(e), "tool": name}
 
-        elif name == "analyze_calls":
-            result = await analyze_calls(
-                from_date=arguments.get("from_date"),
-                to_date=arguments.get("to_date"),
-                prompt=arguments.get(
-                    "prompt",
-                    "Analyze these call transcripts and extract key insights.",
-                ),
-                call_ids=arguments.get("call_ids"),
-                emails=arguments.get("emails"),
-                domains=arguments.get("domains"),
-            )
+    # Return as JSON text content
+    try:
+        texts = _encode_result(name, result)
+    except Exception as e:
+        texts = [dumps({"error": str(e), "tool": name}, indent=True)]
+    return [TextContent(type="text", text=text) for text in texts]
 
-        elif name == "get_job_status":
-            result = await get_job_status(
-                job_id=arguments["job_id"],
-            )
 
-        elif name == "get_job_results":
-            result = await get_job_results(
-                job_id=arguments["job_id"],
-            )
+def _encode_result(name: str, result: dict) -> list[str]:
+    """
+    Encode a tool result as one or more JSON text blocks.
 
-        else:
-            result = {"error": f"Unknown tool: {name}"}
+    Direct-mode analyze_calls results are split into a header block (the
+    result without its transcripts) followed by one compact block per
+    transcript, so clients can start consuming before the whole payload
+    is encoded. Everything else is a single indented block.
 
-        # Return as JSON text content
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    Args:
+        name: Tool name
+        result: Tool result dict
 
-    except Exception as e:
-        error_result = {"error": str(e), "tool": name}
-        return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
+    Returns:
+        List of JSON texts, one per TextContent block
+    """
+    if name == "analyze_calls" and result.get("mode") == "direct" and "transcripts" in result:
+        header = {key: value for key, value in result.items() if key != "transcripts"}
+        header["transcript_blocks"] = len(result["transcripts"])
+        texts = [dumps(header, indent=True)]
+        texts.extend(dumps(transcript) for transcript in result["transcripts"])
+        return texts
+    return [dumps(result, indent=True)]
 
 
 async def run_server():
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options(),
-        )
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options(),
+            )
+    finally:
+        await close_gong_client()
+        # The runner is only loaded if an analysis job ran
+        runner = sys.modules.get(f"{__package__}.analysis.runner")
+        if runner is not None:
+            await runner.close_client()
+        # Job statuses coalesced within the flush interval are written out
+        jobs = sys.modules.get(f"{__package__}.analysis.jobs")
+        if jobs is not None:
+            await asyncio.to_thread(jobs.flush_job_statuses)
 
 
 def main():
@@ -2,21 +2,24 @@
 Analysis MCP tools with smart routing.
 """
 
+import logging
 import os
 from datetime import datetime, timedelta
 
 from ..analysis.jobs import (
     create_job,
     generate_job_id,
-    get_job_results as _get_job_results,
     load_job_status,
     run_job_in_background,
 )
+from ..analysis.jobs import get_job_results as _get_job_results
 from ..analysis.router import get_routing_decision
 from ..analysis.runner import run_analysis
 from ..gong_client import GongClient, check_gong_config
 from ..utils.filters import filter_calls_by_emails
-from ..utils.formatters import build_transcript_json
+from ..utils.formatters import build_transcript_json_with_size
+
+logger = logging.getLogger(__name__)
 
 
 async def analyze_calls(
@@ -53,10 +56,11 @@ async def analyze_calls(
         return {"mode": "error", **gong_error}
 
     # Default date range
+    now = datetime.now()
     if not to_date:
-        to_date = datetime.now().strftime("%Y-%m-%d")
+        to_date = now.strftime("%Y-%m-%d")
     if not from_date:
-        from_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+        from_date = (now - timedelta(days=7)).strftime("%Y-%m-%d")
 
     from_datetime = f"{from_date}T00:00:00Z"
     to_datetime = f"{to_date}T23:59:59Z"
@@ -84,26 +88,51 @@ async def analyze_calls(
                 "to_date": to_date,
             }
 
-        # Fetch transcripts
-        call_ids_to_fetch = [c.get("metaData", {}).get("id") for c in all_calls if c.get("metaData", {}).get("id")]
-        transcripts_raw = await client.get_multiple_transcripts(call_ids_to_fetch)
-
-        # Build transcript lookup
-        transcript_lookup = {t.get("callId"): t for t in transcripts_raw}
-
-        # Build full transcript objects
-        transcripts = []
+        # Unique calls by ID, first occurrence wins (pages can repeat calls);
+        # calls without an ID pass through and are reported as untranscribed
+        seen_ids = set()
+        unique_calls = []
         for call in all_calls:
             call_id = call.get("metaData", {}).get("id")
-            transcript_data = transcript_lookup.get(call_id, {"error": "No transcript"})
-            transcripts.append(build_transcript_json(call, transcript_data))
+            if call_id:
+                if call_id in seen_ids:
+                    continue
+                seen_ids.add(call_id)
+            unique_calls.append((call_id, call))
+
+        # Fetch transcripts, requesting each call ID once (order preserved)
+        transcripts_raw = await client.get_multiple_transcripts_chunked(
+            [call_id for call_id, _ in unique_calls if call_id]
+        )
+
+        # Build transcript lookup, keeping the first transcript per call
+        transcript_lookup = {}
+        for t in transcripts_raw:
+            transcript_lookup.setdefault(t.get("callId"), t)
+        del transcripts_raw
+
+        # Build full transcript objects, sized as they are built; popping
+        # drops each raw transcript from the lookup once it has been used
+        no_transcript = {"error": "No transcript"}
+        sized_transcripts = [
+            build_transcript_json_with_size(
+                call,
+                transcript_lookup.pop(call_id, no_transcript) if call_id else no_transcript,
+            )
+            for call_id, call in unique_calls
+        ]
+        del transcript_lookup
+        transcripts = [transcript for transcript, _ in sized_transcripts]
 
     # Get routing decision
-    decision = get_routing_decision(transcripts)
-    # #region agent log
-    import json as _json; _log_path = "/Users/dannyzach/Documents/gong-mcp-server/.cursor/debug.log"
-    with open(_log_path, "a") as _f: _f.write(_json.dumps({"hypothesisId": "A,B,C", "location": "analysis.py:analyze_calls:routing", "message": "Routing decision", "data": {"mode": decision.get("mode"), "total_tokens": decision.get("total_tokens"), "threshold": str(decision.get("threshold")), "reason": decision.get("reason")}, "timestamp": __import__("time").time(), "sessionId": "debug-session"}) + "\n")
-    # #endregion
+    decision = get_routing_decision(transcripts, sized_transcripts=sized_transcripts)
+    logger.debug(
+        "Routing decision: mode=%s total_tokens=%s threshold=%s reason=%s",
+        decision["mode"],
+        decision["total_tokens"],
+        decision["threshold"],
+        decision["reason"],
+    )
 
     # Async path requires Anthropic API key; return clear error instead of starting a failing job
     if decision["mode"] == "async" and not (os.getenv("ANTHROPIC_API_KEY") or "").strip():
@@ -151,7 +180,7 @@ async def analyze_calls(
         # Start background processing
         run_job_in_background(
             job_id,
-            run_analysis(job_id, transcripts, prompt),
+            run_analysis(job_id, decision["sized_transcripts"], prompt),
         )
 
         return {
@@ -177,6 +206,11 @@ async def get_job_status(job_id: str) -> dict:
     Returns:
         Current job status with progress info.
     """
+    return _get_job_status_impl(job_id)
+
+
+def _get_job_status_impl(job_id: str) -> dict:
+    """Synchronous core of get_job_status; only reads local job state."""
     status = load_job_status(job_id)
 
     if not status:
@@ -208,6 +242,11 @@ async def get_job_results(job_id: str) -> dict:
     Returns:
         Analysis results or error if not complete.
     """
+    return _get_job_results_impl(job_id)
+
+
+def _get_job_results_impl(job_id: str) -> dict:
+    """Synchronous core of get_job_results; only reads local job state."""
     status = load_job_status(job_id)
 
     if not status:
@@ -4,11 +4,16 @@ Call-related MCP tools.
 Provides list_calls, get_transcript, and search_calls functionality.
 """
 
+import itertools
 from datetime import datetime, timedelta
 
 from ..gong_client import GongClient, check_gong_config
 from ..utils.filters import filter_calls_by_emails
-from ..utils.formatters import build_transcript_json, build_transcript_text
+from ..utils.formatters import (
+    build_transcript_json,
+    build_transcript_text,
+    format_call_summary,
+)
 
 
 async def list_calls(
@@ -32,10 +37,11 @@ async def list_calls(
         return gong_error
 
     # Default date range: last 7 days
+    now = datetime.now()
     if not to_date:
-        to_date = datetime.now().strftime("%Y-%m-%d")
+        to_date = now.strftime("%Y-%m-%d")
     if not from_date:
-        from_date = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+        from_date = (now - timedelta(days=7)).strftime("%Y-%m-%d")
 
     # Convert to ISO format
     from_datetime = f"{from_date}T00:00:00Z"
@@ -44,23 +50,8 @@ async def list_calls(
     async with GongClient() as client:
         calls = await client.get_all_calls(from_datetime, to_datetime)
 
-    # Limit results
-    calls = calls[:limit]
-
-    # Format output with participant metadata
-    formatted_calls = []
-    for call in calls:
-        metadata = call.get("metaData", {})
-        participants = client.extract_participants(call)
-
-        formatted_calls.append({
-            "call_id": metadata.get("id", ""),
-            "title": metadata.get("title", "Untitled"),
-            "date": metadata.get("started", ""),
-            "duration_seconds": metadata.get("duration", 0),
-            "participants": participants,
-            "primary_user_id": metadata.get("primaryUserId", ""),
-        })
+    # Limit results and format output with participant metadata
+    formatted_calls = [format_call_summary(call) for call in calls[:limit]]
 
     return {
         "calls": formatted_calls,
@@ -140,10 +131,11 @@ async def search_calls(
         return gong_error
 
     # Default date range: last 30 days for search
+    now = datetime.now()
     if not to_date:
-        to_date = datetime.now().strftime("%Y-%m-%d")
+        to_date = now.strftime("%Y-%m-%d")
     if not from_date:
-        from_date = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
+        from_date = (now - timedelta(days=30)).strftime("%Y-%m-%d")
 
     from_datetime = f"{from_date}T00:00:00Z"
     to_datetime = f"{to_date}T23:59:59Z"
@@ -161,31 +153,19 @@ async def search_calls(
             filtered_calls, emails, domains
         )
 
-    # Text query filtering
+    # Text query filtering, applied lazily so matching stops at the limit
+    matching_calls = iter(filtered_calls)
     if query:
-        query_lower = query.lower()
-        filtered_calls = [
-            c for c in filtered_calls
-            if query_lower in c.get("metaData", {}).get("title", "").lower()
-        ]
-
-    # Limit results
-    filtered_calls = filtered_calls[:limit]
-
-    # Format output with participant metadata
-    formatted_calls = []
-    for call in filtered_calls:
-        metadata = call.get("metaData", {})
-        participants = GongClient().extract_participants(call)
-
-        formatted_calls.append({
-            "call_id": metadata.get("id", ""),
-            "title": metadata.get("title", "Untitled"),
-            "date": metadata.get("started", ""),
-            "duration_seconds": metadata.get("duration", 0),
-            "participants": participants,
-            "primary_user_id": metadata.get("primaryUserId", ""),
-        })
+        query_folded = query.casefold()
+        matching_calls = (
+            c for c in matching_calls
+            if query_folded in ((c.get("metaData") or {}).get("title") or "").casefold()
+        )
+
+    # Format output with participant metadata, only for returned calls
+    formatted_calls = [
+        format_call_summary(call) for call in itertools.islice(matching_calls, max(limit, 0))
+    ]
 
     return {
         "calls": formatted_calls,
@@ -2,8 +2,6 @@
 Participant lookup tool for cross-MCP join validation.
 """
 
-from datetime import datetime
-
 from ..gong_client import GongClient, check_gong_config
 
 
@@ -30,31 +28,29 @@ async def get_call_participants(
         return {"error": "No call IDs provided", "participants_by_call": {}}
 
     async with GongClient() as client:
-        # Fetch all calls (we need to search to get participant data)
-        from_datetime = "2020-01-01T00:00:00Z"
-        to_datetime = datetime.now().strftime("%Y-%m-%dT23:59:59Z")
-
-        all_calls = await client.get_all_calls(from_datetime, to_datetime)
-
-        # Build lookup
-        call_lookup = {call.get("metaData", {}).get("id"): call for call in all_calls}
-
-        # Extract participants for requested calls
-        participants_by_call = {}
-        found_calls = []
-        not_found_calls = []
+        # Fetch just the requested calls rather than the whole call history
+        calls = await client.get_calls_by_ids(call_ids)
+
+    # Build lookup by metaData.id, keeping only requested calls; iterating
+    # in reverse lets the first response for an ID win
+    wanted = set(call_ids)
+    call_lookup = {
+        call_id: call
+        for call in reversed(calls)
+        if (call_id := call.get("metaData", {}).get("id")) in wanted
+    }
 
-        for call_id in call_ids:
-            if call_id in call_lookup:
-                call = call_lookup[call_id]
-                participants_by_call[call_id] = client.extract_participants(call)
-                found_calls.append(call_id)
-            else:
-                not_found_calls.append(call_id)
+    # Extract participants for requested calls
+    participants_by_call = {
+        call_id: client.extract_participants(call_lookup[call_id])
+        for call_id in call_ids
+        if call_id in call_lookup
+    }
+    not_found_calls = [call_id for call_id in call_ids if call_id not in call_lookup]
 
     return {
         "participants_by_call": participants_by_call,
-        "found_count": len(found_calls),
+        "found_count": len(call_ids) - len(not_found_calls),
         "not_found_count": len(not_found_calls),
         "not_found_call_ids": not_found_calls if not_found_calls else None,
     }
@@ -0,0 +1,146 @@
+"""
+In-process response cache.
+
+Small LRU cache with per-entry TTLs and in-flight request deduplication,
+used to avoid refetching identical Gong API data across tool calls.
+
+Cached values are shared with every caller and must be treated as
+read-only; nothing copies them on the way out.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+from .sizing import estimate_size
+
+
+class TTLCache:
+    """
+    LRU cache whose entries expire after a per-entry TTL.
+
+    Bounded by entry count and, when max_bytes is set, by the estimated
+    JSON size of the cached values.
+    """
+
+    def __init__(self, maxsize: int = 256, max_bytes: int | None = None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[float, Any, int]] = OrderedDict()
+        self._total_bytes = 0
+        self._pending: dict[str, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """Estimated JSON size of all cached values (0 without max_bytes)."""
+        return self._total_bytes
+
+    def get(self, key: str) -> Any | None:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Cache a value, evicting least recently used entries if over a bound.
+
+        A value larger than max_bytes on its own is not cached.
+
+        Args:
+            key: Cache key
+            value: Value to cache (None is not cacheable)
+            ttl: Seconds until the entry expires
+        """
+        size = estimate_size(value) if self.max_bytes is not None else 0
+        self._remove(key)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value, size)
+        self._total_bytes += size
+        while len(self._entries) > self.maxsize or (
+            self.max_bytes is not None and self._total_bytes > self.max_bytes
+        ):
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self._total_bytes -= evicted_size
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+        self._total_bytes = 0
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry if present, releasing its size."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry[2]
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: float,
+        should_cache: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """
+        Return a cached value, or fetch it once even under concurrent callers.
+
+        Callers that ask for a key while it is already being fetched await
+        that fetch instead of starting another. The fetch runs as its own
+        task, so a cancelled caller stops waiting without cancelling it for
+        the others.
+
+        Args:
+            key: Cache key
+            fetch: Coroutine function producing the value
+            ttl: Seconds until the cached value expires
+            should_cache: Optional predicate; values it rejects are returned
+                but not cached
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_and_store(key, fetch, ttl, should_cache))
+            self._pending[key] = task
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: float,
+        should_cache: Callable[[Any], bool] | None,
+    ) -> Any:
+        """Run a shared fetch and cache its result."""
+        try:
+            value = await fetch()
+        finally:
+            del self._pending[key]
+
+        if value is not None and (should_cache is None or should_cache(value)):
+            self.set(key, value, ttl)
+        return value
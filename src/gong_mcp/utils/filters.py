@@ -3,6 +3,26 @@ Filtering utilities for cross-MCP synthesis.
 Handles email/domain/participant filtering logic.
 """
 
+# Recorder/notetaker parties that are not real call participants
+_NOISE_NAMES: frozenset[str] = frozenset({
+    "Merged Audio",
+    "Fireflies.Ai Notetaker",
+    "Fireflies.ai Notetaker",
+})
+
+
+def is_noise_participant(name: str) -> bool:
+    """
+    Check whether a party is a recording bot rather than a person.
+
+    Args:
+        name: Party display name
+
+    Returns:
+        True if the party should be left out of participants and speakers
+    """
+    return name in _NOISE_NAMES or ("Fireflies" in name and "Notetaker" in name)
+
 
 def filter_calls_by_emails(
     calls: list[dict],
@@ -27,37 +47,34 @@ def filter_calls_by_emails(
     email_set = {e.lower() for e in (emails or [])}
     domain_set = {d.lower().lstrip("@") for d in (domains or [])}
 
+    # Decide once which probes can match, so empty sets cost nothing per party
+    has_emails = bool(email_set)
+    has_domains = bool(domain_set)
+
     filtered = []
     matched_emails = set()
 
     for call in calls:
-        parties = call.get("parties", [])
-        call_matched = False
-
-        for party in parties:
-            email = party.get("emailAddress", "").lower()
+        for party in call.get("parties", []):
+            email = party.get("emailAddress") or ""
             if not email:
                 continue
-
-            # Match by exact email
-            if email in email_set:
+            email = email.lower()
+
+            # Match by exact email, then by domain; first match wins
+            if has_emails and email in email_set:
+                matched = True
+            elif has_domains:
+                _, sep, email_domain = email.rpartition("@")
+                matched = bool(sep) and email_domain in domain_set
+            else:
+                matched = False
+
+            if matched:
                 filtered.append(call)
                 matched_emails.add(email)
-                call_matched = True
                 break
 
-            # Match by domain
-            if "@" in email and domain_set:
-                email_domain = email.split("@")[1]
-                if email_domain in domain_set:
-                    filtered.append(call)
-                    matched_emails.add(email)
-                    call_matched = True
-                    break
-
-        if call_matched:
-            continue
-
     return filtered, list(matched_emails)
 
 
@@ -71,17 +88,13 @@ def extract_external_emails(calls: list[dict]) -> list[str]:
     Returns:
         List of unique external email addresses
     """
-    emails = set()
-
-    for call in calls:
-        parties = call.get("parties", [])
-        for party in parties:
-            affiliation = party.get("affiliation", "").lower()
-            email = party.get("emailAddress", "")
-            if affiliation != "internal" and email:
-                emails.add(email.lower())
-
-    return list(emails)
+    return list({
+        email.lower()
+        for call in calls
+        for party in call.get("parties", [])
+        if (email := party.get("emailAddress"))
+        and (party.get("affiliation") or "").lower() != "internal"
+    })
 
 
 def get_matching_call_ids(
@@ -3,8 +3,27 @@ Formatting utilities for transcripts and call data.
 Ported from GongWebApp with enhancements.
 """
 
+import functools
+import heapq
 from datetime import datetime, timezone
-from typing import Any
+from itertools import pairwise
+from operator import itemgetter
+from typing import Any, Callable, Iterator
+
+from .filters import is_noise_participant
+from .sizing import estimate_size
+
+# Text transcripts only drop these exact recorder names from the speaker map
+_TEXT_NOISE_NAMES: frozenset[str] = frozenset({"Merged Audio", "Fireflies.Ai Notetaker"})
+
+# Party fields that transcript entries may use as their speakerId
+_PARTY_ID_KEYS = ("speakerId", "userId", "id", "partyId")
+
+# Per-entry estimate_size overhead of a conversation entry: braces, the four
+# keys with their quotes and colons, value quotes, and separators
+_CONVERSATION_ENTRY_OVERHEAD = 2 + sum(
+    len(key) + 3 + 2 for key in ("timestamp", "speaker", "affiliation", "text")
+)
 
 
 def format_duration(seconds: int | float) -> str:
@@ -17,7 +36,12 @@ def format_duration(seconds: int | float) -> str:
     Returns:
         Formatted string like "1h 23m 45s" or "5m 30s"
     """
-    seconds = int(seconds)
+    return _format_duration_seconds(int(seconds))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_duration_seconds(seconds: int) -> str:
+    """Format a whole number of seconds for format_duration (memoized)."""
     hours = seconds // 3600
     minutes = (seconds % 3600) // 60
     secs = seconds % 60
@@ -40,7 +64,12 @@ def format_timestamp(seconds: float) -> str:
     Returns:
         Formatted timestamp string
     """
-    total_seconds = int(seconds)
+    return _format_timestamp_seconds(int(seconds))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_timestamp_seconds(total_seconds: int) -> str:
+    """Format a whole number of seconds for format_timestamp (memoized)."""
     hours = total_seconds // 3600
     minutes = (total_seconds % 3600) // 60
     secs = total_seconds % 60
@@ -50,10 +79,13 @@ def format_timestamp(seconds: float) -> str:
     return f"{minutes:02d}:{secs:02d}"
 
 
+@functools.lru_cache(maxsize=2048)
 def format_iso_date(iso_string: str) -> str:
     """
     Format ISO datetime string to human-readable format.
 
+    Results are memoized, since listings repeat the same start times.
+
     Args:
         iso_string: ISO format datetime string
 
@@ -79,6 +111,158 @@ def format_iso_date(iso_string: str) -> str:
         return iso_string
 
 
+def format_participants(parties: list[dict]) -> dict:
+    """
+    Categorize a call's parties into internal and external participants.
+
+    Args:
+        parties: Party data from Gong API
+
+    Returns:
+        Dict with 'internal' and 'external' lists of {name, email} dicts
+    """
+    internal = []
+    external = []
+
+    for party in parties:
+        name = party.get("name", party.get("emailAddress", "Unknown"))
+
+        # Skip noise
+        if is_noise_participant(name):
+            continue
+
+        participant = {
+            "name": name,
+            "email": party.get("emailAddress", ""),
+        }
+
+        if (party.get("affiliation") or "").lower() == "internal":
+            internal.append(participant)
+        else:
+            external.append(participant)
+
+    return {"internal": internal, "external": external}
+
+
+def format_call_summary(call: dict) -> dict:
+    """
+    Format a call for listing output, reading its metadata and parties once.
+
+    Args:
+        call: Call data from Gong API
+
+    Returns:
+        Dict with call ID, title, date, duration, participants and primary user
+    """
+    metadata = call.get("metaData", {})
+    return {
+        "call_id": metadata.get("id", ""),
+        "title": metadata.get("title", "Untitled"),
+        "date": metadata.get("started", ""),
+        "duration_seconds": metadata.get("duration", 0),
+        "participants": format_participants(call.get("parties", [])),
+        "primary_user_id": metadata.get("primaryUserId", ""),
+    }
+
+
+def _party_ids(party: dict) -> list[str]:
+    """
+    Get every ID a party may be referenced by in transcript entries.
+
+    Args:
+        party: Party data from Gong API
+
+    Returns:
+        Non-empty IDs as strings, in _PARTY_ID_KEYS order
+    """
+    return [str(value) for key in _PARTY_ID_KEYS if (value := party.get(key))]
+
+
+def _merged_sentences(
+    entries: list[dict],
+    speaker_of: Callable[[str], Any],
+) -> Iterator[tuple[int, Any, str]]:
+    """
+    Iterate the non-empty sentences of all transcript entries by start time.
+
+    Each entry's sentences are normally already in time order, so the
+    entries are merged rather than flattened and sorted; an entry that is
+    out of order is sorted on its own first. Ties keep entry order.
+
+    Args:
+        entries: Transcript entries from Gong API (one per speaker turn)
+        speaker_of: Called once per entry with its speaker ID; the result
+            is passed through as the sentence's speaker
+
+    Returns:
+        Iterator of (start_ms, speaker, text) tuples
+    """
+    runs = []
+    for entry in entries:
+        speaker = speaker_of(str(entry.get("speakerId", "")))
+        run = [
+            (sentence.get("start", 0), speaker, text)
+            for sentence in entry.get("sentences", [])
+            if (text := sentence.get("text", ""))
+        ]
+        if any(a[0] > b[0] for a, b in pairwise(run)):
+            run.sort(key=itemgetter(0))
+        runs.append(run)
+    return heapq.merge(*runs, key=itemgetter(0))
+
+
+def _is_text_noise(name: str) -> bool:
+    """Check the fixed recorder names that text transcripts leave unnamed."""
+    return name in _TEXT_NOISE_NAMES
+
+
+def _prepare_transcript(
+    call_data: dict,
+    transcript_data: dict,
+    is_noise: Callable[[str], bool] = is_noise_participant,
+) -> tuple[list[tuple[str, str, str]], Iterator[tuple[int, tuple[str, str], str]]]:
+    """
+    Resolve speakers and order sentences for the transcript builders.
+
+    Args:
+        call_data: Call metadata from Gong API
+        transcript_data: Transcript data from Gong API
+        is_noise: Predicate for parties to leave out
+
+    Returns:
+        Tuple of (participants, sentences): participants are (name, email,
+        affiliation) for each non-noise party; sentences iterate
+        (start_ms, (speaker_name, affiliation), text) by start time and are
+        empty when the transcript has an error
+    """
+    participants = []
+    speakers: dict[str, tuple[str, str]] = {}
+
+    for party in call_data.get("parties", []):
+        name = party.get("name", party.get("emailAddress", "Unknown"))
+
+        # Skip noise
+        if is_noise(name):
+            continue
+
+        email = party.get("emailAddress", "")
+        affiliation = (party.get("affiliation") or "other").lower()
+        participants.append((name, email, affiliation))
+
+        # Map speaker IDs
+        for party_id in _party_ids(party):
+            speakers[party_id] = (name, affiliation)
+
+    if "error" in transcript_data:
+        return participants, iter(())
+
+    def speaker_of(speaker_id: str) -> tuple[str, str]:
+        return speakers.get(speaker_id) or (f"Speaker {speaker_id[-4:]}", "unknown")
+
+    entries = transcript_data.get("transcript", [])
+    return participants, _merged_sentences(entries, speaker_of)
+
+
 def build_transcript_text(
     call_data: dict,
     transcript_data: dict,
@@ -96,18 +280,7 @@ def build_transcript_text(
         Formatted transcript as plain text
     """
     metadata = call_data.get("metaData", {})
-    parties = call_data.get("parties", [])
-
-    # Build speaker map
-    speaker_map = {}
-    for party in parties:
-        name = party.get("name", party.get("emailAddress", "Unknown"))
-        if name in ["Merged Audio", "Fireflies.Ai Notetaker"]:
-            continue
-
-        for key in ["speakerId", "userId", "id", "partyId"]:
-            if party.get(key):
-                speaker_map[str(party[key])] = name
+    _, sentences = _prepare_transcript(call_data, transcript_data, is_noise=_is_text_noise)
 
     # Build header
     lines = []
@@ -120,35 +293,14 @@ def build_transcript_text(
     lines.append(f"Duration: {duration}")
     lines.append("")
 
-    # Build conversation
-    if "error" not in transcript_data:
-        entries = transcript_data.get("transcript", [])
-
-        all_sentences = []
-        for entry in entries:
-            speaker_id = str(entry.get("speakerId", ""))
-            speaker_name = speaker_map.get(speaker_id, f"Speaker {speaker_id[-4:]}")
-
-            for sentence in entry.get("sentences", []):
-                start_ms = sentence.get("start", 0)
-                text = sentence.get("text", "")
-                if text:
-                    all_sentences.append({
-                        "start": start_ms,
-                        "speaker": speaker_name,
-                        "text": text,
-                    })
-
-        # Sort by timestamp
-        all_sentences.sort(key=lambda x: x["start"])
-
-        # Format output
-        for sentence in all_sentences:
-            if include_timestamps:
-                ts = format_timestamp(sentence["start"] / 1000)
-                lines.append(f"[{ts}] {sentence['speaker']}: {sentence['text']}")
-            else:
-                lines.append(f"{sentence['speaker']}: {sentence['text']}")
+    # Format conversation in timestamp order, choosing the line format once
+    if include_timestamps:
+        lines.extend(
+            f"[{format_timestamp(start_ms // 1000)}] {speaker_name}: {text}"
+            for start_ms, (speaker_name, _), text in sentences
+        )
+    else:
+        lines.extend(f"{speaker_name}: {text}" for _, (speaker_name, _), text in sentences)
 
     return "\n".join(lines)
 
@@ -164,8 +316,27 @@ def build_transcript_json(call_data: dict, transcript_data: dict) -> dict:
     Returns:
         Structured dict with metadata, participants, and conversation
     """
+    return build_transcript_json_with_size(call_data, transcript_data)[0]
+
+
+def build_transcript_json_with_size(
+    call_data: dict, transcript_data: dict
+) -> tuple[dict, int]:
+    """
+    Build structured transcript JSON and its estimated JSON size in one pass.
+
+    The conversation is sized while it is built, so callers that route on
+    size do not need to walk the finished transcript again.
+
+    Args:
+        call_data: Call metadata from Gong API
+        transcript_data: Transcript data from Gong API
+
+    Returns:
+        Tuple of (transcript dict, size equal to estimate_size(transcript))
+    """
     metadata = call_data.get("metaData", {})
-    parties = call_data.get("parties", [])
+    participants, sentences = _prepare_transcript(call_data, transcript_data)
 
     output: dict[str, Any] = {
         "metadata": {},
@@ -181,63 +352,36 @@ def build_transcript_json(call_data: dict, transcript_data: dict) -> dict:
     output["metadata"]["duration_seconds"] = metadata.get("duration", 0)
     output["metadata"]["duration_formatted"] = format_duration(metadata.get("duration", 0))
 
-    # Build speaker map and participants
-    speaker_map = {}
-    affiliation_map = {}
-
-    for party in parties:
-        name = party.get("name", party.get("emailAddress", "Unknown"))
-        email = party.get("emailAddress", "")
-        affiliation = party.get("affiliation", "other").lower()
-
-        # Skip noise
-        if name in ["Merged Audio", "Fireflies.Ai Notetaker", "Fireflies.ai Notetaker"]:
-            continue
-        if "Fireflies" in name and "Notetaker" in name:
-            continue
-
-        # Map speaker IDs
-        for key in ["speakerId", "userId", "id", "partyId"]:
-            if party.get(key):
-                speaker_map[str(party[key])] = name
-                affiliation_map[str(party[key])] = affiliation
-
-        # Add to participants
+    # Participants
+    for name, email, affiliation in participants:
         participant = {"name": name, "email": email}
         if affiliation == "internal":
             output["participants"]["internal"].append(participant)
         else:
             output["participants"]["external"].append(participant)
 
-    # Build conversation
-    if "error" not in transcript_data:
-        entries = transcript_data.get("transcript", [])
-
-        all_sentences = []
-        for entry in entries:
-            speaker_id = str(entry.get("speakerId", ""))
-            speaker_name = speaker_map.get(speaker_id, f"Speaker {speaker_id[-4:]}")
-            speaker_affiliation = affiliation_map.get(speaker_id, "unknown")
-
-            for sentence in entry.get("sentences", []):
-                start_ms = sentence.get("start", 0)
-                text = sentence.get("text", "")
-                if text:
-                    all_sentences.append({
-                        "start": start_ms,
-                        "speaker": speaker_name,
-                        "affiliation": speaker_affiliation,
-                        "text": text,
-                    })
-
-        all_sentences.sort(key=lambda x: x["start"])
-
-        for sentence in all_sentences:
-            output["conversation"].append({
-                "timestamp": format_timestamp(sentence["start"] / 1000),
-                "speaker": sentence["speaker"],
-                "affiliation": sentence["affiliation"],
-                "text": sentence["text"],
-            })
-
-    return output
+    # Build conversation, sizing it as entries are added
+    conversation_size = 2
+    for start_ms, (speaker_name, speaker_affiliation), text in sentences:
+        timestamp = format_timestamp(start_ms // 1000)
+        output["conversation"].append({
+            "timestamp": timestamp,
+            "speaker": speaker_name,
+            "affiliation": speaker_affiliation,
+            "text": text,
+        })
+        conversation_size += (
+            _CONVERSATION_ENTRY_OVERHEAD + 1
+            + len(timestamp)
+            + len(speaker_name)
+            + len(speaker_affiliation)
+            + len(text)
+        )
+
+    size = (
+        2
+        + len("metadata") + 3 + estimate_size(output["metadata"])
+        + len("participants") + 3 + estimate_size(output["participants"])
+        + len("conversation") + 3 + conversation_size
+    )
+    return output, size
@@ -0,0 +1,64 @@
+"""
+JSON serialization helpers.
+
+Uses orjson when it is installed and falls back to the stdlib json module,
+so callers get compact UTF-8 output either way.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with two-space indentation instead of compact output
+
+    Returns:
+        UTF-8 encoded JSON bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with two-space indentation instead of compact output
+
+    Returns:
+        JSON text
+    """
+    return dumps_bytes(obj, indent=indent).decode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Deserialize JSON from bytes or a string.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,58 @@
+"""
+Transcript size estimation.
+
+Approximates JSON-encoded sizes by walking objects, so routing and batching
+can share one size per transcript instead of re-serializing it.
+"""
+
+from typing import Any
+
+
+def estimate_size(obj: Any) -> int:
+    """
+    Approximate the serialized JSON length of an object without encoding it.
+
+    Walks dicts, lists and strings and sums their lengths plus punctuation
+    overhead, so no intermediate JSON string is allocated.
+
+    Args:
+        obj: JSON-compatible object (dict, list, str, number, bool, None)
+
+    Returns:
+        Approximate length of the JSON encoding in characters
+    """
+    if isinstance(obj, str):
+        return len(obj) + 2  # quotes
+    if isinstance(obj, dict):
+        return 2 + sum(len(k) + 3 + estimate_size(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return 2 + sum(estimate_size(item) + 1 for item in obj)
+    if obj is None or isinstance(obj, (bool, int, float)):
+        return 8
+    return len(str(obj))
+
+
+def annotate_sizes(transcripts: list[dict]) -> list[tuple[dict, int]]:
+    """
+    Pair each transcript with its estimated JSON size.
+
+    Args:
+        transcripts: List of transcript dicts
+
+    Returns:
+        List of (transcript, estimated_size) tuples in input order
+    """
+    return [(transcript, estimate_size(transcript)) for transcript in transcripts]
+
+
+def total_size(sized_transcripts: list[tuple[dict, int]]) -> int:
+    """
+    Estimate the JSON size of a list from its annotated items.
+
+    Args:
+        sized_transcripts: Output of annotate_sizes
+
+    Returns:
+        Same value estimate_size would return for the bare list
+    """
+    return 2 + sum(size + 1 for _, size in sized_transcripts)
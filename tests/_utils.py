@@ -0,0 +1,24 @@
+"""Shared helpers for tests."""
+
+from operator import itemgetter
+
+from httpx import Request, Response
+
+from gong_mcp.utils.serialization import dumps_bytes
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+# Real request shared by responses that need one attached
+_SHARED_REQ = Request("POST", "https://api.gong.io/")
+
+_get_call_id = itemgetter("call_id")
+
+
+def extract_call_ids(resp: dict) -> list[str]:
+    """Return the call IDs from a list_calls/search_calls style response."""
+    return list(map(_get_call_id, resp["calls"]))
+
+
+def json_response(payload: dict, status_code: int = 200) -> Response:
+    """Build a JSON response from pre-serialized bytes (orjson when installed)."""
+    return Response(status_code=status_code, content=dumps_bytes(payload), headers=JSON_HEADERS)
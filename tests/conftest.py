@@ -2,13 +2,23 @@
 Pytest configuration and shared fixtures for Gong MCP Server tests.
 """
 
+import asyncio
 import json
+from collections import deque
 from pathlib import Path
-from unittest.mock import MagicMock
+from typing import Callable
 
+import httpx
 import pytest
 from httpx import Response
 
+from gong_mcp import gong_client
+from gong_mcp.analysis import jobs, router, runner
+from gong_mcp.analysis.router import get_direct_threshold
+from gong_mcp.gong_client import CALLS_EXTENSIVE_URL
+from gong_mcp.utils.serialization import dumps_bytes
+from tests._utils import _SHARED_REQ, json_response
+
 
 # ============================================================================
 # Environment and Configuration Fixtures
@@ -21,6 +31,35 @@ def _gong_config_for_tests(monkeypatch):
     monkeypatch.setenv("GONG_ACCESS_KEY_SECRET", "test_secret")
 
 
+@pytest.fixture(autouse=True)
+def _clear_config_caches():
+    """Drop cached env-derived settings so each test sees its own environment."""
+    get_direct_threshold.cache_clear()
+    jobs.get_jobs_dir.cache_clear()
+    gong_client.get_gong_credentials.cache_clear()
+    yield
+    get_direct_threshold.cache_clear()
+    jobs.get_jobs_dir.cache_clear()
+    gong_client.get_gong_credentials.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_clients():
+    """Drop pooled HTTP clients and response caches after each test."""
+    yield
+    runner._client = None
+    gong_client._shared_client = None
+    gong_client._calls_cache.clear()
+    gong_client._transcript_cache.clear()
+
+
+@pytest.fixture
+def no_gong_creds(monkeypatch):
+    """Unset the Gong credentials set by _gong_config_for_tests."""
+    monkeypatch.delenv("GONG_ACCESS_KEY", raising=False)
+    monkeypatch.delenv("GONG_ACCESS_KEY_SECRET", raising=False)
+
+
 @pytest.fixture
 def mock_env_vars(monkeypatch):
     """Mock environment variables for testing."""
@@ -32,6 +71,18 @@ def mock_env_vars(monkeypatch):
     # Cleanup handled by monkeypatch
 
 
+@pytest.fixture
+def direct_threshold(monkeypatch):
+    """Return a function that fixes the direct-mode token limit (in K tokens).
+
+    Patches the cached router accessor, so tests skip the env var round-trip.
+    """
+    def set_limit(limit_k: int) -> None:
+        monkeypatch.setattr(router, "get_direct_threshold", lambda: limit_k * 1000)
+
+    return set_limit
+
+
 @pytest.fixture
 def temp_jobs_dir(tmp_path, monkeypatch):
     """Create a temporary directory for job files."""
@@ -41,13 +92,24 @@ def temp_jobs_dir(tmp_path, monkeypatch):
     return jobs_dir
 
 
+@pytest.fixture
+def in_memory_jobs(monkeypatch):
+    """Route job status and results through an in-memory store instead of files."""
+    store = jobs.InMemoryJobStore()
+    monkeypatch.setattr("gong_mcp.analysis.jobs._default_store", store)
+    return store
+
+
 # ============================================================================
 # Sample Data Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_call_data():
-    """Sample call data from Gong API."""
+    """Sample call data from Gong API.
+
+    Session-scoped and shared; copy before mutating.
+    """
     return {
         "metaData": {
             "id": "call_12345",  # ID is inside metaData per Gong API
@@ -73,9 +135,12 @@ def sample_call_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_transcript_data():
-    """Sample transcript data from Gong API."""
+    """Sample transcript data from Gong API.
+
+    Session-scoped and shared; copy before mutating.
+    """
     return {
         "callId": "call_12345",
         "transcript": [
@@ -105,9 +170,41 @@ def sample_transcript_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def large_transcript():
+    """Transcript of ~100K characters, big enough to force async routing.
+
+    Routing sizes transcripts by serialized bytes, so one long sentence
+    has the same effect as many short ones. Built once per session; tests
+    must treat it as read-only.
+    """
+    return {
+        "callId": "call_12345",
+        "transcript": [
+            {
+                "speakerId": "speaker_1",
+                "sentences": [{"start": 0, "text": "x" * 100_000}],
+            }
+        ],
+    }
+
+
+@pytest.fixture(scope="session")
+def large_transcript_body(large_transcript):
+    """Serialized /calls/transcript response body for large_transcript.
+
+    Encoded once per session, before any event loop work, so async tests
+    only hand the ready bytes to the mock.
+    """
+    return dumps_bytes({"callTranscripts": [large_transcript]})
+
+
+@pytest.fixture(scope="session")
 def sample_calls_list(sample_call_data):
-    """List of sample calls for pagination testing."""
+    """List of sample calls for pagination testing.
+
+    Session-scoped and shared; copy before mutating.
+    """
     import copy
     calls = []
     for i in range(5):
@@ -128,14 +225,111 @@ def mock_httpx_client(httpx_mock):
     
     This fixture properly intercepts all HTTP calls made by httpx.AsyncClient.
     Tests should add their own mock responses using httpx_mock.add_response().
+    httpx_mock is function-scoped, so every test starts with no responses
+    registered and needs no reset.
     """
-    # Configure to allow unused responses (some tests may not use all mocked responses)
-    httpx_mock.reset()
-    # Allow responses to be registered but not necessarily used
-    # This is useful when tests conditionally make API calls
     return httpx_mock
 
 
+class _ResponseRouter(dict):
+    """Map (method, url) keys to queues of responses, popped one per request.
+
+    A single reusable pytest-httpx callback is registered the first time a
+    key is used, with the URL parsed once then, so every later request is
+    one dict lookup plus a popleft. When a key's queue is empty, its default
+    factory (if any) builds the response instead.
+    """
+
+    def __init__(self, httpx_mock):
+        super().__init__()
+        self._httpx_mock = httpx_mock
+        self._defaults: dict[tuple[str, str], Callable[[], dict]] = {}
+
+    def __missing__(self, key: tuple[str, str]) -> deque:
+        method, url = key
+        queue = self[key] = deque()
+        defaults = self._defaults
+
+        def dispatch(request):
+            if queue or key not in defaults:
+                return queue.popleft()
+            return json_response(defaults[key]())
+
+        self._httpx_mock.add_callback(
+            dispatch,
+            method=method,
+            url=httpx.URL(url),
+            is_reusable=True,
+            is_optional=True,
+        )
+        return queue
+
+    def set_default(self, method: str, url: str, json_factory: Callable[[], dict]) -> None:
+        """Answer requests to (method, url) with json_factory() once its queue is empty."""
+        self._defaults[method, url] = json_factory
+        self[method, url]  # Register the dispatch callback
+
+
+@pytest.fixture
+def http_router(mock_httpx_client):
+    """(method, url) -> deque of Responses; append to queue responses for an endpoint."""
+    return _ResponseRouter(mock_httpx_client)
+
+
+@pytest.fixture
+def add_calls_response(http_router):
+    """Queue a single-page /calls/extensive response.
+
+    Returns a function taking the list of calls, so tests don't repeat the
+    payload.
+    """
+    def add(calls: list[dict]) -> None:
+        http_router["POST", CALLS_EXTENSIVE_URL].append(
+            json_response({
+                "calls": calls,
+                "records": {"cursor": None, "currentPageSize": len(calls)},
+            })
+        )
+
+    return add
+
+
+@pytest.fixture
+def calls_list_page(http_router, sample_calls_list):
+    """Answer /calls/extensive with a single page of sample_calls_list by default.
+
+    The page is built once per test; queued responses still take priority.
+    """
+    page = {
+        "calls": sample_calls_list,
+        "records": {"cursor": None, "currentPageSize": len(sample_calls_list)},
+    }
+    http_router.set_default("POST", CALLS_EXTENSIVE_URL, lambda: page)
+    return page
+
+
+@pytest.fixture
+def mock_transport(monkeypatch):
+    """Serve Gong API requests from an in-memory httpx.MockTransport.
+
+    Returns a dict keyed by (method, path), e.g. ("POST", "/v2/calls/transcript"),
+    whose values are JSON payloads or Responses. A client on that transport is
+    installed as the shared Gong client, so requests skip the connection pool
+    and pytest-httpx entirely. Unregistered routes raise.
+    """
+    routes: dict[tuple[str, str], dict | Response] = {}
+
+    def handler(request: httpx.Request) -> Response:
+        value = routes.get((request.method, request.url.path))
+        if value is None:
+            raise AssertionError(f"Unexpected request: {request.method} {request.url}")
+        return value if isinstance(value, Response) else json_response(value)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(gong_client, "_shared_client", client)
+    return routes
+
+
 @pytest.fixture
 def mock_gong_responses(sample_call_data, sample_transcript_data):
     """Mock Gong API responses."""
@@ -208,15 +402,24 @@ def sample_job_results():
     }
 
 
+@pytest.fixture
+def wait_for_background_jobs():
+    """Return a coroutine function that waits for all running background jobs."""
+    async def _wait():
+        # A failed job registers a follow-up task that records the failure
+        while tasks := list(jobs._background_tasks.values()):
+            await asyncio.gather(*tasks, return_exceptions=True)
+    return _wait
+
+
 # ============================================================================
 # Cleanup Fixtures
 # ============================================================================
 
 @pytest.fixture(autouse=True)
-def cleanup_jobs(temp_jobs_dir):
-    """Clean up job files after each test."""
-    yield
-    # Cleanup handled by tmp_path fixture
+def cleanup_jobs(temp_jobs_dir, monkeypatch):
+    """Give each test a fresh file job store, so no cached status leaks between tests."""
+    monkeypatch.setattr(jobs, "_default_store", jobs.FileJobStore())
 
 
 # ============================================================================
@@ -228,7 +431,7 @@ def create_mock_response(status_code: int, json_data: dict = None) -> Response:
     return Response(
         status_code=status_code,
         json=json_data or {},
-        request=MagicMock(),
+        request=_SHARED_REQ,
     )
 
 
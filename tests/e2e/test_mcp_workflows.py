@@ -2,8 +2,10 @@
 
 import pytest
 
+from gong_mcp.gong_client import CALLS_TRANSCRIPT_URL
 from gong_mcp.tools.analysis import analyze_calls, get_job_status
 from gong_mcp.tools.calls import list_calls, search_calls
+from tests._utils import JSON_HEADERS, extract_call_ids
 
 
 @pytest.mark.e2e
@@ -11,27 +13,8 @@ from gong_mcp.tools.calls import list_calls, search_calls
 class TestDiscoveryWorkflow:
     """Test discovery workflow: List -> Search -> Analyze."""
 
-    async def test_list_then_search_workflow(self, mock_httpx_client, sample_calls_list):
+    async def test_list_then_search_workflow(self, calls_list_page):
         """Test workflow: list calls, then search for specific ones."""
-        mock_httpx_client.reset()
-        # Add responses for both calls
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": sample_calls_list,
-                "records": {"cursor": None, "currentPageSize": len(sample_calls_list)},
-            },
-        )
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": sample_calls_list,
-                "records": {"cursor": None, "currentPageSize": len(sample_calls_list)},
-            },
-        )
-
         # Step 1: List calls
         listed = await list_calls(limit=5)
         assert len(listed["calls"]) > 0
@@ -40,33 +23,21 @@ class TestDiscoveryWorkflow:
         searched = await search_calls(emails=["jane@acme.com"])
         assert "calls" in searched
 
-    async def test_search_then_analyze_workflow(self, mock_httpx_client, sample_call_data, sample_transcript_data, monkeypatch, temp_jobs_dir):
+    async def test_search_then_analyze_workflow(
+        self, mock_httpx_client, add_calls_response, sample_call_data, sample_transcript_data,
+        direct_threshold, temp_jobs_dir
+    ):
         """Test workflow: search calls, then analyze them."""
-        monkeypatch.setenv("DIRECT_LLM_TOKEN_LIMIT", "150")  # 150K
+        direct_threshold(150)  # 150K
         
-        mock_httpx_client.reset()
         # Search response
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": [sample_call_data],
-                "records": {"cursor": None, "currentPageSize": 1},
-            },
-        )
+        add_calls_response([sample_call_data])
         # Analyze response (calls)
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": [sample_call_data],
-                "records": {"cursor": None, "currentPageSize": 1},
-            },
-        )
+        add_calls_response([sample_call_data])
         # Analyze response (transcript)
         mock_httpx_client.add_response(
             method="POST",
-            url="https://api.gong.io/v2/calls/transcript",
+            url=CALLS_TRANSCRIPT_URL,
             json={"callTranscripts": [sample_transcript_data]},
         )
 
@@ -75,7 +46,7 @@ class TestDiscoveryWorkflow:
         assert len(searched["calls"]) > 0
 
         # Step 2: Analyze the found calls
-        call_ids = [call["call_id"] for call in searched["calls"]]
+        call_ids = extract_call_ids(searched)
         analyzed = await analyze_calls(call_ids=call_ids, prompt="Analyze these calls")
         assert analyzed["mode"] == "direct" or analyzed["mode"] == "async"
 
@@ -85,32 +56,20 @@ class TestDiscoveryWorkflow:
 class TestAnalysisWorkflow:
     """Test analysis workflow: Analyze -> Poll Status -> Get Results."""
 
-    async def test_async_analysis_workflow(self, mock_httpx_client, sample_call_data, sample_transcript_data, monkeypatch, temp_jobs_dir):
+    async def test_async_analysis_workflow(
+        self, mock_httpx_client, add_calls_response, sample_call_data, large_transcript_body,
+        direct_threshold, monkeypatch, temp_jobs_dir, wait_for_background_jobs
+    ):
         """Test complete async analysis workflow."""
-        monkeypatch.setenv("DIRECT_LLM_TOKEN_LIMIT", "1")  # 1K - very low to trigger async
+        direct_threshold(1)  # 1K - very low to trigger async
         monkeypatch.setenv("ANTHROPIC_API_KEY", "test_anthropic_key")  # required for async path
 
-        large_transcript = sample_transcript_data.copy()
-        large_transcript["transcript"] = [
-            {
-                "speakerId": "speaker_1",
-                "sentences": [{"start": i * 1000, "text": "x" * 1000} for i in range(100)]
-            }
-        ]
-        
-        mock_httpx_client.reset()
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": [sample_call_data],
-                "records": {"cursor": None, "currentPageSize": 1},
-            },
-        )
+        add_calls_response([sample_call_data])
         mock_httpx_client.add_response(
             method="POST",
-            url="https://api.gong.io/v2/calls/transcript",
-            json={"callTranscripts": [large_transcript]},
+            url=CALLS_TRANSCRIPT_URL,
+            content=large_transcript_body,
+            headers=JSON_HEADERS,
         )
         # Async job runs in background and calls Anthropic API
         mock_httpx_client.add_response(
@@ -137,24 +96,20 @@ class TestAnalysisWorkflow:
         assert status["job_id"] == job_id
         assert "status" in status
 
+        # Step 3: Let the background job finish
+        await wait_for_background_jobs()
+        status = await get_job_status(job_id)
+        assert status["status"] == "complete"
+
 
 @pytest.mark.e2e
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("calls_list_page")
 class TestCrossMCPSimulation:
     """Test cross-MCP synthesis scenarios."""
 
-    async def test_email_filter_workflow(self, mock_httpx_client, sample_calls_list):
+    async def test_email_filter_workflow(self):
         """Test workflow simulating cross-MCP join via email filtering."""
-        mock_httpx_client.reset()
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": sample_calls_list,
-                "records": {"cursor": None, "currentPageSize": len(sample_calls_list)},
-            },
-        )
-
         # Simulate: Get emails from HubSpot/Salesforce MCP
         lead_emails = ["jane@acme.com", "john@example.com"]
 
@@ -164,18 +119,8 @@ class TestCrossMCPSimulation:
         assert "calls" in matching_calls
         assert "matched_emails" in matching_calls
 
-    async def test_domain_filter_workflow(self, mock_httpx_client, sample_calls_list):
+    async def test_domain_filter_workflow(self):
         """Test workflow using domain filtering for cross-MCP joins."""
-        mock_httpx_client.reset()
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": sample_calls_list,
-                "records": {"cursor": None, "currentPageSize": len(sample_calls_list)},
-            },
-        )
-
         # Simulate: Get company domains from CRM
         company_domains = ["acme.com"]
 
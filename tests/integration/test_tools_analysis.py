@@ -2,7 +2,16 @@
 
 import pytest
 
-from gong_mcp.tools.analysis import analyze_calls, get_job_results, get_job_status
+from gong_mcp.analysis.jobs import complete_job, create_job, generate_job_id, update_job_progress
+from gong_mcp.gong_client import CALLS_EXTENSIVE_URL, CALLS_TRANSCRIPT_URL
+from gong_mcp.tools.analysis import (
+    _get_job_results_impl,
+    _get_job_status_impl,
+    analyze_calls,
+    get_job_results,
+    get_job_status,
+)
+from tests._utils import JSON_HEADERS
 
 
 @pytest.mark.integration
@@ -10,22 +19,17 @@ from gong_mcp.tools.analysis import analyze_calls, get_job_results, get_job_stat
 class TestAnalyzeCalls:
     """Test analyze_calls tool."""
 
-    async def test_analyze_calls_direct_mode(self, mock_httpx_client, sample_call_data, sample_transcript_data, monkeypatch):
+    async def test_analyze_calls_direct_mode(
+        self, mock_httpx_client, add_calls_response, sample_call_data, sample_transcript_data,
+        direct_threshold
+    ):
         """Test analyze_calls with small dataset (direct mode)."""
-        monkeypatch.setenv("DIRECT_LLM_TOKEN_LIMIT", "150")  # 150K
+        direct_threshold(150)  # 150K
         
-        mock_httpx_client.reset()
+        add_calls_response([sample_call_data])
         mock_httpx_client.add_response(
             method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": [sample_call_data],
-                "records": {"cursor": None, "currentPageSize": 1},
-            },
-        )
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/transcript",
+            url=CALLS_TRANSCRIPT_URL,
             json={"callTranscripts": [sample_transcript_data]},
         )
 
@@ -40,32 +44,76 @@ class TestAnalyzeCalls:
         assert "call_count" in result
         assert "total_tokens" in result
 
-    async def test_analyze_calls_async_mode(self, mock_httpx_client, sample_call_data, sample_transcript_data, monkeypatch, temp_jobs_dir):
-        """Test analyze_calls with large dataset (async mode)."""
-        monkeypatch.setenv("DIRECT_LLM_TOKEN_LIMIT", "1")  # 1K - very low to trigger async
-        monkeypatch.setenv("ANTHROPIC_API_KEY", "test_anthropic_key")  # required for async path
-        
-        large_transcript = sample_transcript_data.copy()
-        large_transcript["transcript"] = [
-            {
-                "speakerId": "speaker_1",
-                "sentences": [{"start": i * 1000, "text": "x" * 1000} for i in range(100)]
-            }
-        ]
-        
-        mock_httpx_client.reset()
+    async def test_analyze_calls_dedupes_transcript_requests(
+        self, mock_httpx_client, sample_call_data, sample_transcript_data, direct_threshold
+    ):
+        """Duplicate calls are analyzed once, with a single transcript request per call ID."""
+        direct_threshold(150)  # 150K
+
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_EXTENSIVE_URL,
+            json={
+                "calls": [sample_call_data, sample_call_data],
+                "records": {"cursor": None, "currentPageSize": 2},
+            },
+        )
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_TRANSCRIPT_URL,
+            match_json={"filter": {"callIds": [sample_call_data["metaData"]["id"]]}},
+            json={"callTranscripts": [sample_transcript_data, sample_transcript_data]},
+        )
+
+        result = await analyze_calls(from_date="2024-01-01", to_date="2024-01-31")
+
+        assert result["mode"] == "direct"
+        assert result["call_count"] == 1
+
+    async def test_analyze_calls_keeps_calls_without_id(
+        self, mock_httpx_client, sample_call_data, sample_transcript_data, direct_threshold
+    ):
+        """Calls without a metaData.id are kept, untranscribed, instead of dropped."""
+        direct_threshold(150)  # 150K
+        untracked = {**sample_call_data, "metaData": {"title": "No ID Call"}}
+
         mock_httpx_client.add_response(
             method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
+            url=CALLS_EXTENSIVE_URL,
             json={
-                "calls": [sample_call_data],
-                "records": {"cursor": None, "currentPageSize": 1},
+                "calls": [sample_call_data, untracked],
+                "records": {"cursor": None, "currentPageSize": 2},
             },
         )
         mock_httpx_client.add_response(
             method="POST",
-            url="https://api.gong.io/v2/calls/transcript",
-            json={"callTranscripts": [large_transcript]},
+            url=CALLS_TRANSCRIPT_URL,
+            match_json={"filter": {"callIds": [sample_call_data["metaData"]["id"]]}},
+            json={"callTranscripts": [sample_transcript_data]},
+        )
+
+        result = await analyze_calls(from_date="2024-01-01", to_date="2024-01-31")
+
+        assert result["call_count"] == 2
+        no_id = next(
+            t for t in result["transcripts"] if t["metadata"]["title"] == "No ID Call"
+        )
+        assert no_id["conversation"] == []
+
+    async def test_analyze_calls_async_mode(
+        self, mock_httpx_client, add_calls_response, sample_call_data, large_transcript_body,
+        direct_threshold, monkeypatch, temp_jobs_dir, wait_for_background_jobs
+    ):
+        """Test analyze_calls with large dataset (async mode)."""
+        direct_threshold(1)  # 1K - very low to trigger async
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test_anthropic_key")  # required for async path
+        
+        add_calls_response([sample_call_data])
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_TRANSCRIPT_URL,
+            content=large_transcript_body,
+            headers=JSON_HEADERS,
         )
         # Async job runs in background and calls Anthropic API
         mock_httpx_client.add_response(
@@ -88,34 +136,22 @@ class TestAnalyzeCalls:
         assert "estimated_batches" in result
         assert "estimated_minutes" in result
 
+        await wait_for_background_jobs()
+
     async def test_analyze_calls_async_returns_error_when_no_anthropic_key(
-        self, mock_httpx_client, sample_call_data, sample_transcript_data, monkeypatch
+        self, mock_httpx_client, add_calls_response, sample_call_data, large_transcript_body,
+        direct_threshold, monkeypatch
     ):
         """When tokens exceed threshold but ANTHROPIC_API_KEY is missing, return informative error (no async job)."""
-        monkeypatch.setenv("DIRECT_LLM_TOKEN_LIMIT", "1")  # 1K - would normally trigger async
+        direct_threshold(1)  # 1K - would normally trigger async
         monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
 
-        large_transcript = sample_transcript_data.copy()
-        large_transcript["transcript"] = [
-            {
-                "speakerId": "speaker_1",
-                "sentences": [{"start": i * 1000, "text": "x" * 1000} for i in range(100)],
-            }
-        ]
-
-        mock_httpx_client.reset()
+        add_calls_response([sample_call_data])
         mock_httpx_client.add_response(
             method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": [sample_call_data],
-                "records": {"cursor": None, "currentPageSize": 1},
-            },
-        )
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/transcript",
-            json={"callTranscripts": [large_transcript]},
+            url=CALLS_TRANSCRIPT_URL,
+            content=large_transcript_body,
+            headers=JSON_HEADERS,
         )
 
         result = await analyze_calls(
@@ -131,11 +167,8 @@ class TestAnalyzeCalls:
         assert result["call_count"] == 1
         assert result["total_tokens"] > 0
 
-    async def test_analyze_calls_returns_error_when_gong_keys_missing(self, monkeypatch):
+    async def test_analyze_calls_returns_error_when_gong_keys_missing(self, no_gong_creds):
         """When Gong credentials are missing, return informative error before any API call."""
-        monkeypatch.delenv("GONG_ACCESS_KEY", raising=False)
-        monkeypatch.delenv("GONG_ACCESS_KEY_SECRET", raising=False)
-
         result = await analyze_calls(
             from_date="2024-01-01",
             to_date="2024-01-31",
@@ -145,22 +178,17 @@ class TestAnalyzeCalls:
         assert "error" in result
         assert "GONG_ACCESS_KEY" in result["error"]
 
-    async def test_analyze_calls_with_call_ids(self, mock_httpx_client, sample_call_data, sample_transcript_data, monkeypatch):
+    async def test_analyze_calls_with_call_ids(
+        self, mock_httpx_client, add_calls_response, sample_call_data, sample_transcript_data,
+        direct_threshold
+    ):
         """Test analyze_calls with specific call IDs."""
-        monkeypatch.setenv("DIRECT_LLM_TOKEN_LIMIT", "150")  # 150K
+        direct_threshold(150)  # 150K
         
-        mock_httpx_client.reset()
+        add_calls_response([sample_call_data])
         mock_httpx_client.add_response(
             method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": [sample_call_data],
-                "records": {"cursor": None, "currentPageSize": 1},
-            },
-        )
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/transcript",
+            url=CALLS_TRANSCRIPT_URL,
             json={"callTranscripts": [sample_transcript_data]},
         )
 
@@ -174,10 +202,9 @@ class TestAnalyzeCalls:
 
     async def test_analyze_calls_no_calls_found(self, mock_httpx_client):
         """Test analyze_calls when no calls match criteria."""
-        mock_httpx_client.reset()
         mock_httpx_client.add_response(
             method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
+            url=CALLS_EXTENSIVE_URL,
             json={"calls": [], "records": {"cursor": None, "currentPageSize": 0}},
         )
 
@@ -191,91 +218,78 @@ class TestAnalyzeCalls:
         assert "No calls found" in result["error"]
 
 
+def _setup_job(setup):
+    """Create a job in the given state and return its ID."""
+    if setup == "missing":
+        return "nonexistent_job"
+
+    job_id = generate_job_id()
+    create_job(
+        job_id=job_id,
+        call_count=10,
+        estimated_batches=4,
+        estimated_minutes=5,
+        prompt="Test",
+    )
+    if setup == "running":
+        update_job_progress(job_id, current_batch=2, total_batches=4, message="Processing...")
+    elif setup == "complete":
+        results = {
+            "job_id": job_id,
+            "total_calls": 10,
+            "total_batches": 4,
+            "total_cost": 0.10,
+            "batch_results": [],
+        }
+        complete_job(job_id, results, total_cost=0.10)
+    return job_id
+
+
 @pytest.mark.integration
 class TestGetJobStatus:
     """Test get_job_status tool."""
 
-    @pytest.mark.asyncio
-    async def test_get_job_status_pending(self, temp_jobs_dir):
-        """Test getting status for pending job."""
-        from gong_mcp.analysis.jobs import create_job, generate_job_id
-        
-        job_id = generate_job_id()
-        create_job(
-            job_id=job_id,
-            call_count=10,
-            estimated_batches=2,
-            estimated_minutes=3,
-            prompt="Test",
-        )
-
-        result = await get_job_status(job_id)
+    @pytest.mark.parametrize(
+        "setup,expected_status,expected_pct",
+        [
+            ("pending", "pending", 0),
+            ("running", "running", 50),
+            ("complete", "complete", 100),
+            ("missing", None, None),
+        ],
+    )
+    def test_get_job_status(self, in_memory_jobs, setup, expected_status, expected_pct):
+        """Test getting status for jobs in each state, including non-existent jobs."""
+        job_id = _setup_job(setup)
+
+        result = _get_job_status_impl(job_id)
+
+        if expected_status is None:
+            assert "error" in result
+            assert "not found" in result["error"].lower()
+            return
 
         assert result["job_id"] == job_id
-        assert result["status"] == "pending"
-        assert result["progress_percent"] == 0
+        assert result["status"] == expected_status
+        assert result["progress_percent"] == expected_pct
+        if setup == "running":
+            assert result["current_batch"] == 2
+            assert result["total_batches"] == 4
 
     @pytest.mark.asyncio
-    async def test_get_job_status_running(self, temp_jobs_dir):
-        """Test getting status for running job."""
-        from gong_mcp.analysis.jobs import create_job, generate_job_id, update_job_progress
-        
-        job_id = generate_job_id()
-        create_job(
-            job_id=job_id,
-            call_count=10,
-            estimated_batches=4,
-            estimated_minutes=5,
-            prompt="Test",
-        )
-        update_job_progress(job_id, current_batch=2, total_batches=4, message="Processing...")
+    async def test_get_job_status_async_wrapper(self, in_memory_jobs):
+        """Test that the async tool returns the sync core's result."""
+        job_id = _setup_job("running")
 
-        result = await get_job_status(job_id)
-
-        assert result["status"] == "running"
-        assert result["progress_percent"] == 50
-        assert result["current_batch"] == 2
-        assert result["total_batches"] == 4
-
-    @pytest.mark.asyncio
-    async def test_get_job_status_complete(self, temp_jobs_dir):
-        """Test getting status for completed job."""
-        from gong_mcp.analysis.jobs import complete_job, create_job, generate_job_id
-        
-        job_id = generate_job_id()
-        create_job(
-            job_id=job_id,
-            call_count=10,
-            estimated_batches=2,
-            estimated_minutes=3,
-            prompt="Test",
-        )
-        results = {"job_id": job_id, "total_calls": 10, "total_batches": 2, "total_cost": 0.10, "batch_results": []}
-        complete_job(job_id, results, total_cost=0.10)
-
-        result = await get_job_status(job_id)
-
-        assert result["status"] == "complete"
-        assert result["progress_percent"] == 100
-
-    @pytest.mark.asyncio
-    async def test_get_job_status_nonexistent(self, temp_jobs_dir):
-        """Test getting status for non-existent job."""
-        result = await get_job_status("nonexistent_job")
-
-        assert "error" in result
-        assert "not found" in result["error"].lower()
+        assert await get_job_status(job_id) == _get_job_status_impl(job_id)
 
 
 @pytest.mark.integration
 class TestGetJobResults:
     """Test get_job_results tool."""
 
-    @pytest.mark.asyncio
-    async def test_get_job_results_complete(self, temp_jobs_dir):
+    def test_get_job_results_complete(self, in_memory_jobs):
         """Test getting results for completed job."""
-        from gong_mcp.analysis.jobs import complete_job, create_job, generate_job_id
-        
         job_id = generate_job_id()
         create_job(
             job_id=job_id,
@@ -293,18 +307,15 @@ class TestGetJobResults:
         }
         complete_job(job_id, results, total_cost=0.10)
 
-        result = await get_job_results(job_id)
+        result = _get_job_results_impl(job_id)
 
         assert result["status"] == "complete"
         assert result["total_calls"] == 10
         assert result["total_batches"] == 2
         assert "batch_results" in result
 
-    @pytest.mark.asyncio
-    async def test_get_job_results_incomplete(self, temp_jobs_dir):
+    def test_get_job_results_incomplete(self, in_memory_jobs):
         """Test getting results for incomplete job."""
-        from gong_mcp.analysis.jobs import create_job, generate_job_id
-        
         job_id = generate_job_id()
         create_job(
             job_id=job_id,
@@ -314,15 +325,21 @@ class TestGetJobResults:
             prompt="Test",
         )
 
-        result = await get_job_results(job_id)
+        result = _get_job_results_impl(job_id)
 
         assert "error" in result
         assert "not complete" in result["error"].lower()
 
-    @pytest.mark.asyncio
-    async def test_get_job_results_nonexistent(self, temp_jobs_dir):
+    def test_get_job_results_nonexistent(self, in_memory_jobs):
         """Test getting results for non-existent job."""
-        result = await get_job_results("nonexistent_job")
+        result = _get_job_results_impl("nonexistent_job")
 
         assert "error" in result
         assert "not found" in result["error"].lower()
+
+    @pytest.mark.asyncio
+    async def test_get_job_results_async_wrapper(self, in_memory_jobs):
+        """Test that the async tool returns the sync core's result."""
+        job_id = _setup_job("complete")
+
+        assert await get_job_results(job_id) == _get_job_results_impl(job_id)
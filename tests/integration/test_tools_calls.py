@@ -1,104 +1,62 @@
 """Integration tests for call-related tools."""
 
+import asyncio
+
 import pytest
 
+from gong_mcp.gong_client import CALLS_EXTENSIVE_URL
 from gong_mcp.tools.calls import get_transcript, list_calls, search_calls
+from tests._utils import extract_call_ids
+
+TRANSCRIPT_PATH = "/v2/calls/transcript"
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-class TestListCalls:
-    """Test list_calls tool."""
-
-    async def test_list_calls_default_range(self, mock_httpx_client, sample_calls_list):
-        """Test list_calls with default date range."""
-        mock_httpx_client.reset()
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": sample_calls_list,
-                "records": {"cursor": None, "currentPageSize": len(sample_calls_list)},
-            },
-        )
-
-        result = await list_calls()
-
-        assert "calls" in result
-        assert "total_count" in result
-        assert "from_date" in result
-        assert "to_date" in result
-        assert result["total_count"] > 0
-
-    async def test_list_calls_custom_date_range(self, mock_httpx_client, sample_calls_list):
-        """Test list_calls with custom date range."""
-        mock_httpx_client.reset()
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": sample_calls_list,
-                "records": {"cursor": None, "currentPageSize": len(sample_calls_list)},
-            },
-        )
-
-        result = await list_calls(
-            from_date="2024-01-01",
-            to_date="2024-01-31",
-            limit=10
-        )
-
-        assert result["from_date"] == "2024-01-01"
-        assert result["to_date"] == "2024-01-31"
-        assert len(result["calls"]) <= 10
-
-    async def test_list_calls_returns_error_when_gong_keys_missing(self, monkeypatch):
+class TestMissingGongCredentials:
+    """Test that call tools fail fast without Gong credentials."""
+
+    @pytest.mark.parametrize(
+        "tool,args",
+        [
+            (list_calls, {"from_date": "2024-01-01", "to_date": "2024-01-31"}),
+            (get_transcript, {"call_id": "call_12345"}),
+            (search_calls, {"from_date": "2024-01-01", "to_date": "2024-01-31"}),
+        ],
+    )
+    async def test_returns_error_when_gong_keys_missing(self, no_gong_creds, tool, args):
         """When Gong credentials are missing, return informative error (no API call)."""
-        monkeypatch.delenv("GONG_ACCESS_KEY", raising=False)
-        monkeypatch.delenv("GONG_ACCESS_KEY_SECRET", raising=False)
-
-        result = await list_calls(from_date="2024-01-01", to_date="2024-01-31")
+        result = await tool(**args)
 
         assert "error" in result
         assert "GONG_ACCESS_KEY" in result["error"]
         assert "calls" not in result
 
-    async def test_list_calls_limit(self, mock_httpx_client, sample_calls_list):
-        """Test that list_calls respects limit."""
-        mock_httpx_client.reset()
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": sample_calls_list * 2,
-                "records": {"cursor": None, "currentPageSize": 10},
-            },
-        )
-
-        result = await list_calls(limit=3)
 
-        assert len(result["calls"]) == 3
-        assert result["total_count"] == 3
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestListCalls:
+    """Test list_calls tool."""
 
-    async def test_list_calls_participant_metadata(self, mock_httpx_client, sample_calls_list):
-        """Test that list_calls includes participant metadata."""
-        mock_httpx_client.reset()
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": sample_calls_list,
-                "records": {"cursor": None, "currentPageSize": len(sample_calls_list)},
-            },
+    async def test_list_calls_batch(self, calls_list_page):
+        """Run the independent list_calls cases concurrently and check each."""
+        default, custom, limited = await asyncio.gather(
+            list_calls(),
+            list_calls(from_date="2024-01-01", to_date="2024-01-31", limit=10),
+            list_calls(limit=3),
         )
 
-        result = await list_calls()
+        assert {"calls", "total_count", "from_date", "to_date"} <= default.keys()
+        assert default["total_count"] > 0
+        call = default["calls"][0]
+        assert {"internal", "external"} <= call["participants"].keys()
+
+        assert custom["from_date"] == "2024-01-01"
+        assert custom["to_date"] == "2024-01-31"
+        assert len(custom["calls"]) <= 10
 
-        assert len(result["calls"]) > 0
-        call = result["calls"][0]
-        assert "participants" in call
-        assert "internal" in call["participants"]
-        assert "external" in call["participants"]
+        assert len(limited["calls"]) == 3
+        assert limited["total_count"] == 3
 
 
 @pytest.mark.integration
@@ -106,210 +64,75 @@ class TestListCalls:
 class TestGetTranscript:
     """Test get_transcript tool."""
 
-    async def test_get_transcript_returns_error_when_gong_keys_missing(self, monkeypatch):
-        """When Gong credentials are missing, return informative error (no API call)."""
-        monkeypatch.delenv("GONG_ACCESS_KEY", raising=False)
-        monkeypatch.delenv("GONG_ACCESS_KEY_SECRET", raising=False)
-
-        result = await get_transcript("call_12345")
-
-        assert "error" in result
-        assert "GONG_ACCESS_KEY" in result["error"]
-
-    async def test_get_transcript_text_format(self, mock_httpx_client, sample_call_data, sample_transcript_data):
-        """Test get_transcript with text format."""
-        mock_httpx_client.reset()
-        # Only mock transcript endpoint - no longer needs to list all calls first
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/transcript",
-            json={"callTranscripts": [sample_transcript_data]},
-        )
-
-        result = await get_transcript("call_12345", format="text")
-
-        assert "call_id" in result
-        assert "transcript" in result
-        assert isinstance(result["transcript"], str)
-
-    async def test_get_transcript_json_format(self, mock_httpx_client, sample_call_data, sample_transcript_data):
-        """Test get_transcript with JSON format."""
-        mock_httpx_client.reset()
-        # Only mock transcript endpoint - no longer needs to list all calls first
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/transcript",
-            json={"callTranscripts": [sample_transcript_data]},
-        )
+    @pytest.mark.parametrize(
+        "call_id,fmt",
+        [
+            ("call_12345", "text"),
+            ("call_12345", "json"),
+            # Real call ID from a production bug: the call was beyond the
+            # 2000-call pagination limit when transcripts were found by listing
+            ("5010460356281153960", "text"),
+        ],
+    )
+    async def test_get_transcript_fetches_directly(
+        self, mock_transport, sample_transcript_data, call_id, fmt
+    ):
+        """
+        REGRESSION TEST: get_transcript fetches the transcript directly by call_id.
 
-        result = await get_transcript("call_12345", format="json")
+        The old implementation listed ALL calls from 2020 to present, searched
+        them for the target call, and failed once the call was beyond the
+        pagination limit. Only /calls/transcript is routed here, so any
+        request to /calls/extensive fails the test.
+        """
+        mock_transport["POST", TRANSCRIPT_PATH] = {
+            "callTranscripts": [{**sample_transcript_data, "callId": call_id}]
+        }
 
-        assert "metadata" in result
-        assert "conversation" in result
+        result = await get_transcript(call_id, format=fmt)
 
-    async def test_get_transcript_call_not_found(self, mock_httpx_client):
+        assert "error" not in result
+        if fmt == "json":
+            assert result["metadata"]["call_id"] == call_id
+            assert "conversation" in result
+        else:
+            assert result["call_id"] == call_id
+            assert isinstance(result["transcript"], str)
+
+    async def test_get_transcript_call_not_found(self, mock_transport):
         """Test get_transcript when call not found."""
-        mock_httpx_client.reset()
         # Mock transcript endpoint returning no transcripts
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/transcript",
-            json={"callTranscripts": []},
-        )
+        mock_transport["POST", TRANSCRIPT_PATH] = {"callTranscripts": []}
 
         result = await get_transcript("nonexistent_call")
 
         assert "error" in result
 
-    async def test_get_transcript_fetches_directly_without_listing_all_calls(
-        self, mock_httpx_client, sample_transcript_data
-    ):
-        """
-        REGRESSION TEST: Verify get_transcript fetches transcript directly by call_id.
-        
-        This test would have caught the pagination bug where the old implementation:
-        1. Fetched ALL calls from 2020 to present (hitting pagination limits)
-        2. Searched through results to find the target call
-        3. Failed when target call was beyond the 2000-call pagination limit
-        
-        The fix: Fetch transcript directly using the /calls/transcript endpoint
-        which accepts call_id without needing to find the call first.
-        """
-        mock_httpx_client.reset()
-        
-        # IMPORTANT: We do NOT mock /calls/extensive - this verifies the code
-        # no longer calls that endpoint. If it did, the test would fail with
-        # an unexpected request error.
-        
-        # Only mock the transcript endpoint (the correct direct approach)
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/transcript",
-            json={"callTranscripts": [sample_transcript_data]},
-        )
-
-        result = await get_transcript("call_12345", format="text")
-
-        # Should succeed by fetching transcript directly
-        assert "error" not in result
-        assert "transcript" in result
-        assert result["call_id"] == "call_12345"
-
-    async def test_get_transcript_handles_pagination_edge_case(
-        self, mock_httpx_client, sample_transcript_data
-    ):
-        """
-        REGRESSION TEST: Simulates the real-world scenario that caused the bug.
-        
-        Scenario: User has 3000+ calls in Gong. The target call exists but would
-        be beyond page 20 (2000 calls limit) if we tried to list all calls first.
-        
-        Old behavior: Would return "Call not found" despite the call existing.
-        New behavior: Fetches transcript directly, bypassing the listing entirely.
-        """
-        mock_httpx_client.reset()
-        
-        # Mock a call that exists in Gong but would be beyond pagination limits
-        target_call_id = "5010460356281153960"  # Real call ID from production bug
-        
-        transcript_for_target = sample_transcript_data.copy()
-        transcript_for_target["callId"] = target_call_id
-        
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/transcript",
-            json={"callTranscripts": [transcript_for_target]},
-        )
-
-        result = await get_transcript(target_call_id, format="text")
-
-        # Should succeed - the transcript endpoint works directly with call_id
-        assert "error" not in result
-        assert result["call_id"] == target_call_id
-        assert "transcript" in result
-
 
 @pytest.mark.integration
 @pytest.mark.asyncio
 class TestSearchCalls:
     """Test search_calls tool."""
 
-    async def test_search_calls_returns_error_when_gong_keys_missing(self, monkeypatch):
-        """When Gong credentials are missing, return informative error (no API call)."""
-        monkeypatch.delenv("GONG_ACCESS_KEY", raising=False)
-        monkeypatch.delenv("GONG_ACCESS_KEY_SECRET", raising=False)
-
-        result = await search_calls(from_date="2024-01-01", to_date="2024-01-31")
-
-        assert "error" in result
-        assert "GONG_ACCESS_KEY" in result["error"]
-        assert "calls" not in result
-
-    async def test_search_calls_by_query(self, mock_httpx_client, sample_calls_list):
-        """Test search_calls with text query."""
-        mock_httpx_client.reset()
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": sample_calls_list,
-                "records": {"cursor": None, "currentPageSize": len(sample_calls_list)},
-            },
-        )
-
-        result = await search_calls(query="Call")
-
-        assert "calls" in result
-        assert "filters_applied" in result
-        assert result["filters_applied"]["query"] == "Call"
-
-    async def test_search_calls_by_email(self, mock_httpx_client, sample_calls_list):
-        """Test search_calls with email filter."""
-        mock_httpx_client.reset()
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": sample_calls_list,
-                "records": {"cursor": None, "currentPageSize": len(sample_calls_list)},
-            },
-        )
-
-        result = await search_calls(emails=["jane@acme.com"])
-
-        assert "calls" in result
-        assert "matched_emails" in result
-        assert result["filters_applied"]["emails"] == ["jane@acme.com"]
-
-    async def test_search_calls_by_domain(self, mock_httpx_client, sample_calls_list):
-        """Test search_calls with domain filter."""
-        mock_httpx_client.reset()
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": sample_calls_list,
-                "records": {"cursor": None, "currentPageSize": len(sample_calls_list)},
-            },
-        )
-
-        result = await search_calls(domains=["acme.com"])
+    @pytest.mark.parametrize(
+        "kwargs,expected_key",
+        [
+            ({"query": "Call"}, "query"),
+            ({"emails": ["jane@acme.com"]}, "emails"),
+            ({"domains": ["acme.com"]}, "domains"),
+        ],
+    )
+    async def test_search_calls_by_filter(self, calls_list_page, kwargs, expected_key):
+        """Test search_calls with a single query, email or domain filter."""
+        result = await search_calls(**kwargs)
 
         assert "calls" in result
-        assert result["filters_applied"]["domains"] == ["acme.com"]
+        assert result["filters_applied"][expected_key] == kwargs[expected_key]
+        if expected_key == "emails":
+            assert "matched_emails" in result
 
-    async def test_search_calls_combined_filters(self, mock_httpx_client, sample_calls_list):
+    async def test_search_calls_combined_filters(self, calls_list_page):
         """Test search_calls with combined filters."""
-        mock_httpx_client.reset()
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": sample_calls_list,
-                "records": {"cursor": None, "currentPageSize": len(sample_calls_list)},
-            },
-        )
-
         result = await search_calls(
             query="Call",
             emails=["jane@acme.com"],
@@ -323,19 +146,53 @@ class TestSearchCalls:
         assert result["filters_applied"]["domains"] == ["acme.com"]
         assert len(result["calls"]) <= 5
 
-    async def test_search_calls_default_date_range(self, mock_httpx_client, sample_calls_list):
+    async def test_search_calls_default_date_range(self, calls_list_page):
         """Test search_calls with default date range (30 days)."""
-        mock_httpx_client.reset()
+        result = await search_calls()
+
+        assert "from_date" in result
+        assert "to_date" in result
+
+    async def test_search_calls_query_ignores_case_and_missing_titles(self, mock_httpx_client):
+        """Test that title matching is case-insensitive and tolerates null titles."""
+        calls = [
+            {"metaData": {"id": "c1", "title": "STRASSE Review"}},
+            {"metaData": {"id": "c2", "title": None}},
+            {"metaData": {"id": "c3"}},
+        ]
         mock_httpx_client.add_response(
             method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": sample_calls_list,
-                "records": {"cursor": None, "currentPageSize": len(sample_calls_list)},
-            },
+            url=CALLS_EXTENSIVE_URL,
+            json={"calls": calls, "records": {"cursor": None, "currentPageSize": 3}},
         )
 
-        result = await search_calls()
+        result = await search_calls(query="straße")
 
-        assert "from_date" in result
-        assert "to_date" in result
+        assert extract_call_ids(result) == ["c1"]
+
+    async def test_search_calls_formats_only_returned_calls(self, mock_httpx_client, monkeypatch):
+        """Test that participants are extracted only for calls within the limit."""
+        from gong_mcp.utils import formatters
+
+        calls = [
+            {"metaData": {"id": f"c{i}", "title": "Demo"}, "parties": [{"name": f"p{i}"}]}
+            for i in range(5)
+        ]
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_EXTENSIVE_URL,
+            json={"calls": calls, "records": {"cursor": None, "currentPageSize": 5}},
+        )
+        extracted = []
+        original = formatters.format_participants
+
+        def counting_format(parties):
+            extracted.extend(party["name"] for party in parties)
+            return original(parties)
+
+        monkeypatch.setattr(formatters, "format_participants", counting_format)
+
+        result = await search_calls(query="demo", limit=2)
+
+        assert extract_call_ids(result) == ["c0", "c1"]
+        assert extracted == ["p0", "p1"]
@@ -2,6 +2,7 @@
 
 import pytest
 
+from gong_mcp.gong_client import CALLS_EXTENSIVE_URL
 from gong_mcp.tools.participants import get_call_participants
 
 
@@ -10,28 +11,19 @@ from gong_mcp.tools.participants import get_call_participants
 class TestGetCallParticipants:
     """Test get_call_participants tool."""
 
-    async def test_get_call_participants_returns_error_when_gong_keys_missing(self, monkeypatch):
+    async def test_get_call_participants_returns_error_when_gong_keys_missing(self, no_gong_creds):
         """When Gong credentials are missing, return informative error (no API call)."""
-        monkeypatch.delenv("GONG_ACCESS_KEY", raising=False)
-        monkeypatch.delenv("GONG_ACCESS_KEY_SECRET", raising=False)
-
         result = await get_call_participants(["call_12345"])
 
         assert "error" in result
         assert "GONG_ACCESS_KEY" in result["error"]
         assert "participants_by_call" not in result or result.get("participants_by_call") == {}
 
-    async def test_get_call_participants_single_call(self, mock_httpx_client, sample_call_data):
+    async def test_get_call_participants_single_call(
+        self, mock_httpx_client, add_calls_response, sample_call_data
+    ):
         """Test getting participants for a single call."""
-        mock_httpx_client.reset()
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": [sample_call_data],
-                "records": {"cursor": None, "currentPageSize": 1},
-            },
-        )
+        add_calls_response([sample_call_data])
 
         result = await get_call_participants(["call_12345"])
 
@@ -40,22 +32,17 @@ class TestGetCallParticipants:
         assert result["found_count"] == 1
         assert result["not_found_count"] == 0
 
-    async def test_get_call_participants_multiple_calls(self, mock_httpx_client, sample_call_data):
+    async def test_get_call_participants_multiple_calls(
+        self, mock_httpx_client, add_calls_response, sample_call_data
+    ):
         """Test getting participants for multiple calls."""
-        import copy
-        calls = [copy.deepcopy(sample_call_data) for _ in range(3)]
-        for i, call in enumerate(calls):
-            call["metaData"]["id"] = f"call_{i}"
+        # Only metaData.id changes, so merge that level instead of deep-copying
+        calls = [
+            {**sample_call_data, "metaData": {**sample_call_data["metaData"], "id": f"call_{i}"}}
+            for i in range(3)
+        ]
 
-        mock_httpx_client.reset()
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": calls,
-                "records": {"cursor": None, "currentPageSize": len(calls)},
-            },
-        )
+        add_calls_response(calls)
 
         result = await get_call_participants(["call_0", "call_1", "call_2"])
 
@@ -64,10 +51,9 @@ class TestGetCallParticipants:
 
     async def test_get_call_participants_not_found(self, mock_httpx_client):
         """Test getting participants for non-existent calls."""
-        mock_httpx_client.reset()
         mock_httpx_client.add_response(
             method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
+            url=CALLS_EXTENSIVE_URL,
             json={"calls": [], "records": {"cursor": None, "currentPageSize": 0}},
         )
 
@@ -77,17 +63,11 @@ class TestGetCallParticipants:
         assert result["not_found_count"] == 1
         assert "nonexistent_call" in result["not_found_call_ids"]
 
-    async def test_get_call_participants_mixed(self, mock_httpx_client, sample_call_data):
+    async def test_get_call_participants_mixed(
+        self, mock_httpx_client, add_calls_response, sample_call_data
+    ):
         """Test getting participants for mix of found and not found calls."""
-        mock_httpx_client.reset()
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": [sample_call_data],
-                "records": {"cursor": None, "currentPageSize": 1},
-            },
-        )
+        add_calls_response([sample_call_data])
 
         result = await get_call_participants(["call_12345", "nonexistent_call"])
 
@@ -103,17 +83,11 @@ class TestGetCallParticipants:
         assert "error" in result
         assert result["participants_by_call"] == {}
 
-    async def test_get_call_participants_structure(self, mock_httpx_client, sample_call_data):
+    async def test_get_call_participants_structure(
+        self, mock_httpx_client, add_calls_response, sample_call_data
+    ):
         """Test that participant structure is correct."""
-        mock_httpx_client.reset()
-        mock_httpx_client.add_response(
-            method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
-            json={
-                "calls": [sample_call_data],
-                "records": {"cursor": None, "currentPageSize": 1},
-            },
-        )
+        add_calls_response([sample_call_data])
 
         result = await get_call_participants(["call_12345"])
 
@@ -122,3 +96,65 @@ class TestGetCallParticipants:
         assert "external" in participants
         assert isinstance(participants["internal"], list)
         assert isinstance(participants["external"], list)
+
+    async def test_get_call_participants_requests_only_given_ids(
+        self, mock_httpx_client, sample_call_data
+    ):
+        """Test that calls are fetched by ID instead of by date range."""
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_EXTENSIVE_URL,
+            match_json={
+                "filter": {"callIds": ["call_12345", "other"]},
+                "contentSelector": {"exposedFields": {"parties": True}},
+            },
+            json={"calls": [sample_call_data], "records": {"currentPageSize": 1}},
+        )
+
+        result = await get_call_participants(["call_12345", "other", "call_12345"])
+
+        assert "call_12345" in result["participants_by_call"]
+        assert result["not_found_call_ids"] == ["other"]
+
+    async def test_get_call_participants_gong_404_means_not_found(self, mock_httpx_client):
+        """Test that Gong's 404 for unknown IDs is reported as not found."""
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_EXTENSIVE_URL,
+            status_code=404,
+            json={"errors": ["No calls found corresponding to the provided filters"]},
+        )
+
+        result = await get_call_participants(["missing"])
+
+        assert result["found_count"] == 0
+        assert result["not_found_call_ids"] == ["missing"]
+
+    async def test_get_call_participants_ignores_unrequested_calls(
+        self, mock_httpx_client, sample_call_data
+    ):
+        """Test that calls returned but not requested are left out."""
+        extra = {**sample_call_data, "metaData": {"id": "unrequested"}}
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_EXTENSIVE_URL,
+            json={"calls": [extra, sample_call_data], "records": {}},
+        )
+
+        result = await get_call_participants(["call_12345"])
+
+        assert list(result["participants_by_call"]) == ["call_12345"]
+
+    async def test_get_call_participants_first_duplicate_wins(
+        self, add_calls_response, sample_call_data
+    ):
+        """Test that the first returned copy of a call is used when IDs repeat."""
+        duplicate = {**sample_call_data, "parties": []}
+        add_calls_response([sample_call_data, duplicate])
+
+        result = await get_call_participants(["call_12345", "call_12345"])
+
+        participants = result["participants_by_call"]["call_12345"]
+        assert participants["external"] == [{"name": "Jane Smith", "email": "jane@acme.com"}]
+        assert result["found_count"] == 2
+        assert result["not_found_count"] == 0
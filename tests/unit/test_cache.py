@@ -0,0 +1,151 @@
+"""Unit tests for the response cache."""
+
+import asyncio
+
+import pytest
+
+from gong_mcp.utils import cache as cache_module
+from gong_mcp.utils.cache import TTLCache
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    """Test TTLCache get/set behaviour."""
+
+    def test_set_and_get(self):
+        """Test that cached values are returned until they expire."""
+        cache = TTLCache()
+        cache.set("a", {"value": 1}, ttl=60)
+        assert cache.get("a") == {"value": 1}
+
+    def test_expired_entry_is_dropped(self, monkeypatch):
+        """Test that expired entries are treated as missing."""
+        cache = TTLCache()
+        now = 1000.0
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now)
+        cache.set("a", "value", ttl=10)
+
+        now = 1011.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.get("a")
+        cache.set("c", 3, ttl=60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_byte_bound_eviction(self):
+        """Test that least recently used entries are evicted past max_bytes."""
+        value = "x" * 98  # 100 bytes estimated, with quotes
+        cache = TTLCache(maxsize=10, max_bytes=250)
+        cache.set("a", value, ttl=60)
+        cache.set("b", value, ttl=60)
+        cache.get("a")
+        cache.set("c", value, ttl=60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == value
+        assert cache.get("c") == value
+        assert cache.total_bytes == 200
+
+    def test_oversized_value_not_cached(self):
+        """Test that a value larger than max_bytes is not cached."""
+        cache = TTLCache(max_bytes=50)
+        cache.set("a", "small", ttl=60)
+        cache.set("b", "x" * 100, ttl=60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "small"
+
+    def test_replacing_entry_releases_its_size(self):
+        """Test that overwriting a key does not double count its size."""
+        cache = TTLCache(max_bytes=1000)
+        cache.set("a", "x" * 98, ttl=60)
+        cache.set("a", "x" * 48, ttl=60)
+
+        assert cache.total_bytes == 50
+
+
+@pytest.mark.unit
+class TestGetOrFetch:
+    """Test TTLCache.get_or_fetch behaviour."""
+
+    async def test_concurrent_callers_share_one_fetch(self):
+        """Test that simultaneous requests for a key fetch it once."""
+        cache = TTLCache()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"ok": True}
+
+        results = await asyncio.gather(
+            *(cache.get_or_fetch("k", fetch, ttl=60) for _ in range(5))
+        )
+
+        assert calls == 1
+        assert results == [{"ok": True}] * 5
+
+    async def test_should_cache_rejects_value(self):
+        """Test that rejected values are returned but refetched next time."""
+        cache = TTLCache()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return {"error": "missing"}
+
+        for _ in range(2):
+            result = await cache.get_or_fetch(
+                "k", fetch, ttl=60, should_cache=lambda v: "error" not in v
+            )
+            assert result == {"error": "missing"}
+        assert calls == 2
+
+    async def test_fetch_error_propagates_and_is_not_cached(self):
+        """Test that a failed fetch raises for every waiter and caches nothing."""
+        cache = TTLCache()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            cache.get_or_fetch("k", fetch, ttl=60),
+            cache.get_or_fetch("k", fetch, ttl=60),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert cache.get("k") is None
+
+    async def test_cancelled_caller_does_not_cancel_waiters(self):
+        """Test that cancelling the first caller leaves the shared fetch running."""
+        cache = TTLCache()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return {"ok": True}
+
+        first = asyncio.create_task(cache.get_or_fetch("k", fetch, ttl=60))
+        second = asyncio.create_task(cache.get_or_fetch("k", fetch, ttl=60))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await second == {"ok": True}
+        assert first.cancelled()
+        assert cache.get("k") == {"ok": True}
@@ -6,6 +6,7 @@ from gong_mcp.utils.filters import (
     extract_external_emails,
     filter_calls_by_emails,
     get_matching_call_ids,
+    is_noise_participant,
 )
 
 
@@ -92,6 +93,32 @@ class TestFilterCallsByEmails:
         assert filtered == []
         assert matched == []
 
+    def test_filter_first_matching_party_per_call(self):
+        """Test that each call is kept once, credited to its first match."""
+        calls = [
+            {
+                "id": "call_1",
+                "parties": [
+                    {"emailAddress": None},
+                    {"emailAddress": "Bob@Acme.com"},
+                    {"emailAddress": "jane@acme.com"},
+                ],
+            }
+        ]
+        filtered, matched = filter_calls_by_emails(
+            calls, emails=["jane@acme.com"], domains=["acme.com"]
+        )
+
+        assert filtered == calls
+        assert matched == ["bob@acme.com"]
+
+    def test_filter_domain_uses_last_at_sign(self):
+        """Test that the domain is taken after the last @ of an address."""
+        calls = [{"id": "call_1", "parties": [{"emailAddress": "odd@name@acme.com"}]}]
+        filtered, _ = filter_calls_by_emails(calls, domains=["acme.com"])
+
+        assert filtered == calls
+
 
 @pytest.mark.unit
 class TestExtractExternalEmails:
@@ -144,6 +171,19 @@ class TestExtractExternalEmails:
 
         assert emails == []
 
+    def test_extract_tolerates_null_fields(self):
+        """Test that null emails and affiliations are handled."""
+        calls = [
+            {
+                "parties": [
+                    {"emailAddress": None, "affiliation": "external"},
+                    {"emailAddress": "Jane@Acme.com", "affiliation": None},
+                ]
+            }
+        ]
+
+        assert extract_external_emails(calls) == ["jane@acme.com"]
+
 
 @pytest.mark.unit
 class TestGetMatchingCallIds:
@@ -186,3 +226,27 @@ class TestGetMatchingCallIds:
 
         # Should skip calls without IDs
         assert call_ids == []
+
+
+@pytest.mark.unit
+class TestIsNoiseParticipant:
+    """Test is_noise_participant function."""
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "Merged Audio",
+            "Fireflies.Ai Notetaker",
+            "Fireflies.ai Notetaker",
+            "Fireflies Notetaker (2)",
+            "Notetaker by Fireflies",
+        ],
+    )
+    def test_noise_names(self, name):
+        """Test that recorder bots are treated as noise."""
+        assert is_noise_participant(name)
+
+    @pytest.mark.parametrize("name", ["John Doe", "Fireflies Fan", "Notetaker"])
+    def test_real_participants(self, name):
+        """Test that people are kept."""
+        assert not is_noise_participant(name)
@@ -2,13 +2,17 @@
 
 import pytest
 
+from gong_mcp.utils import formatters
 from gong_mcp.utils.formatters import (
     build_transcript_json,
+    build_transcript_json_with_size,
     build_transcript_text,
+    format_call_summary,
     format_duration,
     format_iso_date,
     format_timestamp,
 )
+from gong_mcp.utils.sizing import estimate_size
 
 
 @pytest.mark.unit
@@ -73,6 +77,12 @@ class TestFormatTimestamp:
         """Test formatting float timestamp."""
         assert format_timestamp(90.7) == "01:30"
 
+    def test_format_timestamp_memoized_by_whole_second(self):
+        """Test that timestamps within the same second share a cache entry."""
+        formatters._format_timestamp_seconds.cache_clear()
+        assert format_timestamp(90.2) == format_timestamp(90.9) == "01:30"
+        assert formatters._format_timestamp_seconds.cache_info().hits == 1
+
 
 @pytest.mark.unit
 class TestFormatIsoDate:
@@ -95,6 +105,13 @@ class TestFormatIsoDate:
         result = format_iso_date("invalid-date")
         assert result == "invalid-date"
 
+    def test_format_iso_date_is_memoized(self):
+        """Test that repeated date strings are parsed once."""
+        format_iso_date.cache_clear()
+        first = format_iso_date("2024-01-15T10:30:00Z")
+        assert format_iso_date("2024-01-15T10:30:00Z") == first
+        assert format_iso_date.cache_info().hits == 1
+
     def test_format_iso_date_empty(self):
         """Test formatting empty date."""
         assert format_iso_date("") == "Unknown"
@@ -152,6 +169,60 @@ class TestBuildTranscriptText:
         # Should not include "Merged Audio" in speaker names
         assert "Merged Audio" not in transcript or "Speaker" in transcript
 
+    def test_build_transcript_text_names_only_fixed_noise_speakers(self):
+        """Test that text mode hides only the exact recorder names, as before."""
+        call_data = {
+            "metaData": {"title": "Test Call"},
+            "parties": [
+                {"name": "Fireflies.Ai Notetaker", "speakerId": "speaker_1"},
+                {"name": "Fireflies.ai Notetaker", "speakerId": "speaker_2"},
+            ],
+        }
+        transcript_data = {
+            "transcript": [
+                {"speakerId": "speaker_1", "sentences": [{"start": 0, "text": "One"}]},
+                {"speakerId": "speaker_2", "sentences": [{"start": 1000, "text": "Two"}]},
+            ]
+        }
+
+        transcript = build_transcript_text(call_data, transcript_data, include_timestamps=False)
+
+        assert "Speaker er_1: One" in transcript
+        assert "Fireflies.ai Notetaker: Two" in transcript
+
+    def test_build_transcript_text_orders_sentences_across_speakers(self):
+        """Test that sentences from all speakers are interleaved by start time."""
+        call_data = {
+            "metaData": {"title": "Test Call"},
+            "parties": [
+                {"name": "Ann", "speakerId": "s1"},
+                {"name": "Bob", "speakerId": "s2"},
+            ],
+        }
+        transcript_data = {
+            "transcript": [
+                {
+                    "speakerId": "s1",
+                    "sentences": [{"start": 0, "text": "a1"}, {"start": 4000, "text": "a3"}],
+                },
+                # Out-of-order sentences within one entry are still placed correctly
+                {
+                    "speakerId": "s2",
+                    "sentences": [{"start": 5000, "text": "b3"}, {"start": 2000, "text": "b2"}],
+                },
+                {
+                    "speakerId": "s1",
+                    "sentences": [{"start": 2000, "text": "a2"}, {"start": 9000, "text": ""}],
+                },
+            ]
+        }
+
+        transcript = build_transcript_text(call_data, transcript_data, include_timestamps=False)
+
+        assert transcript.splitlines()[4:] == [
+            "Ann: a1", "Bob: b2", "Ann: a2", "Ann: a3", "Bob: b3"
+        ]
+
 
 @pytest.mark.unit
 class TestBuildTranscriptJson:
@@ -219,3 +290,58 @@ class TestBuildTranscriptJson:
         # Should not include Fireflies in participants
         internal_names = [p["name"] for p in transcript["participants"]["internal"]]
         assert "Fireflies.Ai Notetaker" not in internal_names
+
+    def test_build_transcript_json_with_size_matches_estimate(
+        self, sample_call_data, sample_transcript_data
+    ):
+        """Test that the size computed while building matches a full walk."""
+        transcript, size = build_transcript_json_with_size(
+            sample_call_data, sample_transcript_data
+        )
+
+        assert transcript == build_transcript_json(sample_call_data, sample_transcript_data)
+        assert size == estimate_size(transcript)
+
+    def test_build_transcript_json_with_size_error(self, sample_call_data):
+        """Test size of a transcript with no conversation."""
+        transcript, size = build_transcript_json_with_size(
+            sample_call_data, {"error": "No transcript found"}
+        )
+
+        assert size == estimate_size(transcript)
+
+    def test_build_transcript_json_maps_speakers_by_any_party_id(self):
+        """Test that transcript speakers resolve through any party ID field."""
+        call_data = {
+            "metaData": {"title": "Test"},
+            "parties": [{"name": "Ann", "userId": 42, "affiliation": "External"}],
+        }
+        transcript_data = {
+            "transcript": [{"speakerId": "42", "sentences": [{"start": 0, "text": "hi"}]}]
+        }
+
+        transcript = build_transcript_json(call_data, transcript_data)
+
+        assert transcript["conversation"][0]["speaker"] == "Ann"
+        assert transcript["conversation"][0]["affiliation"] == "external"
+
+
+@pytest.mark.unit
+class TestFormatCallSummary:
+    """Test format_call_summary function."""
+
+    def test_format_call_summary(self, sample_call_data):
+        """Test the listing fields and participant split of a call."""
+        summary = format_call_summary(sample_call_data)
+
+        assert summary["call_id"] == "call_12345"
+        assert summary["title"] == "Sales Call with Acme Corp"
+        assert summary["participants"]["internal"][0]["email"] == "john@example.com"
+        assert summary["participants"]["external"][0]["email"] == "jane@acme.com"
+
+    def test_format_call_summary_defaults(self):
+        """Test defaults for a call without metadata or parties."""
+        summary = format_call_summary({})
+
+        assert summary["title"] == "Untitled"
+        assert summary["participants"] == {"internal": [], "external": []}
@@ -1,9 +1,21 @@
 """Unit tests for GongClient."""
 
+import base64
+import json
+
+import httpx
 import pytest
 from httpx import HTTPStatusError
+from pytest_httpx import IteratorStream
 
-from gong_mcp.gong_client import GongClient, check_gong_config
+from gong_mcp import gong_client
+from gong_mcp.gong_client import (
+    CALLS_EXTENSIVE_URL,
+    CALLS_TRANSCRIPT_URL,
+    GongClient,
+    check_gong_config,
+    get_gong_credentials,
+)
 
 
 @pytest.mark.unit
@@ -52,6 +64,18 @@ class TestCheckGongConfig:
         assert result is not None
         assert "error" in result
 
+    def test_credentials_are_cached(self, monkeypatch):
+        """Credentials are read once until the cache is cleared."""
+        monkeypatch.setenv("GONG_ACCESS_KEY", "key")
+        monkeypatch.setenv("GONG_ACCESS_KEY_SECRET", "secret")
+        assert get_gong_credentials() == ("key", "secret")
+
+        monkeypatch.delenv("GONG_ACCESS_KEY")
+        assert check_gong_config() is None
+
+        get_gong_credentials.cache_clear()
+        assert check_gong_config() is not None
+
 
 @pytest.mark.unit
 class TestGongClientInitialization:
@@ -87,6 +111,42 @@ class TestGongClientInitialization:
         with pytest.raises(RuntimeError, match="Client not initialized"):
             _ = client.client
 
+    @pytest.mark.asyncio
+    async def test_clients_share_connection_pool(self, mock_httpx_client):
+        """Test that separate GongClient contexts reuse one HTTP client."""
+        async with GongClient() as first:
+            shared = first.client
+        async with GongClient() as second:
+            assert second.client is shared
+        assert not shared.is_closed
+
+    @pytest.mark.asyncio
+    async def test_injected_http_client_is_used(self, mock_httpx_client):
+        """Test that an injected HTTP client replaces the shared one."""
+        injected = httpx.AsyncClient()
+        try:
+            async with GongClient(http_client=injected) as client:
+                assert client.client is injected
+            assert not injected.is_closed
+        finally:
+            await injected.aclose()
+
+    @pytest.mark.asyncio
+    async def test_requests_use_instance_credentials(self, mock_httpx_client):
+        """Test that each request is authenticated with the instance's keys."""
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_TRANSCRIPT_URL,
+            json={"callTranscripts": []},
+        )
+
+        async with GongClient(access_key="k", access_key_secret="s") as client:
+            await client.get_multiple_transcripts(["call_1"])
+
+        request = mock_httpx_client.get_request()
+        expected = base64.b64encode(b"k:s").decode()
+        assert request.headers["Authorization"] == f"Basic {expected}"
+
 
 @pytest.mark.unit
 class TestGongClientSearchCalls:
@@ -95,11 +155,10 @@ class TestGongClientSearchCalls:
     @pytest.mark.asyncio
     async def test_search_calls_success(self, mock_httpx_client, sample_calls_list):
         """Test successful call search."""
-        # Reset and add custom response
-        mock_httpx_client.reset()
+        # Add custom response
         mock_httpx_client.add_response(
             method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
+            url=CALLS_EXTENSIVE_URL,
             json={
                 "calls": sample_calls_list,
                 "records": {
@@ -121,12 +180,11 @@ class TestGongClientSearchCalls:
     @pytest.mark.asyncio
     async def test_search_calls_with_pagination(self, mock_httpx_client):
         """Test call search with pagination cursor."""
-        mock_httpx_client.reset()
         
         # First page
         mock_httpx_client.add_response(
             method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
+            url=CALLS_EXTENSIVE_URL,
             json={
                 "calls": [{"id": "call_1"}],
                 "records": {
@@ -139,7 +197,7 @@ class TestGongClientSearchCalls:
         # Second page
         mock_httpx_client.add_response(
             method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
+            url=CALLS_EXTENSIVE_URL,
             json={
                 "calls": [{"id": "call_2"}],
                 "records": {
@@ -167,10 +225,9 @@ class TestGongClientSearchCalls:
     @pytest.mark.asyncio
     async def test_search_calls_http_error(self, mock_httpx_client):
         """Test handling of HTTP errors."""
-        mock_httpx_client.reset()
         mock_httpx_client.add_response(
             method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
+            url=CALLS_EXTENSIVE_URL,
             status_code=401,
             json={"error": "Unauthorized"},
         )
@@ -190,10 +247,9 @@ class TestGongClientGetAllCalls:
     @pytest.mark.asyncio
     async def test_get_all_calls_single_page(self, mock_httpx_client, sample_calls_list):
         """Test getting all calls from a single page."""
-        mock_httpx_client.reset()
         mock_httpx_client.add_response(
             method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
+            url=CALLS_EXTENSIVE_URL,
             json={
                 "calls": sample_calls_list,
                 "records": {
@@ -211,16 +267,34 @@ class TestGongClientGetAllCalls:
 
         assert len(calls) == 5
 
+    @pytest.mark.asyncio
+    async def test_search_calls_is_cached(self, mock_httpx_client, sample_calls_list):
+        """Test that repeating a date-range query does not refetch it."""
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_EXTENSIVE_URL,
+            json={
+                "calls": sample_calls_list,
+                "records": {"cursor": None, "currentPageSize": len(sample_calls_list)},
+            },
+        )
+
+        async with GongClient() as client:
+            first = await client.search_calls("2024-01-01T00:00:00Z", "2024-01-31T23:59:59Z")
+            second = await client.search_calls("2024-01-01T00:00:00Z", "2024-01-31T23:59:59Z")
+
+        assert second == first
+        assert len(mock_httpx_client.get_requests()) == 1
+
     @pytest.mark.asyncio
     async def test_get_all_calls_multiple_pages(self, mock_httpx_client):
         """Test pagination across multiple pages."""
-        mock_httpx_client.reset()
         
         for i in range(3):
             cursor = f"cursor_{i}" if i < 2 else None
             mock_httpx_client.add_response(
                 method="POST",
-                url="https://api.gong.io/v2/calls/extensive",
+                url=CALLS_EXTENSIVE_URL,
                 json={
                     "calls": [{"id": f"call_{i}", "metaData": {"started": f"2024-01-{i+1:02d}T00:00:00Z"}}],
                     "records": {
@@ -242,13 +316,12 @@ class TestGongClientGetAllCalls:
     @pytest.mark.asyncio
     async def test_get_all_calls_respects_max_pages(self, mock_httpx_client):
         """Test that max_pages limit is respected."""
-        mock_httpx_client.reset()
         
         # Add exactly max_pages responses (2)
         for i in range(2):
             mock_httpx_client.add_response(
                 method="POST",
-                url="https://api.gong.io/v2/calls/extensive",
+                url=CALLS_EXTENSIVE_URL,
                 json={
                     "calls": [{"id": f"call_{i}", "metaData": {"started": "2024-01-01T00:00:00Z"}}],
                     "records": {
@@ -268,6 +341,63 @@ class TestGongClientGetAllCalls:
         # Should stop at max_pages
         assert len(calls) == 2
 
+    @pytest.mark.asyncio
+    async def test_get_all_calls_sorted_most_recent_first(self, mock_httpx_client):
+        """Test ordering across pages, with missing dates last and ties stable."""
+        pages = [
+            [
+                {"id": "a", "metaData": {"started": "2024-01-02T00:00:00Z"}},
+                {"id": "no_date", "metaData": {}},
+            ],
+            [
+                {"id": "b", "metaData": {"started": "2024-01-03T00:00:00Z"}},
+                {"id": "c", "metaData": {"started": "2024-01-02T00:00:00Z"}},
+            ],
+        ]
+        for i, page in enumerate(pages):
+            mock_httpx_client.add_response(
+                method="POST",
+                url=CALLS_EXTENSIVE_URL,
+                json={
+                    "calls": page,
+                    "records": {"cursor": "next" if i == 0 else None, "currentPageSize": 2},
+                },
+            )
+
+        async with GongClient() as client:
+            calls = await client.get_all_calls(
+                from_date="2024-01-01T00:00:00Z",
+                to_date="2024-01-31T23:59:59Z",
+            )
+
+        assert [c["id"] for c in calls] == ["b", "a", "c", "no_date"]
+
+
+@pytest.mark.unit
+class TestGongClientGetCallsByIds:
+    """Test get_calls_by_ids method."""
+
+    @pytest.mark.asyncio
+    async def test_follows_cursor(self, mock_httpx_client):
+        """Test that paged ID lookups follow the cursor."""
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_EXTENSIVE_URL,
+            json={"calls": [{"metaData": {"id": "a"}}], "records": {"cursor": "next"}},
+        )
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_EXTENSIVE_URL,
+            json={"calls": [{"metaData": {"id": "b"}}], "records": {}},
+        )
+
+        async with GongClient() as client:
+            calls = await client.get_calls_by_ids(["a", "b"])
+
+        assert [c["metaData"]["id"] for c in calls] == ["a", "b"]
+        second_body = json.loads(mock_httpx_client.get_requests()[1].content)
+        assert second_body["cursor"] == "next"
+
 
 @pytest.mark.unit
 class TestGongClientExtractParticipants:
@@ -301,6 +431,12 @@ class TestGongClientExtractParticipants:
         assert len(participants["internal"]) == 1
         assert participants["internal"][0]["name"] == "John Doe"
 
+    def test_extract_participants_needs_no_instance(self, sample_call_data):
+        """Test that participants can be extracted without building a client."""
+        participants = GongClient.extract_participants(sample_call_data)
+
+        assert len(participants["internal"]) == 1
+
     def test_extract_participants_no_parties(self):
         """Test handling of calls with no parties."""
         call_data = {"parties": []}
@@ -318,10 +454,9 @@ class TestGongClientSearchCallsByEmails:
     @pytest.mark.asyncio
     async def test_search_by_exact_email(self, mock_httpx_client, sample_calls_list):
         """Test filtering by exact email match."""
-        mock_httpx_client.reset()
         mock_httpx_client.add_response(
             method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
+            url=CALLS_EXTENSIVE_URL,
             json={
                 "calls": sample_calls_list,
                 "records": {"cursor": None, "currentPageSize": len(sample_calls_list)},
@@ -340,10 +475,9 @@ class TestGongClientSearchCallsByEmails:
     @pytest.mark.asyncio
     async def test_search_by_domain(self, mock_httpx_client, sample_calls_list):
         """Test filtering by email domain."""
-        mock_httpx_client.reset()
         mock_httpx_client.add_response(
             method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
+            url=CALLS_EXTENSIVE_URL,
             json={
                 "calls": sample_calls_list,
                 "records": {"cursor": None, "currentPageSize": len(sample_calls_list)},
@@ -362,10 +496,9 @@ class TestGongClientSearchCallsByEmails:
     @pytest.mark.asyncio
     async def test_search_no_emails_or_domains(self, mock_httpx_client, sample_calls_list):
         """Test that no filtering occurs when no emails/domains provided."""
-        mock_httpx_client.reset()
         mock_httpx_client.add_response(
             method="POST",
-            url="https://api.gong.io/v2/calls/extensive",
+            url=CALLS_EXTENSIVE_URL,
             json={
                 "calls": sample_calls_list,
                 "records": {"cursor": None, "currentPageSize": len(sample_calls_list)},
@@ -380,6 +513,33 @@ class TestGongClientSearchCallsByEmails:
 
         assert len(filtered) == len(sample_calls_list)
 
+    @pytest.mark.asyncio
+    async def test_search_matches_case_insensitively_and_skips_missing(self, mock_httpx_client):
+        """Test email/domain matching ignores case and tolerates null addresses."""
+        calls = [
+            {
+                "id": "by_email",
+                "parties": [{"emailAddress": None}, {"emailAddress": "Jane@Other.com"}],
+            },
+            {"id": "by_domain", "parties": [{"emailAddress": "bob@ACME.com"}]},
+            {"id": "no_match", "parties": [{"emailAddress": "x@acme.com.evil"}, {}]},
+        ]
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_EXTENSIVE_URL,
+            json={"calls": calls, "records": {"cursor": None, "currentPageSize": 3}},
+        )
+
+        async with GongClient() as client:
+            filtered = await client.search_calls_by_emails(
+                from_date="2024-01-01T00:00:00Z",
+                to_date="2024-01-31T23:59:59Z",
+                emails=["jane@other.com"],
+                domains=["@acme.com"],
+            )
+
+        assert sorted(c["id"] for c in filtered) == ["by_domain", "by_email"]
+
 
 @pytest.mark.unit
 class TestGongClientGetCallTranscript:
@@ -388,10 +548,9 @@ class TestGongClientGetCallTranscript:
     @pytest.mark.asyncio
     async def test_get_call_transcript_success(self, mock_httpx_client, sample_transcript_data):
         """Test successful transcript retrieval."""
-        mock_httpx_client.reset()
         mock_httpx_client.add_response(
             method="POST",
-            url="https://api.gong.io/v2/calls/transcript",
+            url=CALLS_TRANSCRIPT_URL,
             json={"callTranscripts": [sample_transcript_data]},
         )
 
@@ -401,13 +560,28 @@ class TestGongClientGetCallTranscript:
         assert transcript["callId"] == "call_12345"
         assert "transcript" in transcript
 
+    @pytest.mark.asyncio
+    async def test_get_call_transcript_is_cached(self, mock_httpx_client, sample_transcript_data):
+        """Test that a repeated transcript lookup is served from the cache."""
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_TRANSCRIPT_URL,
+            json={"callTranscripts": [sample_transcript_data]},
+        )
+
+        async with GongClient() as client:
+            first = await client.get_call_transcript("call_12345")
+            second = await client.get_call_transcript("call_12345")
+
+        assert second == first
+        assert len(mock_httpx_client.get_requests()) == 1
+
     @pytest.mark.asyncio
     async def test_get_call_transcript_no_transcript(self, mock_httpx_client):
         """Test handling when no transcript found."""
-        mock_httpx_client.reset()
         mock_httpx_client.add_response(
             method="POST",
-            url="https://api.gong.io/v2/calls/transcript",
+            url=CALLS_TRANSCRIPT_URL,
             json={"callTranscripts": []},
         )
 
@@ -420,10 +594,9 @@ class TestGongClientGetCallTranscript:
     @pytest.mark.asyncio
     async def test_get_multiple_transcripts(self, mock_httpx_client, sample_transcript_data):
         """Test getting multiple transcripts."""
-        mock_httpx_client.reset()
         mock_httpx_client.add_response(
             method="POST",
-            url="https://api.gong.io/v2/calls/transcript",
+            url=CALLS_TRANSCRIPT_URL,
             json={"callTranscripts": [sample_transcript_data, sample_transcript_data]},
         )
 
@@ -431,3 +604,156 @@ class TestGongClientGetCallTranscript:
             transcripts = await client.get_multiple_transcripts(["call_1", "call_2"])
 
         assert len(transcripts) == 2
+
+    @pytest.mark.asyncio
+    async def test_iter_multiple_transcripts_streams_items(self, mock_httpx_client):
+        """Test that transcripts split across body chunks are yielded whole."""
+        body = b'{"callTranscripts":[{"callId":"call_1","x":1.5},{"callId":"call_2"}]}'
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_TRANSCRIPT_URL,
+            stream=IteratorStream([body[i:i + 7] for i in range(0, len(body), 7)]),
+        )
+
+        async with GongClient() as client:
+            transcripts = [t async for t in client.iter_multiple_transcripts(["call_1", "call_2"])]
+
+        assert transcripts == [{"callId": "call_1", "x": 1.5}, {"callId": "call_2"}]
+
+    @pytest.mark.asyncio
+    async def test_get_multiple_transcripts_without_ijson(self, mock_httpx_client, monkeypatch):
+        """Test the buffered fallback when ijson is not installed."""
+        monkeypatch.setattr(gong_client, "ijson", None)
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_TRANSCRIPT_URL,
+            json={"callTranscripts": [{"callId": "call_1"}]},
+        )
+
+        async with GongClient() as client:
+            transcripts = await client.get_multiple_transcripts(["call_1"])
+
+        assert transcripts == [{"callId": "call_1"}]
+
+    @pytest.mark.asyncio
+    async def test_get_multiple_transcripts_chunked(self, mock_httpx_client):
+        """Test that call IDs are fetched in chunks and merged in order."""
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_TRANSCRIPT_URL,
+            match_json={"filter": {"callIds": ["call_1", "call_2"]}},
+            json={"callTranscripts": [{"callId": "call_1"}, {"callId": "call_2"}]},
+        )
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_TRANSCRIPT_URL,
+            match_json={"filter": {"callIds": ["call_3"]}},
+            json={"callTranscripts": [{"callId": "call_3"}]},
+        )
+
+        async with GongClient() as client:
+            transcripts = await client.get_multiple_transcripts_chunked(
+                ["call_1", "call_2", "call_3"], chunk_size=2
+            )
+
+        assert [t["callId"] for t in transcripts] == ["call_1", "call_2", "call_3"]
+
+    @pytest.mark.asyncio
+    async def test_get_multiple_transcripts_chunked_empty(self, mock_httpx_client):
+        """Test that no request is made for an empty ID list."""
+        async with GongClient() as client:
+            assert await client.get_multiple_transcripts_chunked([]) == []
+
+
+@pytest.mark.unit
+class TestGongClientRetries:
+    """Test retries of rate-limited and failing Gong API requests."""
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """Record backoff delays instead of sleeping."""
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(gong_client.asyncio, "sleep", fake_sleep)
+        return delays
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limit_with_retry_after(self, mock_httpx_client, sleeps):
+        """Test that a 429 waits for Retry-After and then succeeds."""
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_EXTENSIVE_URL,
+            status_code=429,
+            headers={"Retry-After": "3"},
+        )
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_EXTENSIVE_URL,
+            json={"calls": [], "records": {}},
+        )
+
+        async with GongClient() as client:
+            result = await client.search_calls(
+                from_date="2024-01-01T00:00:00Z",
+                to_date="2024-01-31T23:59:59Z",
+            )
+
+        assert result["calls"] == []
+        assert sleeps == [3.0]
+
+    @pytest.mark.asyncio
+    async def test_server_errors_exhaust_retries(self, mock_httpx_client, sleeps):
+        """Test exponential backoff on 5xx and raising once retries run out."""
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_EXTENSIVE_URL,
+            status_code=503,
+            is_reusable=True,
+        )
+
+        async with GongClient() as client:
+            with pytest.raises(HTTPStatusError):
+                await client._post(
+                    CALLS_EXTENSIVE_URL, {}, max_retries=3
+                )
+
+        assert len(mock_httpx_client.get_requests()) == 4
+        assert [int(delay) for delay in sleeps] == [1, 2, 4]
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self, mock_httpx_client, sleeps):
+        """Test that a 4xx other than 429 fails immediately."""
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_EXTENSIVE_URL,
+            status_code=400,
+        )
+
+        async with GongClient() as client:
+            with pytest.raises(HTTPStatusError):
+                await client._post(CALLS_EXTENSIVE_URL, {})
+
+        assert sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_streamed_transcripts_are_retried(self, mock_httpx_client, sleeps):
+        """Test that streaming transcript requests retry before reading."""
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_TRANSCRIPT_URL,
+            status_code=502,
+        )
+        mock_httpx_client.add_response(
+            method="POST",
+            url=CALLS_TRANSCRIPT_URL,
+            json={"callTranscripts": [{"callId": "call_1"}]},
+        )
+
+        async with GongClient() as client:
+            transcripts = await client.get_multiple_transcripts(["call_1"])
+
+        assert transcripts == [{"callId": "call_1"}]
+        assert len(sleeps) == 1
@@ -1,18 +1,31 @@
 """Unit tests for job management."""
 
+import asyncio
 import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
+from gong_mcp.analysis import jobs
 from gong_mcp.analysis.jobs import (
+    a_complete_job,
+    a_load_job_status,
+    a_update_job_progress,
     complete_job,
     create_job,
     fail_job,
+    flush_job_statuses,
     generate_job_id,
     get_job_results,
     get_jobs_dir,
+    is_job_running,
+    list_jobs,
     load_job_status,
+    run_job_in_background,
     update_job_progress,
 )
 
@@ -55,6 +68,15 @@ class TestJobDirectory:
         jobs_dir = get_jobs_dir()
         assert jobs_dir == custom_dir
 
+    def test_get_jobs_dir_is_cached(self, temp_jobs_dir, monkeypatch):
+        """Test that the directory is resolved once until the cache is cleared."""
+        first = get_jobs_dir()
+        monkeypatch.setenv("GONG_MCP_JOBS_DIR", str(temp_jobs_dir / "other"))
+        assert get_jobs_dir() == first
+
+        get_jobs_dir.cache_clear()
+        assert get_jobs_dir() == temp_jobs_dir / "other"
+
 
 @pytest.mark.unit
 class TestCreateJob:
@@ -96,6 +118,28 @@ class TestCreateJob:
         assert status["progress_percent"] == 0
         assert "created_at" in status
 
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+    def test_create_job_file_uses_umask_mode(self, temp_jobs_dir):
+        """Test that atomically written job files keep the default umask mode."""
+        create_job("job_mode", call_count=1, estimated_batches=1, estimated_minutes=1, prompt="p")
+
+        mode = (temp_jobs_dir / "job_mode.json").stat().st_mode & 0o777
+        assert mode == 0o666 & ~jobs._UMASK
+
+    def test_failed_write_leaves_no_temp_file(self, temp_jobs_dir, monkeypatch):
+        """Test that a write that fails midway removes its temp file."""
+        def broken_dumps(data, indent=False):
+            raise TypeError("not serializable")
+
+        monkeypatch.setattr(jobs, "dumps_bytes", broken_dumps)
+
+        with pytest.raises(TypeError):
+            create_job(
+                "job_bad", call_count=1, estimated_batches=1, estimated_minutes=1, prompt="p"
+            )
+
+        assert list(temp_jobs_dir.iterdir()) == []
+
 
 @pytest.mark.unit
 class TestLoadJobStatus:
@@ -121,6 +165,49 @@ class TestLoadJobStatus:
         status = load_job_status("nonexistent_job")
         assert status is None
 
+    def test_load_job_status_cached_until_file_changes(self, temp_jobs_dir, monkeypatch):
+        """Test that the cached status is reused until the file's mtime changes."""
+        job_id = "job_mtime"
+        create_job(job_id, call_count=5, estimated_batches=1, estimated_minutes=1, prompt="Test")
+        reads = 0
+        real_loads = jobs.loads
+
+        def counting_loads(data):
+            nonlocal reads
+            reads += 1
+            return real_loads(data)
+
+        monkeypatch.setattr(jobs, "loads", counting_loads)
+        first = load_job_status(job_id)
+        assert load_job_status(job_id) == first
+        assert reads == 0
+
+        # Simulate another process rewriting the file
+        job_file = temp_jobs_dir / f"{job_id}.json"
+        job_file.write_text(json.dumps({**first, "message": "external"}))
+        os.utime(job_file, ns=(1_000_000_000, 1_000_000_000))
+
+        reloaded = load_job_status(job_id)
+        assert reads == 1
+        assert reloaded["message"] == "external"
+
+    def test_load_job_status_returns_copy(self, temp_jobs_dir):
+        """Test that mutating a loaded status does not change the stored one."""
+        job_id = "job_copy"
+        create_job(job_id, call_count=5, estimated_batches=1, estimated_minutes=1, prompt="Test")
+
+        load_job_status(job_id)["status"] = "tampered"
+
+        assert load_job_status(job_id)["status"] == "pending"
+
+    def test_load_job_status_file_removed(self, temp_jobs_dir):
+        """Test that a deleted status file is not served from the cache."""
+        job_id = "job_removed"
+        create_job(job_id, call_count=5, estimated_batches=1, estimated_minutes=1, prompt="Test")
+        (temp_jobs_dir / f"{job_id}.json").unlink()
+
+        assert load_job_status(job_id) is None
+
 
 @pytest.mark.unit
 class TestUpdateJobProgress:
@@ -172,6 +259,67 @@ class TestUpdateJobProgress:
         status = load_job_status(job_id)
         assert status["progress_percent"] == 100
 
+    def test_update_job_progress_coalesces_writes(self, temp_jobs_dir):
+        """Test that rapid progress updates are served from memory, not rewritten."""
+        job_id = generate_job_id()
+        create_job(
+            job_id=job_id,
+            call_count=10,
+            estimated_batches=4,
+            estimated_minutes=5,
+            prompt="Test",
+        )
+
+        update_job_progress(job_id=job_id, current_batch=1, total_batches=4)
+
+        # Within the flush interval the file still holds the initial status
+        with open(temp_jobs_dir / f"{job_id}.json") as f:
+            assert json.load(f)["status"] == "pending"
+        assert load_job_status(job_id)["current_batch"] == 1
+
+        # Terminal states are always written through
+        fail_job(job_id, "boom")
+        with open(temp_jobs_dir / f"{job_id}.json") as f:
+            on_disk = json.load(f)
+        assert on_disk["status"] == "error"
+        assert on_disk["current_batch"] == 1
+
+    def test_coalesced_update_flushed_by_timer(self, temp_jobs_dir, monkeypatch):
+        """Test that a coalesced update reaches disk without a later save."""
+        monkeypatch.setattr(jobs, "STATUS_FLUSH_INTERVAL", 0.05)
+        job_id = "job_timer"
+        create_job(job_id, call_count=1, estimated_batches=4, estimated_minutes=1, prompt="p")
+        update_job_progress(job_id=job_id, current_batch=1, total_batches=4)
+
+        job_file = temp_jobs_dir / f"{job_id}.json"
+        deadline = time.monotonic() + 2
+        while json.loads(job_file.read_text())["status"] != "running":
+            assert time.monotonic() < deadline, "coalesced status was never flushed"
+            time.sleep(0.01)
+
+    def test_flush_job_statuses_writes_pending_updates(self, temp_jobs_dir):
+        """Test that an explicit flush (as at shutdown) writes coalesced updates."""
+        job_id = "job_flush"
+        create_job(job_id, call_count=1, estimated_batches=4, estimated_minutes=1, prompt="p")
+        update_job_progress(job_id=job_id, current_batch=2, total_batches=4)
+
+        flush_job_statuses()
+
+        on_disk = json.loads((temp_jobs_dir / f"{job_id}.json").read_text())
+        assert on_disk["current_batch"] == 2
+
+    def test_concurrent_updates_are_not_lost(self, temp_jobs_dir):
+        """Test that updates from worker threads all land in the status."""
+        job_id = "job_threads"
+        create_job(job_id, call_count=1, estimated_batches=1, estimated_minutes=1, prompt="p")
+        store = jobs._default_store
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: store.update(job_id, {f"k{i}": i}), range(200)))
+
+        status = load_job_status(job_id)
+        assert all(status[f"k{i}"] == i for i in range(200))
+
 
 @pytest.mark.unit
 class TestCompleteJob:
@@ -233,6 +381,56 @@ class TestCompleteJob:
         assert saved_results["job_id"] == job_id
         assert len(saved_results["batch_results"]) == 1
 
+    def test_complete_job_results_compact_by_default(self, temp_jobs_dir, monkeypatch):
+        """Test results are written compactly and leave no temp files behind."""
+        monkeypatch.delenv("GONG_MCP_DEBUG", raising=False)
+        create_job(
+            "job_compact", call_count=1, estimated_batches=1, estimated_minutes=1, prompt="Test"
+        )
+        complete_job("job_compact", {"job_id": "job_compact", "batch_results": []})
+
+        content = (temp_jobs_dir / "job_compact_results.json").read_text()
+        assert "\n" not in content
+        assert not list(temp_jobs_dir.glob("*.tmp"))
+
+    def test_complete_job_results_pretty_in_debug(self, temp_jobs_dir, monkeypatch):
+        """Test results are pretty-printed when GONG_MCP_DEBUG is set."""
+        monkeypatch.setenv("GONG_MCP_DEBUG", "1")
+        create_job(
+            "job_pretty", call_count=1, estimated_batches=1, estimated_minutes=1, prompt="Test"
+        )
+        complete_job("job_pretty", {"job_id": "job_pretty", "batch_results": []})
+
+        content = (temp_jobs_dir / "job_pretty_results.json").read_text()
+        assert "\n  " in content
+        assert json.loads(content)["job_id"] == "job_pretty"
+
+
+@pytest.mark.unit
+class TestAsyncJobHelpers:
+    """Test the async (thread-offloaded) job helpers."""
+
+    @pytest.mark.asyncio
+    async def test_async_helpers_round_trip(self, temp_jobs_dir):
+        """Test that async helpers update and read the same job state."""
+        job_id = generate_job_id()
+        create_job(
+            job_id=job_id,
+            call_count=4,
+            estimated_batches=2,
+            estimated_minutes=2,
+            prompt="Test",
+        )
+
+        await a_update_job_progress(job_id, current_batch=1, total_batches=2)
+        status = await a_load_job_status(job_id)
+        assert status["status"] == "running"
+        assert status["progress_percent"] == 50
+
+        await a_complete_job(job_id, {"job_id": job_id, "batch_results": []}, total_cost=0.02)
+        assert get_job_results(job_id)["job_id"] == job_id
+        assert (await a_load_job_status(job_id))["status"] == "complete"
+
 
 @pytest.mark.unit
 class TestFailJob:
@@ -292,3 +490,163 @@ class TestGetJobResults:
         """Test getting non-existent job results."""
         results = get_job_results("nonexistent_job")
         assert results is None
+
+
+@pytest.mark.unit
+class TestListJobs:
+    """Test listing jobs."""
+
+    def test_list_jobs_most_recent_first(self, temp_jobs_dir):
+        """Test that jobs are ordered by modification time and results files skipped."""
+        for i, job_id in enumerate(["job_a", "job_b", "job_c"]):
+            create_job(
+                job_id=job_id,
+                call_count=1,
+                estimated_batches=1,
+                estimated_minutes=1,
+                prompt="Test",
+            )
+            os.utime(temp_jobs_dir / f"{job_id}.json", (1_000_000 + i, 1_000_000 + i))
+        complete_job("job_a", {"job_id": "job_a", "batch_results": []})
+        os.utime(temp_jobs_dir / "job_a.json", (999_999, 999_999))
+
+        jobs = list_jobs()
+        assert [job["job_id"] for job in jobs] == ["job_c", "job_b", "job_a"]
+
+    def test_list_jobs_shows_unflushed_progress(self, temp_jobs_dir):
+        """Test that listings include progress still coalesced in memory."""
+        create_job("job_a", call_count=1, estimated_batches=4, estimated_minutes=1, prompt="p")
+        create_job("job_b", call_count=1, estimated_batches=4, estimated_minutes=1, prompt="p")
+        update_job_progress(job_id="job_a", current_batch=3, total_batches=4)
+
+        listed = list_jobs()
+
+        assert listed[0]["job_id"] == "job_a"
+        assert listed[0]["current_batch"] == 3
+
+    def test_list_jobs_respects_limit(self, temp_jobs_dir):
+        """Test that limit caps the number of jobs returned."""
+        for job_id in ["job_a", "job_b", "job_c"]:
+            create_job(
+                job_id=job_id,
+                call_count=1,
+                estimated_batches=1,
+                estimated_minutes=1,
+                prompt="Test",
+            )
+
+        assert len(list_jobs(limit=2)) == 2
+
+    def test_list_jobs_empty(self, temp_jobs_dir):
+        """Test listing an empty jobs directory."""
+        assert list_jobs() == []
+
+
+@pytest.mark.unit
+class TestInMemoryJobStore:
+    """Test the in-memory job store used in place of the file store."""
+
+    def test_job_lifecycle(self, in_memory_jobs, temp_jobs_dir):
+        """Test that job functions go through the store without touching disk."""
+        job_id = "job_memory"
+        create_job(
+            job_id=job_id,
+            call_count=4,
+            estimated_batches=2,
+            estimated_minutes=1,
+            prompt="Test",
+        )
+        update_job_progress(job_id, current_batch=1, total_batches=2)
+        assert load_job_status(job_id)["progress_percent"] == 50
+
+        complete_job(job_id, {"job_id": job_id, "batch_results": []}, total_cost=0.5)
+
+        assert load_job_status(job_id)["status"] == "complete"
+        assert get_job_results(job_id) == {"job_id": job_id, "batch_results": []}
+        assert in_memory_jobs.get(job_id)["total_cost"] == 0.5
+        assert list(temp_jobs_dir.iterdir()) == []
+
+    def test_missing_job(self, in_memory_jobs):
+        """Test that updates to unknown jobs are ignored."""
+        update_job_progress("job_missing", current_batch=1, total_batches=2)
+        fail_job("job_missing", "boom")
+
+        assert load_job_status("job_missing") is None
+        assert get_job_results("job_missing") is None
+
+    def test_list_jobs_most_recently_updated_first(self, in_memory_jobs):
+        """Test that list_jobs orders by last update and respects limit."""
+        for job_id in ["job_a", "job_b", "job_c"]:
+            create_job(
+                job_id=job_id,
+                call_count=1,
+                estimated_batches=1,
+                estimated_minutes=1,
+                prompt="Test",
+            )
+        fail_job("job_a", "boom")
+
+        assert [job["job_id"] for job in list_jobs()] == ["job_a", "job_c", "job_b"]
+        assert len(list_jobs(limit=1)) == 1
+
+
+@pytest.mark.unit
+class TestRunJobInBackground:
+    """Test background job registry."""
+
+    async def test_background_job_unregisters_on_completion(self, temp_jobs_dir):
+        """Test that finished jobs are removed from the registry."""
+        async def work():
+            return {"ok": True}
+
+        run_job_in_background("job_bg", work())
+        assert is_job_running("job_bg")
+
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert not is_job_running("job_bg")
+
+    async def test_background_job_failure_marks_job_failed(
+        self, temp_jobs_dir, wait_for_background_jobs, caplog
+    ):
+        """Test that an exception in the job coroutine is logged and recorded."""
+        create_job(
+            job_id="job_bg_fail",
+            call_count=1,
+            estimated_batches=1,
+            estimated_minutes=1,
+            prompt="Test",
+        )
+
+        async def work():
+            raise RuntimeError("boom")
+
+        with caplog.at_level(logging.ERROR, logger=jobs.__name__):
+            run_job_in_background("job_bg_fail", work())
+            await wait_for_background_jobs()
+
+        assert not is_job_running("job_bg_fail")
+        status = load_job_status("job_bg_fail")
+        assert status["status"] == "error"
+        assert status["error"] == "boom"
+        assert "Background job job_bg_fail failed" in caplog.text
+
+    async def test_background_job_failure_write_error_is_logged(
+        self, temp_jobs_dir, wait_for_background_jobs, caplog, monkeypatch
+    ):
+        """Test that a failure that cannot be persisted is logged, not swallowed."""
+        def broken_fail_job(job_id, error):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(jobs, "fail_job", broken_fail_job)
+
+        async def work():
+            raise RuntimeError("boom")
+
+        with caplog.at_level(logging.ERROR, logger=jobs.__name__):
+            run_job_in_background("job_bg_unsaved", work())
+            await wait_for_background_jobs()
+
+        assert not is_job_running("job_bg_unsaved")
+        assert "Could not record failure of job job_bg_unsaved" in caplog.text
+        assert "disk full" in caplog.text
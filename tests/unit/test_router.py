@@ -8,6 +8,7 @@ from gong_mcp.analysis.router import (
     estimate_batch_count,
     estimate_processing_time,
     estimate_tokens,
+    estimate_tokens_from_bytes,
     estimate_transcripts_tokens,
     get_direct_threshold,
     get_routing_decision,
@@ -39,6 +40,12 @@ class TestEstimateTokens:
         unicode_text = "你好世界"  # 4 characters
         assert estimate_tokens(unicode_text) == 1
 
+    def test_estimate_tokens_from_bytes(self):
+        """Test token estimation from a precomputed size."""
+        assert estimate_tokens_from_bytes(1000) == 250
+        assert estimate_tokens_from_bytes(3) == 0
+        assert estimate_tokens_from_bytes(len("hello world")) == estimate_tokens("hello world")
+
 
 @pytest.mark.unit
 class TestEstimateTranscriptsTokens:
@@ -70,6 +77,17 @@ class TestEstimateTranscriptsTokens:
         tokens = estimate_transcripts_tokens(transcripts)
         assert tokens > 1000  # Should be substantial
 
+    def test_estimate_transcripts_tokens_matches_exact(
+        self, sample_call_data, sample_transcript_data
+    ):
+        """Test that the object-walking estimate stays close to the encoded size."""
+        transcripts = [
+            sample_call_data, sample_transcript_data, {"text": "x" * 10000, "flag": True}
+        ]
+        estimated = estimate_transcripts_tokens(transcripts)
+        exact = estimate_transcripts_tokens(transcripts, exact=True)
+        assert abs(estimated - exact) <= exact * 0.05
+
 
 @pytest.mark.unit
 class TestGetDirectThreshold:
@@ -111,6 +129,17 @@ class TestGetDirectThreshold:
         threshold = get_direct_threshold()
         assert threshold == 1000
 
+    def test_get_direct_threshold_is_cached(self, monkeypatch):
+        """Test that the env is read once until the cache is cleared."""
+        monkeypatch.setenv("DIRECT_LLM_TOKEN_LIMIT", "10")
+        assert get_direct_threshold() == 10_000
+
+        monkeypatch.setenv("DIRECT_LLM_TOKEN_LIMIT", "20")
+        assert get_direct_threshold() == 10_000
+
+        get_direct_threshold.cache_clear()
+        assert get_direct_threshold() == 20_000
+
 
 @pytest.mark.unit
 class TestShouldUseDirectMode:
@@ -229,6 +258,27 @@ class TestGetRoutingDecision:
         assert "threshold" in decision
         assert "reason" in decision
 
+    def test_get_routing_decision_returns_sized_transcripts(self, monkeypatch):
+        """Test that the decision carries per-transcript sizes for batching."""
+        monkeypatch.setenv("DIRECT_LLM_TOKEN_LIMIT", "150")  # 150K
+        transcripts = [{"text": "a" * 10}, {"text": "b" * 20}]
+        decision = get_routing_decision(transcripts)
+
+        sized = decision["sized_transcripts"]
+        assert [t for t, _ in sized] == transcripts
+        assert sized[1][1] > sized[0][1]
+
+    def test_get_routing_decision_uses_precomputed_sizes(self, monkeypatch):
+        """Test that precomputed sizes are used instead of re-measuring."""
+        monkeypatch.setenv("DIRECT_LLM_TOKEN_LIMIT", "150")  # 150K
+        transcripts = [{"text": "tiny"}]
+        sized = [(transcripts[0], 800_000)]
+        decision = get_routing_decision(transcripts, sized_transcripts=sized)
+
+        assert decision["mode"] == "async"
+        assert decision["total_tokens"] == estimate_tokens_from_bytes(2 + 800_001)
+        assert decision["sized_transcripts"] is sized
+
     def test_get_routing_decision_async_mode(self, monkeypatch):
         """Test routing decision for async mode."""
         monkeypatch.setenv("DIRECT_LLM_TOKEN_LIMIT", "150")  # 150K
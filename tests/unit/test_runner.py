@@ -0,0 +1,188 @@
+"""Unit tests for analysis runner."""
+
+import asyncio
+import time
+
+import pytest
+
+from gong_mcp.analysis import runner
+from gong_mcp.analysis.jobs import create_job, load_job_status
+from gong_mcp.analysis.runner import (
+    DEFAULT_MAX_CONCURRENT_BATCHES,
+    DEFAULT_RATE_LIMIT_RPM,
+    RAISED_RATE_MAX_CONCURRENT_BATCHES,
+    RateLimiter,
+    build_request_body,
+    create_batches,
+    create_batches_raw,
+    get_max_concurrent_batches,
+    get_rate_limit_rpm,
+    run_analysis,
+)
+from gong_mcp.utils.serialization import dumps_bytes, loads
+from gong_mcp.utils.sizing import annotate_sizes
+
+
+@pytest.mark.unit
+class TestRunnerConfig:
+    """Test rate limit and concurrency configuration."""
+
+    def test_rate_limit_rpm_default(self, monkeypatch):
+        """Test default RPM matches the legacy per-batch delay."""
+        monkeypatch.delenv("RATE_LIMIT_RPM", raising=False)
+        assert get_rate_limit_rpm() == DEFAULT_RATE_LIMIT_RPM
+
+    def test_rate_limit_rpm_invalid_env(self, monkeypatch):
+        """Test invalid RPM falls back to default."""
+        monkeypatch.setenv("RATE_LIMIT_RPM", "fast")
+        assert get_rate_limit_rpm() == DEFAULT_RATE_LIMIT_RPM
+
+    def test_max_concurrent_batches_minimum(self, monkeypatch):
+        """Test concurrency is clamped to at least one."""
+        monkeypatch.setenv("ANALYSIS_MAX_CONCURRENCY", "0")
+        assert get_max_concurrent_batches() == 1
+
+    def test_max_concurrent_batches_serial_at_default_rate(self, monkeypatch):
+        """Test batches do not overlap at the default Tier 1 rate."""
+        monkeypatch.delenv("ANALYSIS_MAX_CONCURRENCY", raising=False)
+        monkeypatch.delenv("RATE_LIMIT_RPM", raising=False)
+        assert get_max_concurrent_batches() == DEFAULT_MAX_CONCURRENT_BATCHES == 1
+
+    @pytest.mark.parametrize("rpm", ["0", "10"])
+    def test_max_concurrent_batches_raised_rate(self, monkeypatch, rpm):
+        """Test batches overlap once the rate limit is raised or disabled."""
+        monkeypatch.delenv("ANALYSIS_MAX_CONCURRENCY", raising=False)
+        monkeypatch.setenv("RATE_LIMIT_RPM", rpm)
+        assert get_max_concurrent_batches() == RAISED_RATE_MAX_CONCURRENT_BATCHES
+
+
+@pytest.mark.unit
+class TestCreateBatches:
+    """Test create_batches and create_batches_raw functions."""
+
+    def test_create_batches_respects_batch_size(self):
+        """Test that batches never exceed the call limit."""
+        sized = [({"call_id": str(i)}, 100) for i in range(5)]
+        batches = create_batches(sized, batch_size=2)
+        assert [len(b) for b in batches] == [2, 2, 1]
+
+    def test_create_batches_respects_token_limit(self):
+        """Test that precomputed sizes drive the token split."""
+        # safe limit is 24000 * 0.9 - 3500 = 18100 tokens
+        sized = [({"call_id": str(i)}, 40_000) for i in range(3)]  # 10K tokens each
+        batches = create_batches(sized, batch_size=20, max_tokens_per_batch=24_000)
+        assert [len(b) for b in batches] == [1, 1, 1]
+
+    def test_create_batches_raw_matches_annotated(self):
+        """Test the raw adapter batches the same as pre-annotated input."""
+        transcripts = [{"call_id": str(i), "text": "x" * 20_000} for i in range(6)]
+        assert create_batches_raw(transcripts) == create_batches(annotate_sizes(transcripts))
+
+
+@pytest.mark.unit
+class TestRateLimiter:
+    """Test RateLimiter spacing."""
+
+    async def test_first_acquire_is_immediate(self):
+        """Test the first permit is granted without waiting."""
+        limiter = RateLimiter(rpm=60)
+        start = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - start < 0.5
+
+    async def test_acquires_are_spaced(self):
+        """Test consecutive permits are spaced by the interval."""
+        limiter = RateLimiter(rpm=60 / 0.05)  # 50ms interval
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire()
+        assert time.monotonic() - start >= 0.1
+
+
+@pytest.mark.unit
+class TestRunAnalysis:
+    """Test concurrent batch processing."""
+
+    async def test_results_preserve_batch_order(self, monkeypatch):
+        """Test results are ordered by batch even when batches finish out of order."""
+        monkeypatch.setenv("RATE_LIMIT_RPM", "0")
+        monkeypatch.setenv("ANALYSIS_MAX_CONCURRENCY", "4")
+        monkeypatch.setattr(
+            runner, "create_batches", lambda sized: [[t] for t, _ in sized]
+        )
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_call(batch, prompt, batch_num, total_batches, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Later batches finish first
+            await asyncio.sleep(0.01 * (total_batches - batch_num))
+            in_flight -= 1
+            return f"result {batch_num}", {"cost": 0.5, "calls_count": len(batch)}
+
+        monkeypatch.setattr(runner, "call_claude_api", fake_call)
+
+        job_id = "job_test_concurrent"
+        create_job(job_id, call_count=4, estimated_batches=4, estimated_minutes=1, prompt="p")
+        transcripts = [{"call_id": str(i), "transcript": []} for i in range(4)]
+        results = await run_analysis(job_id, annotate_sizes(transcripts), "p")
+
+        assert [r["batch_num"] for r in results["batch_results"]] == [1, 2, 3, 4]
+        assert results["total_cost"] == 2.0
+        assert max_in_flight > 1
+        status = load_job_status(job_id)
+        assert status["status"] == "complete"
+        assert status["current_batch"] == 4
+
+    async def test_batches_are_pre_encoded(self, monkeypatch):
+        """Test that each request body is built before the API call and passed through."""
+        monkeypatch.setenv("RATE_LIMIT_RPM", "0")
+        received = []
+
+        async def fake_call(batch, prompt, batch_num, total_batches, **kwargs):
+            received.append((batch, kwargs.get("body")))
+            return "ok", {"cost": 0.0, "calls_count": len(batch)}
+
+        monkeypatch.setattr(runner, "call_claude_api", fake_call)
+
+        job_id = "job_test_encoded"
+        create_job(job_id, call_count=2, estimated_batches=1, estimated_minutes=1, prompt="p")
+        transcripts = [{"call_id": str(i), "transcript": []} for i in range(2)]
+        await run_analysis(job_id, annotate_sizes(transcripts), "p")
+
+        assert received == [(transcripts, build_request_body(transcripts, "p"))]
+
+
+@pytest.mark.unit
+class TestSharedClient:
+    """Test the pooled Anthropic client."""
+
+    async def test_client_is_reused(self):
+        """Test that repeated lookups return the same pooled client."""
+        client = runner._get_client()
+        assert runner._get_client() is client
+        await runner.close_client()
+
+    async def test_close_client_resets(self):
+        """Test that closing drops the client so a fresh one is created."""
+        client = runner._get_client()
+        await runner.close_client()
+        assert client.is_closed
+        assert runner._get_client() is not client
+        await runner.close_client()
+
+
+@pytest.mark.unit
+class TestBuildRequestBody:
+    """Test request body encoding."""
+
+    def test_body_embeds_compact_batch(self):
+        """Test that the prompt carries the compactly encoded batch."""
+        batch = [{"call_id": "1", "text": "hello"}]
+        body = loads(build_request_body(batch, "Summarize"))
+        content = body["messages"][0]["content"]
+        assert content.startswith("Summarize\n\nTranscripts to analyze:\n")
+        assert content.endswith(dumps_bytes(batch).decode("utf-8"))
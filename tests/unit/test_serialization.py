@@ -0,0 +1,67 @@
+"""Unit tests for serialization helpers."""
+
+import json
+
+import pytest
+
+from gong_mcp.utils.serialization import dumps, dumps_bytes, loads
+
+
+@pytest.mark.unit
+class TestDumpsBytes:
+    """Test dumps_bytes function."""
+
+    def test_dumps_bytes_returns_bytes(self):
+        """Test that output is bytes that round-trip through json."""
+        data = {"call_id": "123", "sentences": [{"start": 0, "text": "hello"}]}
+        encoded = dumps_bytes(data)
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == data
+
+    def test_dumps_bytes_is_compact(self):
+        """Test that output has no insignificant whitespace."""
+        assert dumps_bytes({"a": [1, 2]}) == b'{"a":[1,2]}'
+
+    def test_dumps_bytes_keeps_unicode(self):
+        """Test that non-ASCII text is emitted as UTF-8, not escaped."""
+        encoded = dumps_bytes({"text": "你好"})
+        assert "你好".encode("utf-8") in encoded
+
+    def test_dumps_bytes_indent(self):
+        """Test that indent pretty-prints with two spaces."""
+        encoded = dumps_bytes({"a": [1, 2]}, indent=True)
+        assert b'\n  "a"' in encoded
+        assert json.loads(encoded) == {"a": [1, 2]}
+
+
+    def test_dumps_bytes_non_str_keys(self):
+        """Test that non-string keys are stringified like the stdlib encoder."""
+        assert json.loads(dumps_bytes({1: "a"})) == {"1": "a"}
+
+
+@pytest.mark.unit
+class TestDumps:
+    """Test dumps function."""
+
+    def test_dumps_returns_str(self):
+        """Test that output is a compact str by default."""
+        assert dumps({"a": [1, 2]}) == '{"a":[1,2]}'
+
+    def test_dumps_indent_matches_stdlib(self):
+        """Test that indented output matches json.dumps(indent=2)."""
+        data = {"job_id": "job_1", "batch_results": [{"batch_num": 1}]}
+        assert dumps(data, indent=True) == json.dumps(data, indent=2)
+
+
+@pytest.mark.unit
+class TestLoads:
+    """Test loads function."""
+
+    def test_loads_bytes(self):
+        """Test decoding from bytes."""
+        assert loads(b'{"a":[1,2]}') == {"a": [1, 2]}
+
+    def test_loads_str(self):
+        """Test decoding from a string."""
+        assert loads('{"text":"你好"}') == {"text": "你好"}
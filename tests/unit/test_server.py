@@ -0,0 +1,93 @@
+"""Unit tests for the MCP tool handler."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from gong_mcp import server
+
+
+@pytest.mark.unit
+class TestHandleCallTool:
+    """Test handle_call_tool dispatch and output encoding."""
+
+    async def test_unknown_tool(self):
+        """Test that an unknown tool name returns an error payload."""
+        content = await server.handle_call_tool("nope", {})
+        assert json.loads(content[0].text) == {"error": "Unknown tool: nope"}
+
+    async def test_tool_exception_is_reported(self):
+        """Test that exceptions raised by a tool are returned as errors."""
+        content = await server.handle_call_tool("get_job_status", {})
+        result = json.loads(content[0].text)
+        assert result["tool"] == "get_job_status"
+        assert "job_id" in result["error"]
+
+    async def test_result_is_pretty_printed(self, temp_jobs_dir):
+        """Test that results are rendered as indented JSON text."""
+        content = await server.handle_call_tool("get_job_status", {"job_id": "job_missing"})
+        assert content[0].type == "text"
+        assert content[0].text.startswith("{\n  ")
+        assert json.loads(content[0].text)["job_id"] == "job_missing"
+
+    def test_dispatch_covers_declared_tools(self):
+        """Test that every declared tool has a dispatch entry."""
+        assert {tool.name for tool in server.TOOLS} == set(server.TOOL_DISPATCH)
+
+    async def test_optional_arguments_use_defaults(self, monkeypatch):
+        """Test that omitted optional arguments fall back to their defaults."""
+        received = {}
+
+        async def fake_list_calls(**kwargs):
+            received.update(kwargs)
+            return {"calls": []}
+
+        monkeypatch.setitem(server._handlers, "list_calls", fake_list_calls)
+        await server.handle_call_tool("list_calls", {"from_date": "2024-01-01"})
+
+        assert received == {"from_date": "2024-01-01", "to_date": None, "limit": 50}
+
+    def test_handlers_resolve_to_tool_functions(self):
+        """Test that each tool name resolves to the same-named tool function."""
+        for name in server.TOOL_DISPATCH:
+            handler = server._get_handler(name)
+            assert handler.__name__ == name
+
+    def test_import_does_not_load_tool_modules(self):
+        """Test that importing the server defers loading the tool modules."""
+        code = (
+            "import sys, gong_mcp.server; "
+            "print(any(m.startswith('gong_mcp.tools') or m == 'gong_mcp.analysis.runner' "
+            "for m in sys.modules))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert output.strip() == "False"
+
+    async def test_direct_analysis_is_split_per_transcript(self, monkeypatch):
+        """Test that direct-mode transcripts are emitted as separate blocks."""
+        transcripts = [{"metadata": {"call_id": "call_1"}}, {"metadata": {"call_id": "call_2"}}]
+
+        async def fake_analyze_calls(**kwargs):
+            return {"mode": "direct", "transcripts": transcripts, "call_count": 2}
+
+        monkeypatch.setitem(server._handlers, "analyze_calls", fake_analyze_calls)
+        content = await server.handle_call_tool("analyze_calls", {})
+
+        header = json.loads(content[0].text)
+        assert header == {"mode": "direct", "call_count": 2, "transcript_blocks": 2}
+        assert [json.loads(block.text) for block in content[1:]] == transcripts
+
+    async def test_async_analysis_is_single_block(self, monkeypatch):
+        """Test that non-direct analyze_calls results stay in one block."""
+        async def fake_analyze_calls(**kwargs):
+            return {"mode": "async", "job_id": "job_1"}
+
+        monkeypatch.setitem(server._handlers, "analyze_calls", fake_analyze_calls)
+        content = await server.handle_call_tool("analyze_calls", {})
+
+        assert len(content) == 1
+        assert json.loads(content[0].text)["job_id"] == "job_1"
@@ -0,0 +1,47 @@
+"""Unit tests for transcript size estimation."""
+
+import json
+
+import pytest
+
+from gong_mcp.utils.sizing import annotate_sizes, estimate_size, total_size
+
+
+@pytest.mark.unit
+class TestEstimateSize:
+    """Test estimate_size function."""
+
+    def test_estimate_size_string(self):
+        """Test string size includes quotes."""
+        assert estimate_size("abc") == len(json.dumps("abc"))
+
+    def test_estimate_size_close_to_json(self):
+        """Test estimate stays close to the real encoding for transcript-like data."""
+        obj = {
+            "call_id": "123",
+            "transcript": [{"speaker": "Alice", "text": "hello there " * 20}] * 10,
+        }
+        actual = len(json.dumps(obj, separators=(",", ":")))
+        assert abs(estimate_size(obj) - actual) / actual < 0.05
+
+
+@pytest.mark.unit
+class TestAnnotateSizes:
+    """Test annotate_sizes and total_size functions."""
+
+    def test_annotate_sizes_preserves_order(self):
+        """Test each transcript is paired with its own size."""
+        transcripts = [{"text": "a"}, {"text": "bbbb"}]
+        sized = annotate_sizes(transcripts)
+
+        assert [t for t, _ in sized] == transcripts
+        assert [size for _, size in sized] == [estimate_size(t) for t in transcripts]
+
+    def test_total_size_matches_list_estimate(self):
+        """Test summing annotated sizes equals sizing the whole list."""
+        transcripts = [{"text": "x" * i} for i in range(5)]
+        assert total_size(annotate_sizes(transcripts)) == estimate_size(transcripts)
+
+    def test_total_size_empty(self):
+        """Test total size of an empty list."""
+        assert total_size([]) == estimate_size([])